@@ -0,0 +1,73 @@
+"""
+Measures the time taken to import footballAPI in a fresh interpreter, and checks that the heavy dependencies only
+needed by LeagueTable and validation are not imported with it.
+
+Usage: python benchmarks/bench_import.py [--statements "import footballAPI"] [--repeat 10] [--budget 0.5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules which must not be imported by import footballAPI
+DEFERRED_MODULES = ["pandas", "numpy", "jsonschema", "pkg_resources", "prometheus_client", "pyarrow"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def import_time(statement: str) -> dict:
+    """
+    Runs a statement in a fresh interpreter.
+    :param statement: The statement to time, eg. import footballAPI
+    :return: The seconds taken and the modules imported
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        check=True, capture_output=True, text=True, env=env
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statements", nargs="+", default=[
+        "import footballAPI",
+        "from footballAPI import APIFootball",
+        "from footballAPI import LeagueTable",
+    ])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Fail if import footballAPI takes longer than this many seconds")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'statement':<40} {'median (ms)':>12} {'min (ms)':>9}  deferred modules imported")
+    for statement in args.statements:
+        runs = [import_time(statement) for _ in range(args.repeat)]
+        seconds = [run["seconds"] for run in runs]
+        imported = [module for module in DEFERRED_MODULES if module in runs[0]["modules"]]
+        print(f"{statement:<40} {statistics.median(seconds) * 1000:>12.1f} {min(seconds) * 1000:>9.1f}  "
+              f"{', '.join(imported) or '-'}")
+
+        if statement == "import footballAPI":
+            if imported:
+                failed = True
+            if args.budget is not None and statistics.median(seconds) > args.budget:
+                failed = True
+
+    if failed:
+        sys.exit("import footballAPI regressed, see above.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compares the vectorized points calculation of LeagueTable against the previous row-wise implementation on synthetic
+multi-season fixture sets.
+
+Usage: python benchmarks/bench_points.py [--seasons 1 10 50] [--repeat 5]
+"""
+import argparse
+import timeit
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from footballAPI.LeagueTable import calculate_points
+
+
+def synthetic_fixtures(seasons: int, teams: int = 20, seed: int = 0) -> pd.DataFrame:
+    """
+    Builds a double round robin of fixtures for each season with random scores.
+    :param seasons: Number of seasons
+    :param teams: Number of teams in the league
+    :param seed: Random seed
+    :return: Dataframe of fixtures
+    """
+    rng = np.random.default_rng(seed)
+    home, away = np.meshgrid(np.arange(teams), np.arange(teams))
+    mask = home != away
+    home = np.tile(home[mask], seasons)
+    away = np.tile(away[mask], seasons)
+    return pd.DataFrame({
+        "fixture_id": np.arange(len(home)),
+        "homeTeam.team_name": [f"Team {i}" for i in home],
+        "awayTeam.team_name": [f"Team {i}" for i in away],
+        "goalsHomeTeam": rng.poisson(1.5, len(home)),
+        "goalsAwayTeam": rng.poisson(1.1, len(home)),
+    })
+
+
+def determine_points(fixture_id: int, home_goals: int, away_goals: int) -> Dict[str, int]:
+    """
+    The previous points calculation of LeagueTable, for a single fixture.
+    """
+    if home_goals == away_goals:
+        return {"fixture_id": fixture_id, "home_points": 1, "away_points": 1}
+    else:
+        winner = "home_points" if home_goals > away_goals else "away_points"
+        loser = "away_points" if home_goals > away_goals else "home_points"
+        return {"fixture_id": fixture_id, winner: 3, loser: 0}
+
+
+def row_wise_points(results_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The previous row-wise points calculation of LeagueTable.
+    """
+    points_df = results_df.apply(
+        lambda row: pd.Series(determine_points(
+            fixture_id=row["fixture_id"],
+            home_goals=row["goalsHomeTeam"],
+            away_goals=row["goalsAwayTeam"]
+        )), axis=1
+    )
+    return results_df.merge(points_df, how="inner", on="fixture_id")
+
+
+def vectorized_points(results_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The vectorized points calculation used by LeagueTable.
+    """
+    home_points, away_points = calculate_points(
+        home_goals=results_df["goalsHomeTeam"].to_numpy(),
+        away_goals=results_df["goalsAwayTeam"].to_numpy()
+    )
+    return results_df.assign(home_points=home_points, away_points=away_points).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'seasons':>8} {'fixtures':>9} {'row-wise (ms)':>14} {'vectorized (ms)':>16} {'speedup':>8}")
+    for seasons in args.seasons:
+        fixtures = synthetic_fixtures(seasons)
+        expected = row_wise_points(fixtures)[["home_points", "away_points"]]
+        assert vectorized_points(fixtures)[["home_points", "away_points"]].equals(expected)
+
+        row_wise = min(timeit.repeat(lambda: row_wise_points(fixtures), number=1, repeat=args.repeat))
+        vectorized = min(timeit.repeat(lambda: vectorized_points(fixtures), number=1, repeat=args.repeat))
+        print(f"{seasons:>8} {len(fixtures):>9} {row_wise * 1000:>14.2f} {vectorized * 1000:>16.2f} "
+              f"{row_wise / vectorized:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
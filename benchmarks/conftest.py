@@ -0,0 +1,21 @@
+import logging
+
+import pytest
+
+from footballAPI import APIFootball
+from mock_server import MockAPIFootballServer
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    with MockAPIFootballServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def apifootball(mock_server):
+    logging.getLogger().setLevel(logging.WARNING)
+    with APIFootball(api_key="mock", base_url=mock_server.base_url, credit_tracking="local") as apifootball:
+        yield apifootball
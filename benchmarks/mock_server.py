@@ -0,0 +1,356 @@
+"""
+Local stand-in for the API-Football v2 server, serving synthetic or recorded payloads which match the schemas in
+footballAPI/validation_schemas, with configurable latency. Used by the benchmark suite so that no API_KEY or credits
+are needed.
+
+Usage: python benchmarks/mock_server.py [--port 8080] [--latency 0.05]
+       then APIFootball(api_key="mock", base_url="http://127.0.0.1:8080")
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Union
+
+STATISTICS = [
+    "Shots on Goal", "Shots off Goal", "Total Shots", "Blocked Shots", "Shots insidebox", "Shots outsidebox",
+    "Fouls", "Corner Kicks", "Offsides", "Ball Possession", "Yellow Cards", "Red Cards", "Goalkeeper Saves",
+    "Total passes", "Passes accurate", "Passes %",
+]
+
+
+def synthetic_leagues(leagues: int = 50, seasons: int = 10, first_season: int = 2010) -> List[Dict]:
+    """
+    Builds the leagues returned by the leagues endpoint. League ids are numbered from 1, one per league and season.
+    :param leagues: Number of leagues
+    :param seasons: Number of seasons of each league
+    :param first_season: Starting year of the first season
+    :return: The leagues
+    """
+    return [
+        {
+            "league_id": league * seasons + season + 1,
+            "name": f"League {league}",
+            "type": "League",
+            "country": f"Country {league}",
+            "country_code": None,
+            "season": first_season + season,
+            "season_start": f"{first_season + season}-08-01",
+            "season_end": f"{first_season + season + 1}-05-31",
+            "logo": None,
+            "flag": None,
+            "standings": 1,
+            "is_current": int(season == seasons - 1),
+            "coverage": {
+                "standings": True,
+                "fixtures": {"events": True, "lineups": True, "statistics": True, "players_statistics": True},
+                "players": True,
+                "topScorers": True,
+                "predictions": True,
+                "odds": False,
+            },
+        }
+        for league in range(leagues) for season in range(seasons)
+    ]
+
+
+def synthetic_fixtures(league_id: int, teams: int = 20, season: int = 2015, finished: float = 1.0) -> List[Dict]:
+    """
+    Builds a double round robin season of fixtures for a league with random scores, seeded on league_id.
+    :param league_id: The league_id of the fixtures
+    :param teams: Number of teams in the league
+    :param season: Starting year of the season
+    :param finished: Fraction of the season which has finished, later fixtures are not started
+    :return: The fixtures, ordered by date
+    """
+    rng = random.Random(league_id)
+    names = [f"Team {league_id}-{i}" for i in range(teams)]
+    rounds = []
+    rotation = list(range(teams))
+    for _ in range(teams - 1):
+        rounds.append([(rotation[i], rotation[teams - 1 - i]) for i in range(teams // 2)])
+        rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+    rounds += [[(away, home) for home, away in matchday] for matchday in rounds]
+
+    start = datetime(season, 8, 8, 15, tzinfo=timezone.utc)
+    last_finished = int(len(rounds) * finished)
+    fixtures = []
+    for number, matchday in enumerate(rounds):
+        kick_off = start + timedelta(days=7 * number)
+        for home, away in matchday:
+            played = number < last_finished
+            home_goals = min(rng.randint(0, 3) + rng.randint(0, 1), 9) if played else None
+            away_goals = rng.randint(0, 3) if played else None
+            fixtures.append({
+                "fixture_id": league_id * 1000 + len(fixtures),
+                "league_id": league_id,
+                "league": {"name": f"League {league_id}", "country": "Mockland", "logo": "", "flag": ""},
+                "event_date": kick_off.isoformat(),
+                "event_timestamp": int(kick_off.timestamp()),
+                "firstHalfStart": int(kick_off.timestamp()) if played else None,
+                "secondHalfStart": int(kick_off.timestamp()) + 3600 if played else None,
+                "round": f"Regular Season - {number + 1}",
+                "status": "Match Finished" if played else "Not Started",
+                "statusShort": "FT" if played else "NS",
+                "elapsed": 90 if played else 0,
+                "venue": f"{names[home]} Stadium",
+                "referee": None,
+                "homeTeam": {"team_id": league_id * 100 + home, "team_name": names[home], "logo": ""},
+                "awayTeam": {"team_id": league_id * 100 + away, "team_name": names[away], "logo": ""},
+                "goalsHomeTeam": home_goals,
+                "goalsAwayTeam": away_goals,
+                "score": {
+                    "halftime": None,
+                    "fulltime": f"{home_goals}-{away_goals}" if played else None,
+                    "extratime": None,
+                    "penalty": None,
+                },
+            })
+    return fixtures
+
+
+def synthetic_match(fixture_id: int) -> Dict:
+    """
+    Builds the match detail of a fixture with events, lineups, statistics and player statistics.
+    :param fixture_id: The fixture_id, whose league is fixture_id // 1000 as numbered by synthetic_fixtures
+    :return: The fixture with its match detail
+    """
+    league_id = fixture_id // 1000
+    fixtures = synthetic_fixtures(league_id)
+    fixture = dict(fixtures[(fixture_id - league_id * 1000) % len(fixtures)], fixture_id=fixture_id)
+    teams = [fixture["homeTeam"], fixture["awayTeam"]]
+    fixture["events"] = [
+        {
+            "elapsed": 10 * (i + 1),
+            "elapsed_plus": None,
+            "team_id": teams[i % 2]["team_id"],
+            "teamName": teams[i % 2]["team_name"],
+            "player_id": i,
+            "player": f"Player {i}",
+            "assist_id": None,
+            "assist": None,
+            "type": "Goal",
+            "detail": "Normal Goal",
+            "comments": None,
+        }
+        for i in range((fixture["goalsHomeTeam"] or 0) + (fixture["goalsAwayTeam"] or 0))
+    ]
+    fixture["lineups"] = {
+        team["team_name"]: {
+            "coach": "Coach",
+            "formation": "4-4-2",
+            "startXI": [{"team_id": team["team_id"], "player_id": i, "player": f"Player {i}", "number": i + 1,
+                         "pos": "M"} for i in range(11)],
+            "substitutes": [],
+        }
+        for team in teams
+    }
+    fixture["statistics"] = {name: {"home": "1", "away": "1"} for name in STATISTICS}
+    fixture["players"] = [
+        {
+            "event_id": fixture_id,
+            "updateAt": fixture["event_timestamp"],
+            "player_id": i,
+            "player_name": f"Player {i}",
+            "team_id": team["team_id"],
+            "team_name": team["team_name"],
+            "number": i + 1,
+            "position": "M",
+            "rating": "7.0",
+            "minutes_played": 90,
+            "captain": "False",
+            "substitute": "False",
+            "offsides": None,
+            "shots": {"total": 1, "on": 0},
+            "goals": {"total": 0, "conceded": 0, "assists": 0},
+            "passes": {"total": 40, "key": 1, "accuracy": 85},
+            "tackles": {"total": 2, "blocks": 0, "interceptions": 1},
+            "duels": {"total": 8, "won": 4},
+            "dribbles": {"attempts": 1, "success": 1, "past": 0},
+            "fouls": {"drawn": 1, "committed": 1},
+            "cards": {"yellow": 0, "red": 0},
+            "penalty": {"won": 0, "commited": 0, "success": 0, "missed": 0, "saved": 0},
+        }
+        for team in teams for i in range(11)
+    ]
+    return fixture
+
+
+class MockAPIFootballServer:
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            latency: float = 0.0,
+            requests_limit_day: int = 1000000,
+            leagues: int = 50,
+            seasons: int = 10,
+            payload_dir: Union[str, None] = None,
+            compress: bool = False
+    ):
+        """
+        Local stand-in server for the API, run on a background thread.
+        Serves status, leagues, fixtures/league/{league_id}, fixtures/league/{league_id}/{date},
+        fixtures/live/{league_id} and fixtures/id/{fixture_id}. Recorded payloads in payload_dir take precedence,
+        named after the endpoint with / replaced by _, eg. fixtures_league_2.json.
+        Responses carry an ETag, and requests with a matching If-None-Match are answered 304 Not Modified.
+        :param host: Host to bind to
+        :param port: Port to bind to, 0 for any free port
+        :param latency: Seconds to wait before each response
+        :param requests_limit_day: Daily request limit reported by status
+        :param leagues: Number of synthetic leagues
+        :param seasons: Number of synthetic seasons of each league
+        :param payload_dir: Directory of recorded payloads
+        :param compress: Gzip responses to requests accepting gzip
+        """
+        self.latency = latency
+        self.requests_limit_day = requests_limit_day
+        self.payload_dir = payload_dir
+        self.compress = compress
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._leagues = {"api": {"results": leagues * seasons, "leagues": synthetic_leagues(leagues, seasons)}}
+        self._responses: Dict[str, bytes] = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def payload(self, endpoint: str) -> Union[bytes, None]:
+        """
+        Builds the body of the response to an endpoint, cached after the first request except for status.
+        :param endpoint: The endpoint requested, eg. fixtures/league/2
+        :return: The JSON body, or None if the endpoint is not served
+        """
+        if endpoint == "status":
+            return json.dumps({"api": {"results": 1, "status": {
+                "user": "mock",
+                "email": "mock@example.com",
+                "plan": "Mock",
+                "token": None,
+                "active": "Yes",
+                "subscription_end": "2100-01-01T00:00:00+00:00",
+                "requests": self.requests,
+                "requests_limit_day": self.requests_limit_day,
+            }}}).encode()
+
+        if endpoint not in self._responses:
+            data = self._build(endpoint)
+            if data is None:
+                return None
+            self._responses[endpoint] = json.dumps(data).encode()
+        return self._responses[endpoint]
+
+    def _build(self, endpoint: str) -> Union[Dict, None]:
+        if self.payload_dir:
+            path = os.path.join(self.payload_dir, endpoint.replace("/", "_") + ".json")
+            if os.path.exists(path):
+                with open(path) as payload:
+                    return json.load(payload)
+
+        if endpoint == "leagues":
+            return self._leagues
+        match = re.fullmatch(r"fixtures/league/(\d+)(?:/(\d{4}-\d{2}-\d{2}))?", endpoint)
+        if match:
+            fixtures = synthetic_fixtures(int(match.group(1)))
+            if match.group(2):
+                fixtures = [fixture for fixture in fixtures if fixture["event_date"].startswith(match.group(2))]
+            return {"api": {"results": len(fixtures), "fixtures": fixtures}}
+        match = re.fullmatch(r"fixtures/live/(\d+)", endpoint)
+        if match:
+            return {"api": {"results": 0, "fixtures": []}}
+        match = re.fullmatch(r"fixtures/id/(\d+)", endpoint)
+        if match:
+            return {"api": {"results": 1, "fixtures": [synthetic_match(int(match.group(1)))]}}
+        return None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                endpoint = re.sub("/+", "/", self.path).strip("/")
+                body = server.payload(endpoint)
+                if endpoint != "status":
+                    with server._lock:
+                        server.requests += 1
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    body = b""
+                else:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    if server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+                        body = gzip.compress(body, compresslevel=1)
+                        self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("X-RateLimit-requests-Limit", str(server.requests_limit_day))
+                self.send_header("X-RateLimit-requests-Remaining", str(server.requests_limit_day - server.requests))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                return
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--payload-dir", default=None)
+    parser.add_argument("--compress", action="store_true")
+    args = parser.parse_args()
+
+    server = MockAPIFootballServer(
+        host=args.host, port=args.port, latency=args.latency, payload_dir=args.payload_dir, compress=args.compress
+    )
+    print(f"Serving mock API-Football on {server.base_url}")
+    server.start()
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmarks against the local mock server, so no API_KEY or credits are needed.
+Run with: pytest benchmarks
+Compare runs with --benchmark-autosave and pytest-benchmark compare.
+"""
+import json
+from datetime import date
+
+import pytest
+
+from footballAPI import APIFootball, FixtureStore, LeagueTable, MemoryCache, SeasonAnalytics
+from mock_server import synthetic_fixtures, synthetic_match
+
+LEAGUE = ("Country 5", "League 5", 2015)
+
+
+@pytest.fixture(scope="module")
+def league_table(apifootball):
+    return LeagueTable(*LEAGUE, apifootball=apifootball)
+
+
+@pytest.mark.parametrize("endpoint, custom_ids", [
+    ("league_fixtures", {"league_id": 1}),
+    ("match", {"fixture_id": 1003}),
+])
+def test_get(benchmark, apifootball, endpoint, custom_ids):
+    benchmark.group = "get"
+    data = benchmark(apifootball.get, endpoint=endpoint, custom_ids=custom_ids, use_cache=False)
+    assert data["api"]["results"] > 0
+
+
+@pytest.mark.parametrize("endpoint, custom_ids", [
+    ("league_fixtures", {"league_id": 1}),
+    ("match", {"fixture_id": 1003}),
+])
+def test_get_without_validation(benchmark, apifootball, endpoint, custom_ids):
+    benchmark.group = "get"
+    benchmark(apifootball.get, endpoint=endpoint, custom_ids=custom_ids, validate=False, use_cache=False)
+
+
+def test_get_revalidated(benchmark, mock_server):
+    benchmark.group = "get"
+    # Responses expire immediately, even though every fixture has finished, so every call is a conditional request
+    # answered 304 Not Modified
+    cache = MemoryCache(ttls={"fixtures": 1e-9}, finished_ttl=1e-9)
+    with APIFootball(
+            api_key="mock", base_url=mock_server.base_url, credit_tracking="local", cache=cache
+    ) as apifootball:
+        apifootball.get(endpoint="league_fixtures", custom_ids={"league_id": 1})
+        benchmark(apifootball.get, endpoint="league_fixtures", custom_ids={"league_id": 1})
+        assert cache.stats["revalidations"] > 0
+
+
+def test_get_many(benchmark, apifootball):
+    benchmark.group = "get"
+    custom_ids_list = [{"league_id": league_id} for league_id in range(1, 21)]
+    results = benchmark(apifootball.get_many, endpoints=["league_fixtures"] * len(custom_ids_list),
+                        custom_ids_list=custom_ids_list, use_cache=False)
+    assert all(result.error is None for result in results)
+
+
+@pytest.mark.parametrize("endpoint, data", [
+    ("fixtures", {"api": {"results": 380, "fixtures": synthetic_fixtures(1)}}),
+    ("match", {"api": {"results": 1, "fixtures": [synthetic_match(1003)]}}),
+])
+def test_validation(benchmark, apifootball, endpoint, data):
+    benchmark.group = "validation"
+    benchmark(apifootball._validate_data, endpoint=endpoint, data=data)
+
+
+def test_json_decode(benchmark, mock_server):
+    benchmark.group = "validation"
+    body = mock_server.payload("fixtures/league/1")
+    benchmark(json.loads, body)
+
+
+def test_league_table_construction(benchmark, apifootball):
+    benchmark.group = "LeagueTable"
+    benchmark(LeagueTable, *LEAGUE, apifootball=apifootball)
+
+
+def test_league_table_construction_from_store(benchmark, apifootball, league_table):
+    benchmark.group = "LeagueTable"
+    fixture_store = FixtureStore(league_table.fixture_store.fixtures)
+    benchmark(LeagueTable, *LEAGUE, apifootball=apifootball, fixture_store=fixture_store)
+
+
+def test_league_table(benchmark, league_table):
+    benchmark.group = "league_table"
+    table = benchmark(league_table.league_table)
+    assert len(table) == 20
+
+
+def test_league_table_as_of(benchmark, league_table):
+    benchmark.group = "league_table"
+    benchmark(league_table.league_table, as_of=date(2016, 1, 1))
+
+
+def test_tables_by_matchday(benchmark, league_table):
+    benchmark.group = "league_table"
+    benchmark(league_table.tables_by_matchday)
+
+
+@pytest.mark.parametrize("max_workers", [1, None])
+def test_season_analytics(benchmark, max_workers):
+    benchmark.group = "season_analytics"
+    fixture_store = FixtureStore.from_api(
+        [fixture for league_id in range(1, 21) for fixture in synthetic_fixtures(league_id, finished=0.5)]
+    )
+    analytics = SeasonAnalytics(fixture_store, max_workers=max_workers, simulations=2000, seed=1)
+    benchmark.pedantic(analytics.run, rounds=3)
@@ -0,0 +1,30 @@
+import json
+
+import jsonschema
+import pytest
+
+SCHEMA_DIR = "footballAPI/validation_schemas"
+
+
+@pytest.mark.parametrize("schema, endpoint", [
+    ("status", "status"),
+    ("leagues", "leagues"),
+    ("fixtures", "fixtures/league/1"),
+    ("fixtures", "fixtures/league/1/2015-08-08"),
+    ("fixtures", "fixtures/live/1"),
+    ("match", "fixtures/id/1003"),
+])
+def test_payload_matches_schema(mock_server, schema, endpoint):
+    with open(f"{SCHEMA_DIR}/{schema}.json") as f:
+        jsonschema.validate(json.loads(mock_server.payload(endpoint)), json.load(f))
+
+
+def test_unknown_endpoint(mock_server):
+    assert mock_server.payload("teams/team/1") is None
+
+
+def test_served_over_http(apifootball, mock_server):
+    requests_before = mock_server.requests
+    data = apifootball.get(endpoint="league_fixtures", custom_ids={"league_id": 2}, use_cache=False)
+    assert data["api"]["results"] == 380
+    assert mock_server.requests == requests_before + 1
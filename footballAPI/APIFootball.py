@@ -1,16 +1,156 @@
 import json
 import logging
 import os
-import pkg_resources
+import threading
+import time
+from email.utils import parsedate_to_datetime
 import urllib3
-from typing import Dict, Union
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from importlib import resources
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple, Union
 
-import jsonschema
 import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from footballAPI.exceptions import *
 from footballAPI.globals import *
+from footballAPI.Instrumentation import NULL_METRICS, RequestMetrics
+from footballAPI.Models import Model, decode_response, model_for
+from footballAPI.RateLimiter import RateLimiter
+from footballAPI.ResponseCache import CacheEntry, ResponseCache
+from footballAPI.streaming import iter_json_items
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+def _compile_validator(schema: Dict, backend: str):
+    """
+    Compiles a validator for a jsonschema object with the given validation backend.
+
+    :param schema: The jsonschema object
+    :param backend: One of VALIDATION_BACKENDS
+
+    return: The compiled validator
+    """
+    if backend == "fastjsonschema":
+        return fastjsonschema.compile(schema)
+    # Imported on first use as jsonschema is slow to import and not needed when validation is off
+    import jsonschema
+
+    jsonschema.Draft7Validator.check_schema(schema)
+    return jsonschema.Draft7Validator(schema)
+
+
+@lru_cache(maxsize=None)
+def _load_default_schema(core_endpoint: str) -> Dict:
+    """
+    Loads the validation schema provided for an endpoint, cached for the life of the process.
+
+    :param core_endpoint: The base endpoint of the request, eg. fixtures
+
+    return: The jsonschema object
+    """
+    default_schema = resources.files(__package__).joinpath("validation_schemas").joinpath(f"{core_endpoint}.json")
+
+    if not default_schema.is_file():
+        raise NoValidationSchema(f"No validation schema in default for endpoint {core_endpoint}.")
+
+    return json.loads(default_schema.read_text())
+
+
+@lru_cache(maxsize=None)
+def _default_validator(core_endpoint: str, backend: str):
+    """
+    Compiles the validation schema provided for an endpoint, cached for the life of the process.
+
+    :param core_endpoint: The base endpoint of the request, eg. fixtures
+    :param backend: One of VALIDATION_BACKENDS
+
+    return: The compiled validator
+    """
+    return _compile_validator(_load_default_schema(core_endpoint), backend)
+
+
+@lru_cache(maxsize=None)
+def _item_validator(core_endpoint: str, path: Tuple[str, ...], backend: str):
+    """
+    Compiles the sub-schema of the provided validation schema for the items of the array at path, eg. a single
+    fixture of ('api', 'fixtures').
+
+    :param core_endpoint: The base endpoint of the request, eg. fixtures
+    :param path: The keys of the nested objects leading to the array
+    :param backend: One of VALIDATION_BACKENDS
+
+    return: The compiled validator
+    """
+    schema = _load_default_schema(core_endpoint)
+    try:
+        for key in path:
+            schema = schema["properties"][key]
+        schema = schema["items"]
+    except KeyError:
+        raise NoValidationSchema(f"No validation schema in default for items of {'.'.join(path)} of {core_endpoint}.")
+    return _compile_validator(schema, backend)
+
+
+@lru_cache(maxsize=128)
+def _custom_validator(schema_json: str, backend: str):
+    """
+    Compiles a user provided validation schema, cached on its serialised form.
+
+    :param schema_json: The jsonschema object serialised with sorted keys
+    :param backend: One of VALIDATION_BACKENDS
+
+    return: The compiled validator
+    """
+    return _compile_validator(json.loads(schema_json), backend)
+
+
+def _retry_after(value: Union[str, None]) -> Union[float, None]:
+    """
+    Parses a Retry-After header, given either as seconds or as an HTTP date.
+
+    :param value: The value of the header
+    return: Seconds to wait, or None if the header is missing or invalid
+    """
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _validators(headers) -> Dict[str, str]:
+    """
+    Extracts the validators of a response to store with it in the cache, see CONDITIONAL_HEADERS.
+
+    :param headers: The headers of the response
+    return: The ETag and Last-Modified headers present
+    """
+    return {name: headers[name] for name in CONDITIONAL_HEADERS if headers.get(name)}
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of a single request made through APIFootball.get_many.
+    """
+    index: int
+    endpoint: str
+    custom_ids: Union[Dict, None]
+    data: Union[Dict, None]
+    error: Union[Exception, None]
 
 
 class APIFootball:
@@ -19,18 +159,57 @@ class APIFootball:
             api_key: str = None,
             base_url: str = "https://v2.api-football.com/",
             headers: Union[Dict[str, str], None] = None,
-            verify: bool = False
+            verify: bool = False,
+            pool_size: int = 10,
+            max_retries: int = 3,
+            backoff_factor: float = 0.5,
+            timeout: Union[float, Tuple[float, float], None] = (5, 30),
+            credit_tracking: str = "status",
+            resync_interval: Union[float, None] = None,
+            resync_calls: Union[int, None] = None,
+            cache: Union[ResponseCache, None] = None,
+            validation_backend: str = "jsonschema",
+            fail_fast: bool = False,
+            metrics_hooks: Union[List[Callable[[RequestMetrics], None]], None] = None,
+            rate_limiter: Union[RateLimiter, str, None] = None,
+            max_rate_limit_retries: int = 3,
+            single_flight: bool = True
     ):
         """
         This will build the base connection parameters for usage of the API and will
         create the core structure for all API calls.
 
-        Also updates total available credits available for the user.
+        Also updates total available credits available for the user. When credit_tracking is "local" this is
+        deferred until the first request, so the class can be built without network access.
 
         :param base_url: Base URL of the endpoint, defaults to currently active one
         :param headers: Any additional headers to be passed to API calls. Should NOT include API KEY
         :param verify: Use requests verification
+        :param pool_size: Maximum number of pooled keep-alive connections to the API host
+        :param max_retries: Number of retries on connection errors and transient 5xx responses
+        :param backoff_factor: Backoff factor between retries, sleeps for backoff_factor * (2 ** (retry - 1)) seconds
+        :param timeout: Request timeout in seconds, either a single value or a (connect, read) tuple
+        :param credit_tracking: "status" to query the status endpoint after every request, or "local" to decrement
+            credits locally and update them from the rate-limit response headers
+        :param resync_interval: In local mode, seconds after which credits are resynced with the status endpoint
+        :param resync_calls: In local mode, number of requests after which credits are resynced with the status endpoint
+        :param cache: Optional response cache, eg. MemoryCache or SQLiteCache, checked before every request
+        :param validation_backend: "jsonschema", or "fastjsonschema" to validate with code generated validators
+        :param fail_fast: Stop validation at the first error rather than collecting all errors
+        :param metrics_hooks: Callables passed the RequestMetrics of every call to get, eg. PrometheusMetrics()
+        :param rate_limiter: RateLimiter scheduling the requests of the class, or the name of a plan in RATE_LIMIT_PLANS
+            to build one. Pass RateLimiter.shared(plan) to share one limiter between every client in the process
+        :param max_rate_limit_retries: Number of retries of requests refused with a 429 status code
+        :param single_flight: Share one request between concurrent calls to get for the same endpoint
         """
+        if validation_backend not in VALIDATION_BACKENDS:
+            raise ValueError(f"{validation_backend} is not a valid validation_backend.")
+        if validation_backend == "fastjsonschema" and fastjsonschema is None:
+            raise ImportError("fastjsonschema must be installed to use the fastjsonschema validation_backend.")
+
+        if credit_tracking not in CREDIT_TRACKING_MODES:
+            raise ValueError(f"{credit_tracking} is not a valid credit_tracking mode.")
+
         self.base_url = base_url
 
         if not api_key:
@@ -45,25 +224,122 @@ class APIFootball:
         if headers:
             self.headers.update(headers)
         self.verify = verify
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.backoff_factor = backoff_factor
+        if isinstance(rate_limiter, str):
+            rate_limiter = RateLimiter.for_plan(rate_limiter)
+        self.rate_limiter = rate_limiter
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.cache = cache
+        self.validation_backend = validation_backend
+        self.fail_fast = fail_fast
+        self.session = self._build_session(
+            pool_size=pool_size,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor
+        )
+        self.credit_tracking = credit_tracking
+        self.resync_interval = resync_interval
+        self.resync_calls = resync_calls
         self.available_credits = None
         self.max_credits = None
-        self.logger = logging.getLogger()
-        logging.basicConfig(
-            format='[%(asctime)s][%(threadName)s][%(levelname)s]: %(message)s',
-            level=logging.INFO,
-            datefmt='%Y-%m-%d %H:%M:%S')
+        self._last_credit_sync = None
+        self._calls_since_sync = 0
+        self._resync_pending = False
+        self._in_flight = 0
+        self._credit_lock = threading.Lock()
+        self.single_flight = single_flight
+        self._flights: Dict[Tuple, Future] = {}
+        self._flights_lock = threading.Lock()
+        self.metrics_hooks = list(metrics_hooks or [])
+        self.logger = logging.getLogger(__name__)
 
         if not self.verify:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         # Update available_credits and max_credits
-        self.update_credits()
+        if self.credit_tracking == "status":
+            self.update_credits()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    def _build_payload(self, endpoint: str) -> Dict:
+    def close(self):
+        """
+        Closes the underlying session and releases all pooled connections.
+        """
+        self.logger.debug("Closing session.")
+        self.session.close()
+
+    def add_metrics_hook(self, hook: Callable[[RequestMetrics], None]):
+        """
+        Registers a callable to be passed the RequestMetrics of every subsequent call to get.
+
+        :param hook: The callable, eg. PrometheusMetrics() or a function logging slow requests
+        """
+        self.metrics_hooks.append(hook)
+
+    def _emit_metrics(self, metrics: RequestMetrics):
+        """
+        Passes the metrics of a completed call to every registered hook. Errors raised by hooks are logged rather
+        than raised, so instrumentation can never fail a request.
+
+        :param metrics: The metrics of the call
+        """
+        metrics.credits_available = self.available_credits
+        for hook in self.metrics_hooks:
+            try:
+                hook(metrics)
+            except Exception:
+                self.logger.exception(f"Metrics hook {hook} failed.")
+
+    def _build_session(
+            self,
+            pool_size: int,
+            max_retries: int,
+            backoff_factor: float
+    ) -> requests.Session:
+        """
+        Builds a keep-alive session with a connection pool shared by every request made by the class.
+
+        :param pool_size: Maximum number of pooled connections
+        :param max_retries: Number of retries on connection errors and transient 5xx responses
+        :param backoff_factor: Backoff factor between retries
+
+        return: The configured session
+        """
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # gzip and deflate, with brotli added when brotli or brotlicffi is installed for urllib3 to decode it
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return session
+
+    def _build_payload(self, endpoint: str, headers: Union[Dict[str, str], None] = None) -> Dict:
         """
         Builds a payload to send to the API.
 
         :param endpoint: The endpoint to pass to the payload.
+        :param headers: Headers of this request only, eg. conditional request headers
 
         return: Payload to pass to the API.
         """
@@ -71,8 +347,9 @@ class APIFootball:
         api_url = f"{self.base_url}/{endpoint}"
         payload = {
             "url": api_url,
-            "headers": self.headers,
-            "verify": self.verify
+            "headers": {**self.headers, **headers} if headers else self.headers,
+            "verify": self.verify,
+            "timeout": self.timeout
         }
         self.logger.debug("Payload built successfully.")
         return payload
@@ -80,35 +357,58 @@ class APIFootball:
     def _check_status_code(self, status_code: int):
         """
         Check the status code of a response to ensure it is valid.
-        Should only ever return a 200 status code.
+        Should only ever return a 200 status code, or 304 to a conditional request for a cached response.
 
         :param status_code: The status code to be validated
         """
         if status_code == 200:
             self.logger.debug("Valid status code recieved")
             return
+        elif status_code == NOT_MODIFIED_STATUS_CODE:
+            self.logger.debug("Not modified status code recieved")
+            return
         else:
             raise InvalidStatusCode(f"{str(status_code)} is an invalid status_code!")
 
     def _get(
             self,
             endpoint: str,
-            dryrun: bool = False
+            dryrun: bool = False,
+            stream: bool = False,
+            metrics: RequestMetrics = NULL_METRICS,
+            headers: Union[Dict[str, str], None] = None
     ) -> Union[Response, None]:
         """
         Calls the api and returns the response if a successful status code
 
         :param endpoint: The extension of the base url with any filters added
         :param dryrun: If True it will only say which endpoint will be called and return None
+        :param stream: If True the body is not downloaded until it is read from the response
+        :param metrics: Metrics of the call to record the payload and network phases in
+        :param headers: Headers of this request only, eg. conditional request headers
 
         return: The returned response from the API or None if dryrun
         """
-        payload = self._build_payload(endpoint)
+        with metrics.phase("payload"):
+            payload = self._build_payload(endpoint, headers=headers)
         self.logger.info(f"{'(dryrun)' if dryrun else ''} Requesting {payload['url']}.")
         if not dryrun:
-            resp = requests.get(**payload)
-            self.logger.debug("Checking for valid status code.")
-            self._check_status_code(resp.status_code)
+            with metrics.phase("network"):
+                resp = self.session.get(stream=stream, **payload)
+            metrics.record_response(resp)
+            try:
+                if resp.status_code == RATE_LIMITED_STATUS_CODE:
+                    raise RateLimitExceeded(
+                        f"{str(resp.status_code)} rate limit exceeded!",
+                        retry_after=_retry_after(resp.headers.get("Retry-After"))
+                    )
+                self.logger.debug("Checking for valid status code.")
+                self._check_status_code(resp.status_code)
+            except Exception:
+                # The body of a streamed response is never read, release its connection to the pool
+                if stream:
+                    resp.close()
+                raise
 
         else:
             resp = None
@@ -123,6 +423,7 @@ class APIFootball:
     ):
         """
         Validates the JSON response from the API against a valid jsonschema object.
+        Validators are compiled once per process and reused between calls.
 
         :param endpoint: The base endpoint for the request
         :param resp: The JSON response from the API
@@ -131,27 +432,48 @@ class APIFootball:
         core_endpoint = endpoint.split('/')[0]  # uses teams if endpoint is teams/team
         self.logger.debug(f"Loading validation schema for {core_endpoint}")
         if not expected_schema:
-            default_schema = f"validation_schemas/{core_endpoint}.json"
-            default_schema_path = pkg_resources.resource_filename(__name__, default_schema)
+            validator = _default_validator(core_endpoint, self.validation_backend)
+        else:
+            validator = _custom_validator(json.dumps(expected_schema, sort_keys=True), self.validation_backend)
 
-            if not os.path.exists(default_schema_path):
-                raise NoValidationSchema(f"No validation schema in default for endpoint {core_endpoint}.")
+        self._check_validator(validator=validator, data=data, endpoint=endpoint)
 
-            with open(default_schema_path) as schema_json:
-                schema = json.load(schema_json)
+    def _check_validator(
+            self,
+            validator,
+            data: Dict,
+            endpoint: str
+    ):
+        """
+        Runs a compiled validator against data, raising SchemaValidationError if any errors are found.
 
-        else:
-            schema = expected_schema
+        :param validator: The compiled validator
+        :param data: The data to validate
+        :param endpoint: The endpoint of the request, for error messages
+        """
+        if self.validation_backend == "fastjsonschema":
+            # fastjsonschema always stops at the first error
+            try:
+                validator(data)
+                errors = []
+            except fastjsonschema.JsonSchemaException as e:
+                errors = [e]
 
-        validator = jsonschema.Draft7Validator(schema)
+        elif self.fail_fast:
+            error = next(validator.iter_errors(data), None)
+            errors = [error] if error is not None else []
 
-        errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
+        else:
+            errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
 
         if errors:
             self.logger.error(f'Recieved schema validation errors')
             for error in errors:
                 self.logger.error(error)
-            exit(1)
+            raise SchemaValidationError(
+                f"{len(errors)} schema validation error(s) for endpoint {endpoint}.",
+                errors=errors
+            )
 
         else:
             return
@@ -163,7 +485,10 @@ class APIFootball:
             validate: bool = True,
             validation_schema: Dict = None,
             custom_ids: Dict = None,
-    ) -> Union[Dict, None]:
+            use_cache: bool = True,
+            priority: Union[str, int] = "normal",
+            as_model: bool = False
+    ) -> Union[Dict, List[Model], None]:
         """
         Can be used to run against any arbitrary endpoint. Using this function directly may result in wasting credits if the endpoint is invalid.
         Custom ids may be passed and should only be used when using custom endpoints and for only one request at a time.
@@ -174,10 +499,336 @@ class APIFootball:
         :param validate: Perform validation against a jsonschema
         :param validation_schema: A non-default validation schema for validation if required
         :param custom_ids: The custom ids provided for the custom endpoint
+        :param use_cache: Use the response cache of the class if one was provided. Only responses validated against
+            the provided schemas are cached, requests with a validation_schema bypass the cache
+        :param priority: Priority of the request when waiting for the rate limiter, see REQUEST_PRIORITIES
+        :param as_model: Return the items of the response decoded into models, see ENDPOINT_MODELS in Models.py
+
+        return: The JSON response from the endpoint, or its items as models, if not dryrun, or None
+        """
+
+        api_endpoint = self._resolve_endpoint(endpoint=endpoint, custom_ids=custom_ids)
+        if as_model:
+            # Fails before any credits are used if the endpoint has no model
+            model_for(api_endpoint)
+
+        if dryrun:
+            self._get(endpoint=api_endpoint, dryrun=True)
+            return None
+
+        if not self.metrics_hooks:
+            data = self._get_data(api_endpoint, validate, validation_schema, use_cache, priority, NULL_METRICS)
+        else:
+            metrics = RequestMetrics(api_endpoint)
+            try:
+                data = self._get_data(api_endpoint, validate, validation_schema, use_cache, priority, metrics)
+            except Exception as e:
+                metrics.error = e
+                raise
+            finally:
+                self._emit_metrics(metrics)
+        return decode_response(api_endpoint, data) if as_model else data
+
+    def _get_data(
+            self,
+            api_endpoint: str,
+            validate: bool,
+            validation_schema: Union[Dict, None],
+            use_cache: bool,
+            priority: Union[str, int],
+            metrics: RequestMetrics
+    ) -> Dict:
+        """
+        Returns the data of a resolved endpoint from the cache or the API, recording each phase of the call.
+
+        :param api_endpoint: The resolved endpoint to request
+        :param validate: Perform validation against a jsonschema
+        :param validation_schema: A non-default validation schema for validation if required
+        :param use_cache: Use the response cache of the class if one was provided, see get
+        :param priority: Priority of the request when waiting for the rate limiter
+        :param metrics: Metrics of the call, NULL_METRICS when no hooks are registered
+
+        return: The JSON response from the endpoint
+        """
+        # Cached responses are validated against the provided schemas, which says nothing of a custom schema
+        use_cache = use_cache and self.cache is not None and not validation_schema
+        entry = None
+        if use_cache:
+            with metrics.phase("cache"):
+                entry = self.cache.lookup(api_endpoint)
+            if entry is not None and entry.fresh:
+                self.logger.debug(f"Cache hit for {api_endpoint}")
+                metrics.cache_hit = True
+                return entry.data
+
+        if not self.single_flight:
+            return self._fetch_data(api_endpoint, validate, validation_schema, use_cache, priority, metrics, entry)
+
+        key = self._flight_key(api_endpoint, validate, validation_schema)
+        with self._flights_lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._flights[key] = Future()
+                # A running future cannot be cancelled by the callers sharing it
+                future.set_running_or_notify_cancel()
+
+        if not leader:
+            self.logger.debug(f"Sharing in-flight request for {api_endpoint}")
+            metrics.shared = True
+            with metrics.phase("flight"):
+                return future.result()
+
+        try:
+            data = self._fetch_data(api_endpoint, validate, validation_schema, use_cache, priority, metrics, entry)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+        return data
+
+    def _fetch_data(
+            self,
+            api_endpoint: str,
+            validate: bool,
+            validation_schema: Union[Dict, None],
+            use_cache: bool,
+            priority: Union[str, int],
+            metrics: RequestMetrics,
+            stale: Union[CacheEntry, None] = None
+    ) -> Dict:
+        """
+        Requests a resolved endpoint from the API, validating the response and storing it in the cache.
+        If an expired response with validators is cached, the request is conditional and a 304 Not Modified response
+        renews and returns the cached response without downloading or validating the body again.
+        See _get_data for other parameters.
+
+        :param stale: The expired cache entry of the endpoint, if any
+
+        return: The JSON response from the endpoint
+        """
+        headers = None
+        if stale is not None:
+            headers = {CONDITIONAL_HEADERS[name]: value for name, value in stale.validators.items()}
+        resp = self._request(endpoint=api_endpoint, priority=priority, metrics=metrics, headers=headers)
+
+        if resp.status_code == NOT_MODIFIED_STATUS_CODE:
+            if stale is None:
+                raise InvalidStatusCode(
+                    f"{str(resp.status_code)} recieved without a cached response for {api_endpoint}!"
+                )
+            self.logger.debug(f"{api_endpoint} not modified, reusing cached response")
+            metrics.revalidated = True
+            self.cache.revalidate(api_endpoint, stale, _validators(resp.headers))
+            return stale.data
+
+        with metrics.phase("decode"):
+            data = resp.json()
+
+        if validate:
+            self.logger.debug(f"Performing validation")
+            with metrics.phase("validation"):
+                self._validate_data(
+                    endpoint=api_endpoint,
+                    data=data,
+                    expected_schema=validation_schema
+                )
+
+        # Only validated responses are cached, as they may be returned to callers which validate
+        if use_cache and validate:
+            self.cache.set(api_endpoint, data, _validators(resp.headers))
+
+        return data
+
+    def get_stream(
+            self,
+            endpoint: str,
+            custom_ids: Dict = None,
+            item_path: Union[Tuple[str, ...], None] = None,
+            validate: bool = True,
+            validation_schema: Dict = None,
+            chunk_size: int = 65536,
+            priority: Union[str, int] = "normal"
+    ) -> Iterator[Dict]:
+        """
+        Streams the response of an endpoint, yielding the items of a list in the payload one at a time as the body
+        arrives, eg. each fixture of a season, rather than holding the whole response in memory.
+        Each item is validated against the sub-schema for the items of the list. The response cache is not used.
+
+        The request is made when iteration starts.
+
+        :param endpoint: The endpoint to call
+        :param custom_ids: The custom ids provided for the custom endpoint
+        :param item_path: The keys leading to the list to stream, defaults to ('api', <base endpoint>), eg. api.fixtures
+        :param validate: Perform validation of each item against a jsonschema
+        :param validation_schema: A non-default validation schema for each item if required
+        :param chunk_size: Number of bytes read from the response at a time
+        :param priority: Priority of the request when waiting for the rate limiter, see REQUEST_PRIORITIES
+
+        return: An iterator over the items of the list
+        """
+        api_endpoint = self._resolve_endpoint(endpoint=endpoint, custom_ids=custom_ids)
+        core_endpoint = api_endpoint.split('/')[0]
+        item_path = tuple(item_path or ("api", core_endpoint))
+
+        validator = None
+        if validate:
+            if validation_schema:
+                validator = _custom_validator(json.dumps(validation_schema, sort_keys=True), self.validation_backend)
+            else:
+                validator = _item_validator(core_endpoint, item_path, self.validation_backend)
+
+        # The response is closed by _get if its status code is invalid
+        resp = self._request(endpoint=api_endpoint, priority=priority, stream=True)
+
+        try:
+            for item in iter_json_items(resp.iter_content(chunk_size=chunk_size), item_path):
+                if validator is not None:
+                    self._check_validator(validator=validator, data=item, endpoint=api_endpoint)
+                yield item
+        finally:
+            resp.close()
+
+    def get_many(
+            self,
+            endpoints: List[str],
+            custom_ids_list: Union[List[Union[Dict, None]], None] = None,
+            validate: bool = True,
+            validation_schema: Dict = None,
+            max_workers: Union[int, None] = None,
+            ordered: bool = True,
+            use_cache: bool = True,
+            priority: Union[str, int] = "normal"
+    ) -> Union[List[BatchResult], Iterator[BatchResult]]:
+        """
+        Runs a batch of requests on a thread pool sharing the session of the class.
+        Each endpoint is paired with the custom ids at the same position of custom_ids_list, use None for endpoints
+        which do not require custom ids. A failed request is returned as a BatchResult with its error set, the rest of
+        the batch still runs.
 
-        return: The JSON response from the endpoint if not dryrun, or None
+        :param endpoints: The endpoints to call
+        :param custom_ids_list: The custom ids for each endpoint
+        :param validate: Perform validation against a jsonschema
+        :param validation_schema: A non-default validation schema for validation if required
+        :param max_workers: Number of threads to use, defaults to the pool size of the session
+        :param ordered: If True return a list in the order of endpoints, else an iterator in completion order
+        :param use_cache: Use the response cache of the class if one was provided, see get
+        :param priority: Priority of the requests when waiting for the rate limiter, see REQUEST_PRIORITIES
+
+        return: The BatchResult of each request
+        """
+        if custom_ids_list is None:
+            custom_ids_list = [None] * len(endpoints)
+        if len(custom_ids_list) != len(endpoints):
+            raise ValueError("custom_ids_list must be the same length as endpoints.")
+
+        results = self._iter_many(
+            endpoints=endpoints,
+            custom_ids_list=custom_ids_list,
+            validate=validate,
+            validation_schema=validation_schema,
+            max_workers=max_workers or self.pool_size,
+            use_cache=use_cache,
+            priority=priority
+        )
+        if ordered:
+            return sorted(results, key=lambda result: result.index)
+        return results
+
+    def _iter_many(
+            self,
+            endpoints: List[str],
+            custom_ids_list: List[Union[Dict, None]],
+            validate: bool,
+            validation_schema: Union[Dict, None],
+            max_workers: int,
+            use_cache: bool,
+            priority: Union[str, int]
+    ) -> Iterator[BatchResult]:
+        """
+        Yields the BatchResult of each request in completion order, see get_many.
+        """
+        def run(index: int, endpoint: str, custom_ids: Union[Dict, None]) -> BatchResult:
+            try:
+                data = self.get(
+                    endpoint=endpoint,
+                    validate=validate,
+                    validation_schema=validation_schema,
+                    custom_ids=custom_ids,
+                    use_cache=use_cache,
+                    priority=priority
+                )
+            except Exception as e:
+                self.logger.error(f"Request {index} for {endpoint} failed: {e}")
+                return BatchResult(index, endpoint, custom_ids, None, e)
+            return BatchResult(index, endpoint, custom_ids, data, None)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="APIFootball") as executor:
+            futures = [
+                executor.submit(run, index, endpoint, custom_ids)
+                for index, (endpoint, custom_ids) in enumerate(zip(endpoints, custom_ids_list))
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    @staticmethod
+    def _flight_key(
+            api_endpoint: str,
+            validate: bool,
+            validation_schema: Union[Dict, None]
+    ) -> Tuple:
+        """
+        Builds the key identifying calls to get which can share one in-flight request. Calls validating against
+        different schemas do not share a request, so no caller receives data it has not validated.
+
+        :param api_endpoint: The resolved endpoint to request
+        :param validate: Perform validation against a jsonschema
+        :param validation_schema: A non-default validation schema for validation if required
+
+        return: The key
+        """
+        schema = json.dumps(validation_schema, sort_keys=True) if validate and validation_schema else None
+        return api_endpoint, validate, schema
+
+    def _in_flight_future(
+            self,
+            api_endpoint: str,
+            validate: bool = True,
+            validation_schema: Dict = None
+    ) -> Union[Future, None]:
+        """
+        Returns the future of a request in flight for a resolved endpoint, which completes with its validated data.
+        Used by AsyncAPIFootball so coroutines can await a shared request without taking a worker thread.
+
+        :param api_endpoint: The resolved endpoint, see _resolve_endpoint
+        :param validate: Perform validation against a jsonschema
+        :param validation_schema: A non-default validation schema for validation if required
+
+        return: The future, or None if no request is in flight or single_flight is disabled
         """
+        if not self.single_flight:
+            return None
+        with self._flights_lock:
+            return self._flights.get(self._flight_key(api_endpoint, validate, validation_schema))
 
+    def _resolve_endpoint(
+            self,
+            endpoint: str,
+            custom_ids: Dict = None
+    ) -> str:
+        """
+        Checks the endpoint is permitted and builds the endpoint to request, formatting any custom endpoint with the
+        provided custom ids.
+
+        :param endpoint: The endpoint to call
+        :param custom_ids: The custom ids provided for the custom endpoint
+
+        return: The endpoint to request from the API
+        """
         base_endpoint = endpoint.split('/')[0]  # eg. takes base endpoint fixtures from fixtures/live
 
         if not base_endpoint in BASE_ENDPOINTS:
@@ -197,37 +848,122 @@ class APIFootball:
             api_endpoint = endpoint
             self.logger.debug(f'Recieved endpoint {api_endpoint}')
 
-        if self.available_credits > 0:
-            resp = self._get(
-                endpoint=api_endpoint,
-                dryrun=dryrun
-            )
-            self.update_credits()
+        return api_endpoint
 
-        elif self.available_credits == 0 and not dryrun:
-            raise NoAvailableCredits('No credits available for API call.')
+    def _request(
+            self,
+            endpoint: str,
+            priority: Union[str, int] = "normal",
+            stream: bool = False,
+            metrics: RequestMetrics = NULL_METRICS,
+            headers: Union[Dict[str, str], None] = None
+    ) -> Response:
+        """
+        Requests a resolved endpoint once the rate limiter allows it, reserving a credit for the request.
+        Requests refused with a 429 status code are retried after the Retry-After header, or with exponential backoff
+        if it is missing. While backing off every request sharing the rate limiter is paused.
 
-        if dryrun:
-            return None
+        :param endpoint: The resolved endpoint to request
+        :param priority: Priority of the request when waiting for the rate limiter
+        :param stream: If True the body is not downloaded until it is read from the response
+        :param metrics: Metrics of the call to record each phase in
+        :param headers: Headers of this request only, eg. conditional request headers
 
-        data = resp.json()
+        return: The response from the API
+        """
+        for attempt in range(self.max_rate_limit_retries + 1):
+            if self.rate_limiter is not None:
+                with metrics.phase("queue"):
+                    self.rate_limiter.acquire(priority)
 
-        if validate:
-            self.logger.debug(f"Performing validation")
-            self._validate_data(
-                endpoint=api_endpoint,
-                data=data,
-                expected_schema=validation_schema
-            )
+            self._reserve_credit()
+            resp = None
+            rate_limited = False
+            try:
+                resp = self._get(endpoint=endpoint, stream=stream, metrics=metrics, headers=headers)
+                return resp
+            except RateLimitExceeded as e:
+                # A request refused with a 429 status code does not use a credit
+                rate_limited = True
+                if attempt == self.max_rate_limit_retries:
+                    raise
+                self._backoff(endpoint, e, attempt)
+            finally:
+                with metrics.phase("credits"):
+                    self._release_credit(resp, priority, used=not rate_limited)
+                metrics.credits_used = 0 if rate_limited else 1
+
+    def _backoff(self, endpoint: str, error: RateLimitExceeded, attempt: int):
+        """
+        Waits before retrying a request refused with a 429 status code, pausing every request sharing the rate limiter.
 
-        return data
+        :param endpoint: The endpoint which was refused
+        :param error: The exception raised for the refused request
+        :param attempt: The number of the attempt which was refused, from 0
+        """
+        delay = error.retry_after if error.retry_after is not None else self.backoff_factor * 2 ** attempt
+        self.logger.warning(f"Rate limited requesting {endpoint}, retrying in {delay:.1f}s.")
+        if self.rate_limiter is not None:
+            self.rate_limiter.backoff(delay)
+        else:
+            time.sleep(delay)
+
+    def _reserve_credit(self):
+        """
+        Reserves a credit for a request. Requests which are still in flight count against the available credits,
+        so concurrent callers can never overdraw available_credits.
+        """
+        with self._credit_lock:
+            if self._credits_stale():
+                self.update_credits()
+
+            if self.available_credits - self._in_flight <= 0:
+                raise NoAvailableCredits('No credits available for API call.')
+
+            self._in_flight += 1
 
-    def update_credits(self):
+    def _release_credit(self, resp: Union[Response, None], priority: Union[str, int] = "normal", used: bool = True):
         """
-        Updates the total available credits available by querying the status endpoint
+        Releases a reserved credit once its request has completed and records its usage. The credit is taken from
+        available_credits in the same critical section as it is released, so concurrent callers never see the old
+        balance. In status mode available_credits is then resynced with the status endpoint.
+
+        :param resp: The response of the request, None if the request failed
+        :param priority: Priority of the request, used for the status request in status mode
+        :param used: False if the request did not use a credit, eg. it was refused with a 429 status code
+        """
+        with self._credit_lock:
+            self._in_flight -= 1
+            if used:
+                self._record_credit_usage(resp)
+
+        if self.credit_tracking == "status" and used:
+            try:
+                self.update_credits(priority)
+            except Exception as e:
+                # The request itself succeeded, so its response is still returned and credits are resynced before
+                # the next request
+                self.logger.warning(f"Failed to resync credits with the status endpoint: {e}")
+                self._resync_pending = True
+
+    def update_credits(self, priority: Union[str, int] = "normal"):
+        """
+        Updates the total available credits available by querying the status endpoint, once the rate limiter allows it.
+        Requests refused with a 429 status code are retried as in _request.
+
+        :param priority: Priority of the request when waiting for the rate limiter
         """
         self.logger.debug("Updating credits")
-        resp = self._get(endpoint="status")
+        for attempt in range(self.max_rate_limit_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(priority)
+            try:
+                resp = self._get(endpoint="status")
+                break
+            except RateLimitExceeded as e:
+                if attempt == self.max_rate_limit_retries:
+                    raise
+                self._backoff("status", e, attempt)
         data = resp.json()
 
         self._validate_data(endpoint="status", data=data)
@@ -238,7 +974,50 @@ class APIFootball:
         used_credits = data["api"]["status"]["requests"] + 1
 
         self.available_credits = self.max_credits - used_credits
+        self._last_credit_sync = time.monotonic()
+        self._calls_since_sync = 0
+        self._resync_pending = False
 
         self.logger.info(f"{self.available_credits} credit(s) available.")
 
         return
+
+    def _credits_stale(self) -> bool:
+        """
+        Checks whether the credits need to be resynced with the status endpoint before the next request.
+
+        return: True if credits have never been synced, the last resync failed or the local resync interval or call
+            count has been exceeded
+        """
+        if self.available_credits is None or self._resync_pending:
+            return True
+        if self.credit_tracking != "local":
+            return False
+        if self.resync_calls is not None and self._calls_since_sync >= self.resync_calls:
+            return True
+        if self.resync_interval is not None and \
+                time.monotonic() - self._last_credit_sync >= self.resync_interval:
+            return True
+        return False
+
+    def _record_credit_usage(self, resp: Union[Response, None]):
+        """
+        Updates the available credits after a request, taking them from the rate-limit response headers if present,
+        otherwise decrementing them by one. Called with the credit lock held.
+
+        :param resp: The response of the request, None if the request failed
+        """
+        self._calls_since_sync += 1
+        headers = resp.headers if resp is not None else {}
+        remaining = headers.get(RATE_LIMIT_HEADERS["remaining"])
+        limit = headers.get(RATE_LIMIT_HEADERS["limit"])
+        if remaining is not None:
+            # Keep the additional used credit for saftey net
+            self.available_credits = int(remaining) - 1
+            if limit is not None:
+                self.max_credits = int(limit)
+        else:
+            self.available_credits -= 1
+
+        self.logger.debug(f"{self.available_credits} credit(s) available.")
+        return
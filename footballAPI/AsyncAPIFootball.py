@@ -0,0 +1,139 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, Union
+
+from footballAPI.APIFootball import APIFootball
+from footballAPI.Models import Model, decode_response, model_for
+
+
+class AsyncAPIFootball:
+    def __init__(
+            self,
+            apifootball: Union[APIFootball, None] = None,
+            concurrency: int = 10,
+            **kwargs
+    ):
+        """
+        asyncio interface to APIFootball for concurrent requests.
+
+        Requests are run on a bounded pool of workers sharing the keep-alive session of a single APIFootball, so the
+        endpoint checks, validation and credit guarding are identical to APIFootball.get. Requests which are in
+        flight are reserved against the available credits, so outstanding requests never exceed available_credits.
+
+        :param apifootball: An existing APIFootball to share, if not passed one is built from kwargs. A shared
+            APIFootball is left open by close
+        :param concurrency: Maximum number of requests in flight at once
+        :param kwargs: Arguments passed to APIFootball if apifootball is not passed
+        """
+        # Only a client built here is closed by close, a shared one is closed by its owner
+        self._owns_client = apifootball is None
+        if apifootball is None:
+            kwargs.setdefault("pool_size", concurrency)
+            apifootball = APIFootball(**kwargs)
+        self.apifootball = apifootball
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="AsyncAPIFootball"
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the class as close does, waiting for the requests in flight on a separate thread so the event loop is
+        not blocked.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self):
+        """
+        Shuts down the workers, waiting for the requests in flight, and closes the underlying session if the
+        APIFootball was built by the class. Blocks until the requests complete, use aclose from a coroutine.
+        """
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.apifootball.close()
+
+    async def get(
+            self,
+            endpoint: str,
+            dryrun: bool = False,
+            validate: bool = True,
+            validation_schema: Dict = None,
+            custom_ids: Dict = None,
+            use_cache: bool = True,
+            priority: Union[str, int] = "normal",
+            as_model: bool = False
+    ) -> Union[Dict, List[Model], None]:
+        """
+        Awaitable equivalent of APIFootball.get, see APIFootball.get for usage.
+
+        :param endpoint: The endpoint to call
+        :param dryrun: Execute the requests
+        :param validate: Perform validation against a jsonschema
+        :param validation_schema: A non-default validation schema for validation if required
+        :param custom_ids: The custom ids provided for the custom endpoint
+        :param use_cache: Use the response cache of the client if one was provided
+        :param priority: Priority of the request when waiting for the rate limiter of the client
+        :param as_model: Return the items of the response decoded into models
+
+        return: The JSON response from the endpoint, or its items as models, if not dryrun, or None
+        """
+        # Check the endpoint before handing the request to a worker so invalid requests fail immediately
+        api_endpoint = self.apifootball._resolve_endpoint(endpoint=endpoint, custom_ids=custom_ids)
+        if as_model:
+            model_for(api_endpoint)
+
+        if not dryrun:
+            # Await an identical request already in flight without taking a worker. Shielded so cancelling this
+            # coroutine does not cancel the request for the other callers sharing it
+            future = self.apifootball._in_flight_future(api_endpoint, validate, validation_schema)
+            if future is not None:
+                data = await asyncio.shield(asyncio.wrap_future(future))
+                return decode_response(api_endpoint, data) if as_model else data
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(
+            self.apifootball.get,
+            endpoint=endpoint,
+            dryrun=dryrun,
+            validate=validate,
+            validation_schema=validation_schema,
+            custom_ids=custom_ids,
+            use_cache=use_cache,
+            priority=priority,
+            as_model=as_model
+        ))
+
+    async def gather(
+            self,
+            requests: Iterable[Dict],
+            concurrency: Union[int, None] = None,
+            return_exceptions: bool = False
+    ) -> List[Union[Dict, None, BaseException]]:
+        """
+        Runs a batch of requests concurrently, returning the results in the order the requests were passed.
+        Each request is a dictionary of arguments to get, eg. {'endpoint': 'match', 'custom_ids': {'fixture_id': 1}}.
+
+        :param requests: The requests to make
+        :param concurrency: Maximum number of requests of this batch in flight at once, defaults to the class concurrency
+        :param return_exceptions: Return exceptions in place of the failed results rather than raising the first one
+
+        return: The results of each request in order
+        """
+        semaphore = asyncio.Semaphore(min(concurrency or self.concurrency, self.concurrency))
+
+        async def bounded_get(request: Dict):
+            async with semaphore:
+                return await self.get(**request)
+
+        return await asyncio.gather(
+            *(bounded_get(request) for request in requests),
+            return_exceptions=return_exceptions
+        )
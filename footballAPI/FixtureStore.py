@@ -0,0 +1,259 @@
+import logging
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from footballAPI.globals import FINISHED_STATUSES, SYNC_PENDING_DAYS
+
+# Column name, path within the fixture returned by the API and compact dtype of each stored column
+FIXTURE_COLUMNS: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("fixture_id", ("fixture_id",), "int32"),
+    ("league_id", ("league_id",), "int32"),
+    ("league.name", ("league", "name"), "category"),
+    ("league.country", ("league", "country"), "category"),
+    ("league.logo", ("league", "logo"), "category"),
+    ("league.flag", ("league", "flag"), "category"),
+    ("event_date", ("event_date",), "datetime64[ns, UTC]"),
+    ("event_timestamp", ("event_timestamp",), "int64"),
+    ("firstHalfStart", ("firstHalfStart",), "Int64"),
+    ("secondHalfStart", ("secondHalfStart",), "Int64"),
+    ("round", ("round",), "category"),
+    ("status", ("status",), "category"),
+    ("statusShort", ("statusShort",), "category"),
+    ("elapsed", ("elapsed",), "Int16"),
+    ("venue", ("venue",), "category"),
+    ("referee", ("referee",), "category"),
+    ("homeTeam.team_id", ("homeTeam", "team_id"), "int32"),
+    ("homeTeam.team_name", ("homeTeam", "team_name"), "category"),
+    ("homeTeam.logo", ("homeTeam", "logo"), "category"),
+    ("awayTeam.team_id", ("awayTeam", "team_id"), "int32"),
+    ("awayTeam.team_name", ("awayTeam", "team_name"), "category"),
+    ("awayTeam.logo", ("awayTeam", "logo"), "category"),
+    ("goalsHomeTeam", ("goalsHomeTeam",), "Int8"),
+    ("goalsAwayTeam", ("goalsAwayTeam",), "Int8"),
+    ("score.halftime", ("score", "halftime"), "category"),
+    ("score.fulltime", ("score", "fulltime"), "category"),
+    ("score.extratime", ("score", "extratime"), "category"),
+    ("score.penalty", ("score", "penalty"), "category"),
+]
+
+# Columns compared to detect whether a fixture has changed
+STATE_COLUMNS = ["statusShort", "goalsHomeTeam", "goalsAwayTeam", "event_timestamp"]
+
+
+class FixtureChanges(NamedTuple):
+    """
+    Fixtures changed by FixtureStore.add or FixtureStore.sync. previous holds the stored rows replaced by the change,
+    which is empty for fixtures not previously stored, and current the new rows.
+    """
+    previous: pd.DataFrame
+    current: pd.DataFrame
+
+
+def _value(fixture: Dict, path: Tuple[str, ...]):
+    """
+    Returns the value at path of a fixture, or None if any part of the path is missing.
+    """
+    for key in path:
+        if not isinstance(fixture, dict):
+            return None
+        fixture = fixture.get(key)
+    return fixture
+
+
+def _apply_dtypes(fixtures_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Casts each column of a fixtures Dataframe to its compact dtype.
+    """
+    dtypes = {}
+    for name, _, dtype in FIXTURE_COLUMNS:
+        if dtype.startswith("datetime64"):
+            fixtures_df[name] = pd.to_datetime(fixtures_df[name], utc=True)
+        dtypes[name] = dtype
+    return fixtures_df.astype(dtypes)
+
+
+def normalize_fixtures(fixtures_data: List[Dict]) -> pd.DataFrame:
+    """
+    Normalizes the fixtures returned by the API into a typed, compact Dataframe. Strings are stored as categoricals,
+    ids and goals as narrow integers and dates as datetime64. Nested fields are flattened, eg. homeTeam.team_name.
+    :param fixtures_data: The fixtures returned by the fixtures endpoints
+    :return: Dataframe with one row per fixture and the columns of FIXTURE_COLUMNS
+    """
+    fixtures_df = pd.DataFrame({
+        name: [_value(fixture, path) for fixture in fixtures_data]
+        for name, path, _ in FIXTURE_COLUMNS
+    })
+    return _apply_dtypes(fixtures_df)
+
+
+class FixtureStore:
+    def __init__(self, fixtures: Union[pd.DataFrame, None] = None):
+        """
+        Compact columnar store of fixtures from any number of leagues and seasons, which can be persisted to Parquet
+        or Arrow IPC files and memory-mapped back without calling the API.
+        The time each fixture last changed is kept in the updated_at column, see add.
+        :param fixtures: Dataframe of fixtures with the columns of FIXTURE_COLUMNS, eg. from normalize_fixtures
+        """
+        if fixtures is None:
+            fixtures = normalize_fixtures([])
+        if "updated_at" not in fixtures.columns:
+            fixtures = _apply_dtypes(fixtures.assign(updated_at=pd.Timestamp.now(tz="UTC")))
+        self.fixtures = fixtures
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_api(cls, fixtures_data: List[Dict]) -> "FixtureStore":
+        """
+        Builds a store from the fixtures returned by the API.
+        :param fixtures_data: The fixtures returned by the fixtures endpoints, eg. data["api"]["fixtures"]
+        :return: The store
+        """
+        return cls(normalize_fixtures(fixtures_data))
+
+    def add(self, fixtures_data: List[Dict]) -> FixtureChanges:
+        """
+        Adds fixtures returned by the API to the store, replacing any fixtures already stored with the same fixture_id.
+        A fixture is changed if it is new or any of its STATE_COLUMNS differ from the stored fixture, and its
+        updated_at is set to the current time.
+        :param fixtures_data: The fixtures returned by the fixtures endpoints
+        :return: The previous and current rows of the changed fixtures
+        """
+        new_df = normalize_fixtures(fixtures_data).drop_duplicates(subset="fixture_id", keep="last")
+        replaced = self.fixtures["fixture_id"].isin(new_df["fixture_id"])
+        previous_df = self.fixtures[replaced]
+
+        previous_state = {
+            row[0]: row[1:] for row in
+            previous_df[["fixture_id"] + STATE_COLUMNS].astype(object).where(previous_df.notna(), None)
+            .itertuples(index=False, name=None)
+        }
+        previous_updated_at = dict(zip(previous_df["fixture_id"], previous_df["updated_at"]))
+        changed = []
+        updated_at = []
+        now = pd.Timestamp.now(tz="UTC")
+        for row in new_df[["fixture_id"] + STATE_COLUMNS].astype(object).where(new_df.notna(), None) \
+                .itertuples(index=False, name=None):
+            is_changed = previous_state.get(row[0]) != row[1:]
+            changed.append(is_changed)
+            updated_at.append(now if is_changed else previous_updated_at[row[0]])
+        new_df = new_df.assign(updated_at=pd.to_datetime(updated_at, utc=True))
+
+        self.fixtures = _apply_dtypes(
+            pd.concat([self.fixtures[~replaced], new_df], ignore_index=True)
+        )
+        current_df = new_df[np.array(changed, dtype=bool)].reset_index(drop=True)
+        previous_df = previous_df[previous_df["fixture_id"].isin(current_df["fixture_id"])].reset_index(drop=True)
+        return FixtureChanges(previous=previous_df, current=current_df)
+
+    def sync(
+            self,
+            apifootball,
+            league_id: int,
+            as_of: Union[pd.Timestamp, None] = None,
+            full_refresh: bool = False,
+            pending_days: Union[int, None] = SYNC_PENDING_DAYS
+    ) -> FixtureChanges:
+        """
+        Incrementally refreshes the fixtures of a league. Rather than fetching every fixture of the league, only the
+        dates of stored fixtures which have not finished and are scheduled on or before as_of, and no more than
+        pending_days before it, are fetched and the fixtures which changed are merged into the store. A league which
+        is not yet stored is fetched in full. Fixtures rescheduled to a new date, or postponed and left on a date
+        older than pending_days, are only picked up once their new date is fetched, or by a full_refresh.
+        :param apifootball: The APIFootball used to fetch fixtures
+        :param league_id: The league_id to refresh
+        :param as_of: Time up to which fixtures may have changed, defaults to now
+        :param full_refresh: Fetch every fixture of the league
+        :param pending_days: Days after its date that a fixture which has not finished is still fetched, None for
+            no limit, see SYNC_PENDING_DAYS
+        :return: The previous and current rows of the changed fixtures
+        """
+        league_df = self.league(league_id)
+        if full_refresh or league_df.empty:
+            fixtures = apifootball.get(endpoint="league_fixtures", custom_ids={"league_id": league_id}, use_cache=False)
+            return self.add(fixtures["api"]["fixtures"])
+
+        as_of = pd.Timestamp.now(tz="UTC") if as_of is None else pd.Timestamp(as_of)
+        if as_of.tzinfo is None:
+            as_of = as_of.tz_localize("UTC")
+        pending = ~league_df["statusShort"].isin(FINISHED_STATUSES) & (league_df["event_date"] <= as_of)
+        if pending_days is not None:
+            pending &= league_df["event_date"] >= as_of - pd.Timedelta(days=pending_days)
+        pending = league_df[pending]
+        dates = sorted(pending["event_date"].dt.tz_convert("UTC").dt.strftime("%Y-%m-%d").unique())
+        self.logger.info(f"Syncing {len(dates)} date(s) of league {league_id}.")
+
+        results = apifootball.get_many(
+            endpoints=["league_fixtures_date"] * len(dates),
+            custom_ids_list=[{"league_id": league_id, "date": date} for date in dates],
+            use_cache=False
+        )
+        fixtures_data = []
+        for result in results:
+            if result.error is not None:
+                # The fixtures of this date are still pending so will be fetched again on the next sync
+                self.logger.error(f"Failed to sync {result.custom_ids}: {result.error}")
+                continue
+            fixtures_data.extend(result.data["api"]["fixtures"])
+        return self.add(fixtures_data)
+
+    def league(self, league_id: int) -> pd.DataFrame:
+        """
+        Returns the fixtures of a league.
+        :param league_id: The league_id, unique to a league and season
+        :return: Dataframe of the fixtures of the league
+        """
+        return self.fixtures[self.fixtures["league_id"] == league_id].reset_index(drop=True)
+
+    def ft_fixtures(self, league_id: Union[int, None] = None) -> pd.DataFrame:
+        """
+        Returns the finished fixtures of the store, or of a single league.
+        :param league_id: The league_id to filter on, defaults to all leagues
+        :return: Dataframe of finished fixtures
+        """
+        fixtures_df = self.fixtures if league_id is None else self.league(league_id)
+        return fixtures_df[fixtures_df["statusShort"] == "FT"].reset_index(drop=True)
+
+    def to_parquet(self, path: str):
+        """
+        Writes the store to a Parquet file. Requires pyarrow.
+        :param path: Path of the file
+        """
+        self.fixtures.to_parquet(path, engine="pyarrow", index=False)
+
+    @classmethod
+    def read_parquet(cls, path: str) -> "FixtureStore":
+        """
+        Reads a store written with to_parquet, memory-mapping the file. Requires pyarrow.
+        :param path: Path of the file
+        :return: The store
+        """
+        import pyarrow.parquet as pq
+
+        return cls(_apply_dtypes(pq.read_table(path, memory_map=True).to_pandas()))
+
+    def to_arrow(self, path: str):
+        """
+        Writes the store to an Arrow IPC file, which can be memory-mapped back without copying. Requires pyarrow.
+        :param path: Path of the file
+        """
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(self.fixtures, preserve_index=False)
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @classmethod
+    def read_arrow(cls, path: str) -> "FixtureStore":
+        """
+        Reads a store written with to_arrow, memory-mapping the file. Requires pyarrow.
+        :param path: Path of the file
+        :return: The store
+        """
+        import pyarrow as pa
+
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        return cls(_apply_dtypes(table.to_pandas()))
@@ -0,0 +1,181 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict
+
+# Phases timed for every request made through APIFootball.get, in the order they run
+# Calls sharing the request of an identical call already in flight spend their time in the flight phase instead
+REQUEST_PHASES = ["cache", "flight", "queue", "payload", "network", "credits", "decode", "validation"]
+
+
+class RequestMetrics:
+    """
+    Metrics of a single call to APIFootball.get, passed to every registered metrics hook once the call completes.
+
+    :param endpoint: The endpoint requested, eg. fixtures/league/2
+    """
+    __slots__ = (
+        "endpoint", "timings", "cache_hit", "revalidated", "shared", "status_code", "bytes_received", "retries",
+        "credits_used", "credits_available", "error"
+    )
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        # Seconds spent in each of REQUEST_PHASES, phases which did not run are missing
+        self.timings: Dict[str, float] = {}
+        self.cache_hit = False
+        # True if an expired cached response was confirmed current by a 304 response
+        self.revalidated = False
+        # True if the call shared the request of an identical call already in flight
+        self.shared = False
+        self.status_code = None
+        self.bytes_received = 0
+        self.retries = 0
+        self.credits_used = 0
+        self.credits_available = None
+        self.error = None
+
+    @property
+    def core_endpoint(self) -> str:
+        """
+        The base endpoint of the request, eg. fixtures for fixtures/league/2, used to keep metric labels bounded.
+        """
+        return self.endpoint.split('/')[0]
+
+    @property
+    def total(self) -> float:
+        """
+        Total seconds spent in all timed phases.
+        """
+        return sum(self.timings.values())
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Times the enclosed block, adding the elapsed time to timings[name].
+
+        :param name: The phase, one of REQUEST_PHASES
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def record_response(self, resp):
+        """
+        Records the status code, size and retries of a response. The size is the Content-Length as sent, which is
+        the compressed size of compressed responses, falling back to the decoded size once the body has been read.
+
+        :param resp: The response of the request
+        """
+        self.status_code = resp.status_code
+        content_length = resp.headers.get("Content-Length")
+        if content_length is not None:
+            self.bytes_received = int(content_length)
+        elif resp._content_consumed:
+            self.bytes_received = len(resp.content)
+        retries = getattr(resp.raw, "retries", None)
+        self.retries = len(retries.history) if retries is not None else 0
+
+    def __repr__(self):
+        timings = ", ".join(f"{name}={seconds * 1000:.2f}ms" for name, seconds in self.timings.items())
+        return f"RequestMetrics({self.endpoint}, cache_hit={self.cache_hit}, {timings})"
+
+
+class _NullMetrics:
+    """
+    Stand-in for RequestMetrics used when no metrics hooks are registered, so requests pay no timing overhead.
+    """
+    __slots__ = ()
+    _context = nullcontext()
+
+    def phase(self, name: str):
+        return self._context
+
+    def record_response(self, resp):
+        return
+
+    def __setattr__(self, name, value):
+        return
+
+
+NULL_METRICS = _NullMetrics()
+
+
+class PrometheusMetrics:
+    def __init__(
+            self,
+            registry=None,
+            namespace: str = "footballapi"
+    ):
+        """
+        Metrics hook exporting RequestMetrics to a prometheus_client registry, labelled by the base endpoint.
+        Register with APIFootball(metrics_hooks=[PrometheusMetrics()]) and expose the registry as usual, eg. with
+        prometheus_client.start_http_server. Requires prometheus_client.
+
+        Exports:
+            <namespace>_requests_total: Counter of calls by endpoint and outcome, one of hit, revalidated, shared, ok
+                or error
+            <namespace>_request_phase_seconds: Histogram of the time spent in each phase by endpoint and phase
+            <namespace>_response_bytes_total: Counter of response bytes received by endpoint
+            <namespace>_retries_total: Counter of retries by endpoint
+            <namespace>_credits_used_total: Counter of credits used by endpoint
+            <namespace>_credits_available: Gauge of the credits available after the latest request
+
+        :param registry: The registry to register metrics with, defaults to the prometheus_client default registry
+        :param namespace: Prefix of every metric name
+        """
+        try:
+            import prometheus_client
+        except ImportError:
+            raise ImportError("prometheus_client must be installed to use PrometheusMetrics.")
+
+        registry = prometheus_client.REGISTRY if registry is None else registry
+        self.requests = prometheus_client.Counter(
+            "requests", "Calls to APIFootball.get.", ["endpoint", "outcome"],
+            namespace=namespace, registry=registry
+        )
+        self.phase_seconds = prometheus_client.Histogram(
+            "request_phase_seconds", "Seconds spent in each phase of APIFootball.get.", ["endpoint", "phase"],
+            namespace=namespace, registry=registry
+        )
+        self.response_bytes = prometheus_client.Counter(
+            "response_bytes", "Response bytes received from the API.", ["endpoint"],
+            namespace=namespace, registry=registry
+        )
+        self.retries = prometheus_client.Counter(
+            "retries", "Retries of requests to the API.", ["endpoint"],
+            namespace=namespace, registry=registry
+        )
+        self.credits_used = prometheus_client.Counter(
+            "credits_used", "Credits used by requests to the API.", ["endpoint"],
+            namespace=namespace, registry=registry
+        )
+        self.credits_available = prometheus_client.Gauge(
+            "credits_available", "Credits available after the latest request.",
+            namespace=namespace, registry=registry
+        )
+
+    def __call__(self, metrics: RequestMetrics):
+        endpoint = metrics.core_endpoint
+        if metrics.error is not None:
+            outcome = "error"
+        elif metrics.cache_hit:
+            outcome = "hit"
+        elif metrics.revalidated:
+            outcome = "revalidated"
+        elif metrics.shared:
+            outcome = "shared"
+        else:
+            outcome = "ok"
+        self.requests.labels(endpoint, outcome).inc()
+        for phase, seconds in metrics.timings.items():
+            self.phase_seconds.labels(endpoint, phase).observe(seconds)
+        if metrics.bytes_received:
+            self.response_bytes.labels(endpoint).inc(metrics.bytes_received)
+        if metrics.retries:
+            self.retries.labels(endpoint).inc(metrics.retries)
+        if metrics.credits_used:
+            self.credits_used.labels(endpoint).inc(metrics.credits_used)
+        if metrics.credits_available is not None:
+            self.credits_available.set(metrics.credits_available)
@@ -1,10 +1,100 @@
 from datetime import datetime, date
-from typing import Dict, Union
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from footballAPI import APIFootball
+from footballAPI.FixtureStore import FixtureChanges, FixtureStore, normalize_fixtures
+from footballAPI.globals import DEFAULT_TIEBREAKERS, LEAGUE_TIEBREAKERS, TIEBREAK_CRITERIA
+
+# Columns of LeagueTable.extended_table
+EXTENDED_COLUMNS = [
+    "POS", "TEAM", "PL", "W", "D", "L", "GF", "GA", "GD", "PTS",
+    "HOME_W", "HOME_D", "HOME_L", "HOME_GF", "HOME_GA", "HOME_PTS",
+    "AWAY_W", "AWAY_D", "AWAY_L", "AWAY_GF", "AWAY_GA", "AWAY_PTS",
+    "FORM",
+]
+
+# Results of the team-match rows of extended_table, indexed by outcome 0: win, 1: draw, 2: loss
+_OUTCOMES = np.array(["W", "D", "L"])
+
+
+def calculate_points(
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        points: Tuple[int, int, int] = (3, 1, 0)
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the points earned by the home and away teams of every fixture at once from the goals scored.
+    :param home_goals: Goals scored by the home team of each fixture
+    :param away_goals: Goals scored by the away team of each fixture
+    :param points: Points for a win, draw and loss
+    :return: Arrays of home points and away points for each fixture
+    """
+    win, draw, loss = points
+    # Index 0: home win, 1: draw, 2: away win
+    outcome = 1 - np.sign(np.asarray(home_goals) - np.asarray(away_goals)).astype(np.int64)
+    home_points = np.array([win, draw, loss], dtype=np.int64)[outcome]
+    away_points = np.array([loss, draw, win], dtype=np.int64)[outcome]
+    return home_points, away_points
+
+
+def team_results(
+        home_idx: np.ndarray,
+        away_idx: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        points: Tuple[int, int, int] = (3, 1, 0)
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Splits fixtures into one row per team and fixture, home rows first, so every statistic of a table is one pass.
+    :param home_idx: Index of the home team of each fixture
+    :param away_idx: Index of the away team of each fixture
+    :param home_goals: Goals scored by the home team of each fixture
+    :param away_goals: Goals scored by the away team of each fixture
+    :param points: Points for a win, draw and loss
+    :return: The team of each row, whether it is away (0 home, 1 away), and the stats of each row with columns
+        W, D, L, GF, GA, PTS
+    """
+    home_points, away_points = calculate_points(home_goals, away_goals, points=points)
+    goals_for = np.concatenate([home_goals, away_goals])
+    goals_against = np.concatenate([away_goals, home_goals])
+    outcome = 1 - np.sign(goals_for - goals_against)
+    stats = np.column_stack([
+        outcome == 0, outcome == 1, outcome == 2, goals_for, goals_against, np.concatenate([home_points, away_points])
+    ]).astype(np.int64)
+    team = np.concatenate([home_idx, away_idx])
+    venue = np.repeat([0, 1], len(home_idx))
+    return team, venue, stats
+
+
+def find_league_id(leagues: List[Dict], country: str, league: str, season: int) -> Union[int, None]:
+    """
+    Finds the league_id of a league and season from the data of the leagues endpoint.
+    :param leagues: The leagues returned by the leagues endpoint
+    :param country: Name of the country
+    :param league: Name of the league
+    :param season: Starting year of the season
+    :return: The league_id, or None if not found
+    """
+    league_id = None
+    for candidate in leagues:
+        if (candidate["country"].upper() == country.upper()) & \
+                (candidate["name"].upper() == league.upper()) & \
+                (candidate["season"] == season):
+            league_id = candidate["league_id"]
+    return league_id
+
+
+def normalize_ft_fixtures(fixtures_data: List[Dict]) -> pd.DataFrame:
+    """
+    Normalizes the fixtures returned by the API into a typed, compact Dataframe and keeps only games that are finished.
+    :param fixtures_data: The fixtures returned by the fixtures endpoints
+    :return: Dataframe of finished fixtures, see FixtureStore.normalize_fixtures
+    """
+    fixtures_df = normalize_fixtures(fixtures_data)
+    return fixtures_df[fixtures_df["statusShort"] == "FT"].reset_index(drop=True)
 
 
 class LeagueTable:
@@ -12,34 +102,41 @@ class LeagueTable:
             self,
             country: str,
             league: str,
-            season: int
+            season: int,
+            apifootball: Union[APIFootball, None] = None,
+            points: Tuple[int, int, int] = (3, 1, 0),
+            fixture_store: Union[FixtureStore, None] = None
     ):
         """
         Tool to build the league table at a given point in time for any league and season from football-api
         :param country: Name of the country desired (see countries endpoint for full list)
         :param league_name: Name of the league desired
         :param season: Starting year of the desired season, eg. for 2015/16 season use 2015
+        :param apifootball: An existing APIFootball to use, eg. one sharing a response cache between tables
+        :param points: Points for a win, draw and loss, eg. (2, 1, 0) for two points for a win
+        :param fixture_store: A FixtureStore holding the fixtures of the league, which are fetched if not present
+
+        The tiebreakers of the league are taken from LEAGUE_TIEBREAKERS, defaulting to DEFAULT_TIEBREAKERS, and can be
+        changed through the tiebreakers attribute.
         """
-        self.apifootball = APIFootball()
+        self.apifootball = apifootball or APIFootball()
+        self.fixture_store = fixture_store if fixture_store is not None else FixtureStore()
         self.country = country.upper()
         self.league = league.upper()
         self.season = season
+        self.points = points
+        self.tiebreakers = LEAGUE_TIEBREAKERS.get((self.country, self.league), DEFAULT_TIEBREAKERS)
         self._set_league_id()
         self._set_league_ft_fixtures()
         self.earliest_match = self.ft_fixtures["event_date"].dt.date.min()
+        self._build_standings_index()
 
     def _set_league_id(self):
         """
         Obtains the league_id from the leagues endpoint using the provided class inputs.
         """
         all_leagues = self.apifootball.get(endpoint="leagues")
-        for league in all_leagues["api"]["leagues"]:
-            if (league["country"].upper() == self.country) & \
-                    (league["name"].upper() == self.league) & \
-                    (league["season"] == self.season):
-                self.league_id = league["league_id"]
-            else:
-                continue
+        self.league_id = find_league_id(all_leagues["api"]["leagues"], self.country, self.league, self.season)
         if not self.league_id:
             raise ValueError("league_id not found, please check input parameters")
         else:
@@ -50,87 +147,270 @@ class LeagueTable:
         Obtains the league fixtures for a given country, league_name and season (starting year).
         Only returns games that are finished.
         """
-        fixtures = self.apifootball.get(endpoint="league_fixtures", custom_ids={"league_id": self.league_id})
-        fixtures_data = fixtures['api']['fixtures']
-        fixtures_df = pd.json_normalize(fixtures_data)
-        self.ft_fixtures = fixtures_df.loc[fixtures_df["statusShort"] == "FT"]
-        self.ft_fixtures["event_date"] = pd.to_datetime(self.ft_fixtures["event_date"])
+        if self.fixture_store.league(self.league_id).empty:
+            fixtures = self.apifootball.get(endpoint="league_fixtures", custom_ids={"league_id": self.league_id})
+            self.fixture_store.add(fixtures['api']['fixtures'])
+        self.ft_fixtures = self.fixture_store.ft_fixtures(self.league_id)
         if self.ft_fixtures.empty:
             raise ValueError("No fixtures found")
         return
 
-    @staticmethod
-    def _determine_points(fixture_id: int, home_goals: int, away_goals: int) -> Dict[str, int]:
+    def _build_standings_index(self):
+        """
+        Builds the cumulative standings index of the season. Fixtures are sorted by date and the running totals of
+        PTS, GF, GA and PL of every team are kept after each fixture, so the table at any date is a binary search on
+        the fixture dates and a slice of the totals.
+        """
+        self.ft_fixtures = self.ft_fixtures.sort_values("event_date", kind="mergesort").reset_index(drop=True)
+        self._index_teams = np.unique(np.concatenate([
+            self.ft_fixtures["homeTeam.team_name"].to_numpy(),
+            self.ft_fixtures["awayTeam.team_name"].to_numpy()
+        ]))
+        self._index_days, deltas = self._standings_deltas(self.ft_fixtures)
+        self._index_totals = deltas.cumsum(axis=1)
+
+    def _standings_deltas(self, fixtures_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculates how many points each team earns in a given fixture
-        :param fixture_id: Fixture ID used for joining points back to results dataframe
-        :param home_goals: Number of goals scored by the home team
-        :param away_goals: Number of goals scored by the away team
-        :return: Dictionary containing fixture_id, home_points and away_points to create new columns
+        Calculates the change to the totals of every team of the standings index from each fixture.
+        :param fixtures_df: Finished fixtures in date order, whose teams are all in the standings index
+        :return: Day of each fixture, and the deltas with axis 0 PTS, GF, GA, PL, axis 1 each fixture and axis 2 each team
         """
-        if home_goals == away_goals:
-            return {"fixture_id": fixture_id, "home_points": 1, "away_points": 1}
+        event_dates = fixtures_df["event_date"]
+        if event_dates.dt.tz is not None:
+            event_dates = event_dates.dt.tz_convert("UTC").dt.tz_localize(None)
+        days = event_dates.dt.floor("D").to_numpy().astype("datetime64[D]")
+
+        home_idx = np.searchsorted(self._index_teams, fixtures_df["homeTeam.team_name"].to_numpy())
+        away_idx = np.searchsorted(self._index_teams, fixtures_df["awayTeam.team_name"].to_numpy())
+
+        home_goals = fixtures_df["goalsHomeTeam"].to_numpy().astype(np.int64)
+        away_goals = fixtures_df["goalsAwayTeam"].to_numpy().astype(np.int64)
+        home_points, away_points = calculate_points(home_goals, away_goals, points=self.points)
+
+        fixtures = np.arange(len(fixtures_df))
+        deltas = np.zeros((4, len(fixtures_df), len(self._index_teams)), dtype=np.int64)
+        deltas[:, fixtures, home_idx] = [home_points, home_goals, away_goals, np.ones_like(home_goals)]
+        deltas[:, fixtures, away_idx] = [away_points, away_goals, home_goals, np.ones_like(away_goals)]
+        return days, deltas
+
+    def refresh(self, as_of: Union[datetime, None] = None, full_refresh: bool = False) -> FixtureChanges:
+        """
+        Incrementally refreshes the fixtures of the league, see FixtureStore.sync, and updates the standings.
+        Fixtures finished after the last indexed fixture are appended to the standings index, any other change
+        rebuilds the index from the stored fixtures.
+        :param as_of: Time up to which fixtures may have changed, defaults to now
+        :param full_refresh: Fetch every fixture of the league
+        :return: The previous and current rows of the changed fixtures
+        """
+        changes = self.fixture_store.sync(self.apifootball, self.league_id, as_of=as_of, full_refresh=full_refresh)
+        new_ft = changes.current[changes.current["statusShort"] == "FT"] \
+            .sort_values("event_date", kind="mergesort").reset_index(drop=True)
+        if new_ft.empty and not (changes.previous["statusShort"] == "FT").any():
+            return changes
+
+        new_teams = np.concatenate([
+            new_ft["homeTeam.team_name"].to_numpy(),
+            new_ft["awayTeam.team_name"].to_numpy()
+        ])
+        appendable = not (changes.previous["statusShort"] == "FT").any() and \
+            np.isin(new_teams, self._index_teams).all() and \
+            new_ft["event_date"].min() >= self.ft_fixtures["event_date"].max()
+
+        if appendable:
+            days, deltas = self._standings_deltas(new_ft)
+            self._index_days = np.concatenate([self._index_days, days])
+            self._index_totals = np.concatenate(
+                [self._index_totals, self._index_totals[:, -1:] + deltas.cumsum(axis=1)], axis=1
+            )
+            self.ft_fixtures = self.fixture_store.ft_fixtures(self.league_id) \
+                .sort_values("event_date", kind="mergesort").reset_index(drop=True)
         else:
-            winner = "home_points" if home_goals > away_goals else "away_points"
-            loser = "away_points" if home_goals > away_goals else "home_points"
-            return {"fixture_id": fixture_id, winner: 3, loser: 0}
+            self.ft_fixtures = self.fixture_store.ft_fixtures(self.league_id)
+            self._build_standings_index()
+        self.earliest_match = self.ft_fixtures["event_date"].dt.date.min()
+        return changes
+
+    def _standings_position(self, as_of: Union[datetime, date, None]) -> int:
+        """
+        Finds the position in the standings index of the last fixture played on or before as_of.
+        :param as_of: Date to return league table for, inclusive. None for the latest fixture
+        :return: Position of the last fixture played in the standings index
+        """
+        if as_of is None:
+            return len(self._index_days) - 1
+        as_of_date = as_of.date() if isinstance(as_of, datetime) else as_of
+        if self.earliest_match > as_of_date:
+            raise ValueError(
+                f"No results earlier than as_of date. Earliest date is {self.earliest_match}"
+            )
+        return int(np.searchsorted(self._index_days, np.datetime64(as_of_date, "D"), side="right")) - 1
 
     @staticmethod
-    def _get_all_results(results_df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Combines home and away results for each team into one Dataframe.
-        :param results_df: Dataframe containing home and away results
-        :return: Unioned dataframe containing home and away results
-        """
-        points_df = results_df.copy()
-        home_df = points_df.rename(columns={
-            "homeTeam.team_name": "TEAM",
-            "home_points": "PTS",
-            "goalsHomeTeam": "GF",
-            "goalsAwayTeam": "GA"
-        })[["TEAM", "PTS", "GF", "GA"]]
-        away_df = points_df.rename(columns={
-            "awayTeam.team_name": "TEAM",
-            "away_points": "PTS",
-            "goalsAwayTeam": "GF",
-            "goalsHomeTeam": "GA"
-        })[["TEAM", "PTS", "GF", "GA"]]
-        return pd.concat([home_df, away_df])
-
-    def _add_points(self, results_df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Adds home_points and away_points columns to results_df.
-        :param results_df: Dataframe containing results data.
-        :return: Dataframe with home and away points columns for each fixture added.
-        """
-        points_df = results_df.apply(
-            lambda row: pd.Series(self._determine_points(
-                fixture_id=row["fixture_id"],
-                home_goals=row["goalsHomeTeam"],
-                away_goals=row["goalsAwayTeam"]
-            )), axis=1
+    def _format_table(table_df: pd.DataFrame, group_cols: Union[list, None] = None) -> pd.DataFrame:
+        """
+        Orders a table of team totals and adds GD and POS, ranking within each group if group_cols are given.
+        :param table_df: Dataframe containing TEAM, PTS, GF, GA and PL for each team
+        :param group_cols: Columns identifying each separate table, eg. DATE
+        :return: Ordered league table
+        """
+        group_cols = group_cols or []
+        table_df = table_df.assign(GD=table_df["GF"] - table_df["GA"])
+        table_df = table_df.sort_values(
+            group_cols + ["PTS", "GD", "GF"],
+            ascending=[True] * len(group_cols) + [False] * 3,
+            kind="mergesort"
         )
-        return results_df.merge(points_df, how="inner", on="fixture_id")
+        if group_cols:
+            positions = table_df.groupby(group_cols).cumcount().to_numpy() + 1
+        else:
+            positions = np.arange(1, len(table_df) + 1)
+        table_df.insert(len(group_cols), "POS", positions)
+        return table_df[group_cols + ["POS", "TEAM", "PTS", "GF", "GA", "GD", "PL"]].reset_index(drop=True)
 
-    def league_table(self, as_of: Union[datetime, date] = datetime.now()) -> pd.DataFrame:
+    def league_table(self, as_of: Union[datetime, date, None] = None) -> pd.DataFrame:
         """
-        Builds the league table at a given point in time.
-        :param as_of: Date to return league table for, inclusive.
+        Builds the league table at a given point in time from the standings index.
+        :param as_of: Date to return league table for, inclusive. Defaults to all finished fixtures
         :return: Ordered league table as of given date
         """
-        if self.earliest_match > as_of.date():
-            raise ValueError(
-                f"No results earlier than as_of date. Earliest date is {self.earliest_match}"
-            )
-        points_df = self._add_points(self.ft_fixtures)
-        all_results_df = self._get_all_results(points_df)
-
-        aggregated_points_df = all_results_df.groupby("TEAM").sum().reset_index()
-        aggregated_points_df["GD"] = aggregated_points_df["GF"] - aggregated_points_df["GA"]
-
-        matches_played = all_results_df.groupby("TEAM").size().reset_index(name="PL")
-        final_table_df = aggregated_points_df.merge(matches_played, how="inner", on="TEAM") \
-            .sort_values(["PTS", "GD", "GF"], ascending=False)
-        final_table_df.index = np.arange(1, len(final_table_df) + 1)
-        final_table_df.index.names = ["POS"]
-        return final_table_df.reset_index()
+        position = self._standings_position(as_of)
+        points, goals_for, goals_against, played = self._index_totals[:, position]
+        table_df = pd.DataFrame({
+            "TEAM": self._index_teams,
+            "PTS": points,
+            "GF": goals_for,
+            "GA": goals_against,
+            "PL": played
+        })
+        return self._format_table(table_df[table_df["PL"] > 0])
+
+    def tables_by_matchday(self) -> pd.DataFrame:
+        """
+        Builds the league table after every matchday of the season in one pass. A matchday is each date on which at
+        least one fixture was finished.
+        :return: Ordered league tables for each matchday, identified by the DATE column
+        """
+        days, last_fixture = np.unique(self._index_days[::-1], return_index=True)
+        positions = len(self._index_days) - 1 - last_fixture
+        totals = self._index_totals[:, positions]
+        table_df = pd.DataFrame({
+            "DATE": np.repeat(days, len(self._index_teams)),
+            "TEAM": np.tile(self._index_teams, len(days)),
+            "PTS": totals[0].ravel(),
+            "GF": totals[1].ravel(),
+            "GA": totals[2].ravel(),
+            "PL": totals[3].ravel()
+        })
+        return self._format_table(table_df[table_df["PL"] > 0], group_cols=["DATE"])
+
+    def extended_table(
+            self,
+            as_of: Union[datetime, date, None] = None,
+            tiebreakers: Union[List[str], None] = None,
+            form_length: int = 5
+    ) -> pd.DataFrame:
+        """
+        Builds the league table at a given point in time with wins, draws and losses, home and away splits and the
+        form of each team, ordered by points then the tiebreakers of the league.
+        Every statistic is accumulated in one pass over the fixtures. Head-to-head tiebreakers are only resolved for
+        teams level on points, from a mini-table of the fixtures between them.
+        :param as_of: Date to return league table for, inclusive. Defaults to all finished fixtures
+        :param tiebreakers: Criteria from TIEBREAK_CRITERIA applied in order to teams level on points, defaults to the
+            tiebreakers attribute. Teams still level are ordered by name
+        :param form_length: Number of most recent results in FORM, eg. WWDLW with the latest result last
+        :return: Ordered league table with the columns of EXTENDED_COLUMNS
+        """
+        tiebreakers = self.tiebreakers if tiebreakers is None else tiebreakers
+        for criterion in tiebreakers:
+            if criterion not in TIEBREAK_CRITERIA:
+                raise ValueError(f"{criterion} is not a valid tiebreaker.")
+
+        fixtures_df = self.ft_fixtures.iloc[:self._standings_position(as_of) + 1]
+        home_idx = np.searchsorted(self._index_teams, fixtures_df["homeTeam.team_name"].to_numpy())
+        away_idx = np.searchsorted(self._index_teams, fixtures_df["awayTeam.team_name"].to_numpy())
+        home_goals = fixtures_df["goalsHomeTeam"].to_numpy().astype(np.int64)
+        away_goals = fixtures_df["goalsAwayTeam"].to_numpy().astype(np.int64)
+        team, venue, stats = team_results(home_idx, away_idx, home_goals, away_goals, points=self.points)
+
+        n_teams = len(self._index_teams)
+        # Axis 0 each team, axis 1 home then away, axis 2 W, D, L, GF, GA, PTS
+        totals = np.zeros((n_teams * 2, stats.shape[1]), dtype=np.int64)
+        np.add.at(totals, team * 2 + venue, stats)
+        totals = totals.reshape(n_teams, 2, stats.shape[1])
+        overall = totals.sum(axis=1)
+
+        columns = {"TEAM": self._index_teams, "PL": overall[:, :3].sum(axis=1)}
+        for i, stat in enumerate(["W", "D", "L", "GF", "GA"]):
+            columns[stat] = overall[:, i]
+        columns["GD"] = overall[:, 3] - overall[:, 4]
+        columns["PTS"] = overall[:, 5]
+        for side, prefix in enumerate(["HOME_", "AWAY_"]):
+            for i, stat in enumerate(["W", "D", "L", "GF", "GA", "PTS"]):
+                columns[prefix + stat] = totals[:, side, i]
+        columns["FORM"] = self._form(team, stats, n_teams, form_length)
+        table_df = pd.DataFrame(columns)
+
+        if any(criterion.startswith("H2H_") for criterion in tiebreakers):
+            h2h = self._head_to_head(columns["PTS"], home_idx, away_idx, home_goals, away_goals)
+            table_df = table_df.assign(H2H_PTS=h2h[:, 0], H2H_GD=h2h[:, 1], H2H_GF=h2h[:, 2])
+
+        table_df = table_df[table_df["PL"] > 0]
+        # Sorted by the least significant key first, so ties on every criterion are left in order of TEAM
+        order = np.lexsort(
+            [table_df[criterion].to_numpy() * -1 for criterion in reversed(tiebreakers)] + [-table_df["PTS"].to_numpy()]
+        )
+        table_df = table_df.iloc[order]
+        table_df.insert(0, "POS", np.arange(1, len(table_df) + 1))
+        return table_df[EXTENDED_COLUMNS].reset_index(drop=True)
+
+    @staticmethod
+    def _form(team: np.ndarray, stats: np.ndarray, n_teams: int, form_length: int) -> np.ndarray:
+        """
+        Builds the form of each team from its most recent results.
+        :param team: The team of each row of team_results, in date order within home and away rows
+        :param stats: The stats of each row of team_results
+        :param n_teams: Number of teams
+        :param form_length: Number of most recent results
+        :return: The form of each team, eg. WWDLW with the latest result last
+        """
+        n_fixtures = len(team) // 2
+        # Rows of each team in date order, home and away rows of the same fixture share its position
+        rows = np.lexsort([np.tile(np.arange(n_fixtures), 2), team])
+        counts = np.bincount(team, minlength=n_teams)
+        ends = np.cumsum(counts)
+        rank_from_end = ends[team[rows]] - np.arange(len(rows))
+        recent = rows[rank_from_end <= form_length]
+        outcomes = _OUTCOMES[np.argmax(stats[recent, :3], axis=1)]
+        return np.array(["".join(form) for form in np.split(outcomes, np.cumsum(np.minimum(counts, form_length))[:-1])])
+
+    def _head_to_head(
+            self,
+            points: np.ndarray,
+            home_idx: np.ndarray,
+            away_idx: np.ndarray,
+            home_goals: np.ndarray,
+            away_goals: np.ndarray
+    ) -> np.ndarray:
+        """
+        Resolves the head-to-head mini-table of every group of teams level on points, from the fixtures played
+        between the teams of each group. Teams which are not level with another team are left at zero.
+        :param points: Points of each team
+        :param home_idx: Index of the home team of each fixture
+        :param away_idx: Index of the away team of each fixture
+        :param home_goals: Goals scored by the home team of each fixture
+        :param away_goals: Goals scored by the away team of each fixture
+        :return: Array with axis 0 each team and axis 1 H2H_PTS, H2H_GD, H2H_GF
+        """
+        h2h = np.zeros((len(points), 3), dtype=np.int64)
+        _, group, group_sizes = np.unique(points, return_inverse=True, return_counts=True)
+        tied = group_sizes[group] > 1
+        if not tied.any():
+            return h2h
+
+        # Fixtures between two teams of the same group, only tied groups have more than one team
+        in_group = tied[home_idx] & (group[home_idx] == group[away_idx])
+        team, _, stats = team_results(
+            home_idx[in_group], away_idx[in_group], home_goals[in_group], away_goals[in_group], points=self.points
+        )
+        np.add.at(h2h, team, np.column_stack([stats[:, 5], stats[:, 3] - stats[:, 4], stats[:, 3]]))
+        return h2h
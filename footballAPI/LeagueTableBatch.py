@@ -0,0 +1,111 @@
+import logging
+from typing import Dict, Iterable, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from footballAPI import APIFootball
+from footballAPI.LeagueTable import LeagueTable, calculate_points, find_league_id, normalize_ft_fixtures
+
+
+class LeagueTableBatch:
+    def __init__(
+            self,
+            leagues: Iterable[Tuple[str, str, int]],
+            apifootball: Union[APIFootball, None] = None,
+            points: Tuple[int, int, int] = (3, 1, 0),
+            max_workers: Union[int, None] = None
+    ):
+        """
+        Builds the league tables of many leagues and seasons at once from football-api.
+        All league ids are resolved from a single call to the leagues endpoint, and the fixtures of every league are
+        fetched concurrently through one shared APIFootball.
+        :param leagues: (country, league, season) of each table desired, eg. ("England", "Premier League", 2015)
+        :param apifootball: An existing APIFootball to use
+        :param points: Points for a win, draw and loss
+        :param max_workers: Number of concurrent requests, defaults to the pool size of apifootball
+        """
+        self.apifootball = apifootball or APIFootball()
+        self.leagues = [(country.upper(), league.upper(), season) for country, league, season in leagues]
+        self.points = points
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+        self._set_league_ids()
+        self._set_ft_fixtures()
+
+    def _set_league_ids(self):
+        """
+        Obtains the league_id of every league and season from one call to the leagues endpoint.
+        """
+        all_leagues = self.apifootball.get(endpoint="leagues")["api"]["leagues"]
+        self.league_ids: Dict[Tuple[str, str, int], int] = {}
+        for country, league, season in self.leagues:
+            league_id = find_league_id(all_leagues, country, league, season)
+            if not league_id:
+                raise ValueError(f"league_id not found for {country} {league} {season}, please check input parameters")
+            self.league_ids[(country, league, season)] = league_id
+
+    def _set_ft_fixtures(self):
+        """
+        Obtains the finished fixtures of every league and season concurrently into one Dataframe, with the league_id
+        and season of each fixture. Leagues whose fixtures could not be fetched are logged and kept in errors.
+        """
+        keys = list(self.league_ids.keys())
+        results = self.apifootball.get_many(
+            endpoints=["league_fixtures"] * len(keys),
+            custom_ids_list=[{"league_id": self.league_ids[key]} for key in keys],
+            max_workers=self.max_workers
+        )
+
+        self.errors: Dict[Tuple[str, str, int], Exception] = {}
+        fixtures_dfs = []
+        for key, result in zip(keys, results):
+            if result.error is not None:
+                self.logger.error(f"Failed to fetch fixtures for {key}: {result.error}")
+                self.errors[key] = result.error
+                continue
+            fixtures_df = normalize_ft_fixtures(result.data["api"]["fixtures"])
+            if fixtures_df.empty:
+                continue
+            fixtures_dfs.append(fixtures_df.assign(league_id=self.league_ids[key], season=key[2]))
+
+        if not fixtures_dfs:
+            raise ValueError("No fixtures found")
+        self.ft_fixtures = pd.concat(fixtures_dfs, ignore_index=True)
+
+    def league_tables(self) -> pd.DataFrame:
+        """
+        Builds the final league table of every league and season in one grouped aggregation.
+        :return: Ordered league tables identified by the league_id and season columns
+        """
+        home_goals = self.ft_fixtures["goalsHomeTeam"].to_numpy().astype(np.int64)
+        away_goals = self.ft_fixtures["goalsAwayTeam"].to_numpy().astype(np.int64)
+        home_points, away_points = calculate_points(home_goals, away_goals, points=self.points)
+        keys = {
+            "league_id": self.ft_fixtures["league_id"].to_numpy(),
+            "season": self.ft_fixtures["season"].to_numpy()
+        }
+        all_results_df = pd.concat([
+            pd.DataFrame({
+                **keys,
+                "TEAM": self.ft_fixtures["homeTeam.team_name"].to_numpy(),
+                "PTS": home_points,
+                "GF": home_goals,
+                "GA": away_goals
+            }),
+            pd.DataFrame({
+                **keys,
+                "TEAM": self.ft_fixtures["awayTeam.team_name"].to_numpy(),
+                "PTS": away_points,
+                "GF": away_goals,
+                "GA": home_goals
+            })
+        ], ignore_index=True)
+
+        totals_df = all_results_df.groupby(["league_id", "season", "TEAM"], sort=True).agg(
+            PTS=("PTS", "sum"),
+            GF=("GF", "sum"),
+            GA=("GA", "sum"),
+            PL=("PTS", "size")
+        ).reset_index()
+        return LeagueTable._format_table(totals_df, group_cols=["league_id", "season"])
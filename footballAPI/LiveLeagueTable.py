@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from footballAPI.globals import FINISHED_STATUSES
+from footballAPI.LeagueTable import LeagueTable, calculate_points
+
+
+class LiveLeagueTable:
+    def __init__(
+            self,
+            league_table: LeagueTable,
+            poll_interval: float = 60,
+            callback: Union[Callable[[pd.DataFrame, List[int]], None], None] = None
+    ):
+        """
+        Live "as it stands" league table. fixtures/live is polled for the league through the client of league_table
+        and the current scores of fixtures in play are applied as provisional results on top of its finished fixtures.
+        When a score changes only the totals of the two teams of that fixture are updated.
+        :param league_table: The LeagueTable of the season, providing the client and the finished fixture standings
+        :param poll_interval: Seconds between each poll of fixtures/live
+        :param callback: Called with the updated table and the changed fixture_ids whenever the table changes
+        """
+        self.league_table = league_table
+        self.poll_interval = poll_interval
+        self.callback = callback
+        self.logger = logging.getLogger(__name__)
+        self._provisional: Dict[int, Tuple[str, str, int, int]] = {}
+        self._set_base_totals()
+
+    def _set_base_totals(self):
+        """
+        Sets the totals of every team from the finished fixtures of league_table, with provisional results applied.
+        """
+        points, goals_for, goals_against, played = self.league_table._index_totals[:, -1]
+        self._totals = pd.DataFrame({
+            "PTS": points,
+            "GF": goals_for,
+            "GA": goals_against,
+            "PL": played
+        }, index=pd.Index(self.league_table._index_teams, name="TEAM"))
+        for fixture_id, result in self._provisional.items():
+            self._apply_result(result, sign=1)
+
+    def _apply_result(self, result: Tuple[str, str, int, int], sign: int):
+        """
+        Adds, or removes with sign -1, the contribution of a result to the totals of its two teams.
+        :param result: Home team, away team, home goals and away goals
+        :param sign: 1 to add the result, -1 to remove it
+        """
+        home_team, away_team, home_goals, away_goals = result
+        home_points, away_points = calculate_points(
+            np.array([home_goals]), np.array([away_goals]), points=self.league_table.points
+        )
+        for team in (home_team, away_team):
+            if team not in self._totals.index:
+                self._totals.loc[team] = 0
+        self._totals.loc[home_team] += sign * np.array([home_points[0], home_goals, away_goals, 1])
+        self._totals.loc[away_team] += sign * np.array([away_points[0], away_goals, home_goals, 1])
+
+    def table(self) -> pd.DataFrame:
+        """
+        The current table, including the provisional results of fixtures in play.
+        :return: Ordered league table
+        """
+        totals_df = self._totals[self._totals["PL"] > 0].reset_index()
+        return LeagueTable._format_table(totals_df)
+
+    def poll(self) -> Union[pd.DataFrame, None]:
+        """
+        Polls fixtures/live for the league once and applies any changed scores.
+        Fixtures which are no longer in play are folded into the finished standings with LeagueTable.refresh. Their
+        provisional results are kept, and the refresh repeated on each poll, until they are stored as finished.
+        :return: The updated table if it changed, otherwise None
+        """
+        data = self.league_table.apifootball.get(
+            endpoint="league_live_fixtures",
+            custom_ids={"league_id": self.league_table.league_id},
+            use_cache=False,
+            priority="live"
+        )
+        live = {
+            fixture["fixture_id"]: (
+                fixture["homeTeam"]["team_name"],
+                fixture["awayTeam"]["team_name"],
+                fixture["goalsHomeTeam"] or 0,
+                fixture["goalsAwayTeam"] or 0
+            )
+            for fixture in data["api"]["fixtures"]
+            if fixture["league_id"] == self.league_table.league_id
+        }
+
+        ended = [fixture_id for fixture_id in self._provisional if fixture_id not in live]
+        changed = [fixture_id for fixture_id, result in live.items() if self._provisional.get(fixture_id) != result]
+
+        finished = []
+        if ended:
+            self.logger.info(f"{len(ended)} fixture(s) no longer in play, refreshing finished fixtures.")
+            self.league_table.refresh()
+            fixtures_df = self.league_table.fixture_store.league(self.league_table.league_id)
+            stored_finished = set(fixtures_df.loc[fixtures_df["statusShort"].isin(FINISHED_STATUSES), "fixture_id"])
+            finished = [fixture_id for fixture_id in ended if fixture_id in stored_finished]
+            for fixture_id in finished:
+                del self._provisional[fixture_id]
+            self._set_base_totals()
+
+        for fixture_id in changed:
+            if fixture_id in self._provisional:
+                self._apply_result(self._provisional[fixture_id], sign=-1)
+            self._provisional[fixture_id] = live[fixture_id]
+            self._apply_result(live[fixture_id], sign=1)
+
+        if not finished and not changed:
+            return None
+
+        table = self.table()
+        if self.callback is not None:
+            self.callback(table, finished + changed)
+        return table
+
+    def run(self, max_polls: Union[int, None] = None):
+        """
+        Polls fixtures/live every poll_interval seconds, calling callback whenever the table changes.
+        :param max_polls: Number of polls to make, defaults to polling until interrupted
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            self.poll()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.poll_interval)
+
+    async def updates(self, max_polls: Union[int, None] = None) -> AsyncIterator[pd.DataFrame]:
+        """
+        Asynchronously polls fixtures/live every poll_interval seconds, yielding the table whenever it changes.
+        :param max_polls: Number of polls to make, defaults to polling until cancelled
+        :return: An async iterator of updated tables
+        """
+        loop = asyncio.get_running_loop()
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            table = await loop.run_in_executor(None, self.poll)
+            polls += 1
+            if table is not None:
+                yield table
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(self.poll_interval)
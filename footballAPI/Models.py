@@ -0,0 +1,411 @@
+from typing import Callable, Dict, List, Tuple, Type, Union
+
+from footballAPI.exceptions import NoResponseModel
+
+# Marks a lazily decoded field which has not been accessed yet
+_UNSET = object()
+
+
+class Model:
+    """
+    Base of the typed response models. Attributes are named as the keys of the response, missing keys are None.
+    Fields are held in __slots__, so a model takes far less memory than the dictionary it is decoded from and the
+    dictionary can be freed once decoded.
+
+    :param data: A single item of the response, eg. one fixture of data["api"]["fixtures"]
+    """
+    __slots__ = ()
+    # Keys of the response copied to attributes of the same name
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, data: Dict):
+        for field in self._fields:
+            setattr(self, field, data.get(field))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in _all_slots(type(self)))
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields[:3])
+        return f"{type(self).__name__}({fields})"
+
+
+def _all_slots(cls: type) -> List[str]:
+    return [slot for klass in cls.__mro__ for slot in getattr(klass, "__slots__", ())]
+
+
+class _Lazy:
+    """
+    Field of a model decoded from the raw response on first access. The raw value is held in the _<name>_raw slot
+    until then, and dropped once decoded into the _<name> slot.
+
+    :param decode: Function decoding the raw value
+    """
+    def __init__(self, decode: Callable):
+        self.decode = decode
+
+    def __set_name__(self, owner, name):
+        self.raw_slot = f"_{name}_raw"
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if value is _UNSET:
+            raw = getattr(instance, self.raw_slot)
+            value = None if raw is None else self.decode(raw)
+            setattr(instance, self.slot, value)
+            setattr(instance, self.raw_slot, None)
+        return value
+
+
+class FixtureLeague(Model):
+    """
+    The league of a fixture.
+    """
+    _fields = ("name", "country", "logo", "flag")
+    __slots__ = _fields
+
+    name: str
+    country: str
+    logo: Union[str, None]
+    flag: Union[str, None]
+
+
+class FixtureTeam(Model):
+    """
+    The home or away team of a fixture.
+    """
+    _fields = ("team_id", "team_name", "logo")
+    __slots__ = _fields
+
+    team_id: int
+    team_name: str
+    logo: Union[str, None]
+
+
+class Score(Model):
+    """
+    The score of a fixture at each stage, eg. "1-0", None for stages not reached.
+    """
+    _fields = ("halftime", "fulltime", "extratime", "penalty")
+    __slots__ = _fields
+
+    halftime: Union[str, None]
+    fulltime: Union[str, None]
+    extratime: Union[str, None]
+    penalty: Union[str, None]
+
+
+class Fixture(Model):
+    """
+    A fixture of the fixtures endpoints. The league, teams and score are decoded into their models.
+    """
+    _fields = (
+        "fixture_id", "league_id", "event_date", "event_timestamp", "firstHalfStart", "secondHalfStart", "round",
+        "status", "statusShort", "elapsed", "venue", "referee", "goalsHomeTeam", "goalsAwayTeam"
+    )
+    __slots__ = _fields + ("league", "homeTeam", "awayTeam", "score")
+
+    fixture_id: int
+    league_id: int
+    event_date: str
+    event_timestamp: int
+    firstHalfStart: Union[int, None]
+    secondHalfStart: Union[int, None]
+    round: str
+    status: str
+    statusShort: str
+    elapsed: Union[int, None]
+    venue: Union[str, None]
+    referee: Union[str, None]
+    goalsHomeTeam: Union[int, None]
+    goalsAwayTeam: Union[int, None]
+    league: Union[FixtureLeague, None]
+    homeTeam: FixtureTeam
+    awayTeam: FixtureTeam
+    score: Union[Score, None]
+
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        if self.elapsed is None:
+            # Some responses name the field elapse
+            self.elapsed = data.get("elapse")
+        self.league = _optional(FixtureLeague, data.get("league"))
+        self.homeTeam = _optional(FixtureTeam, data.get("homeTeam"))
+        self.awayTeam = _optional(FixtureTeam, data.get("awayTeam"))
+        self.score = _optional(Score, data.get("score"))
+
+
+class Event(Model):
+    """
+    An event of a match, eg. a goal, card or substitution.
+    """
+    _fields = (
+        "elapsed", "elapsed_plus", "team_id", "teamName", "player_id", "player", "assist_id", "assist", "type",
+        "detail", "comments"
+    )
+    __slots__ = _fields
+
+    elapsed: int
+    elapsed_plus: Union[int, None]
+    team_id: int
+    teamName: str
+    player_id: Union[int, None]
+    player: str
+    assist_id: Union[int, None]
+    assist: Union[str, None]
+    type: str
+    detail: Union[str, None]
+    comments: Union[str, None]
+
+
+class LineupPlayer(Model):
+    """
+    A player of the starting eleven or substitutes of a lineup.
+    """
+    _fields = ("team_id", "player_id", "player", "number", "pos")
+    __slots__ = _fields
+
+    team_id: int
+    player_id: Union[int, None]
+    player: str
+    number: Union[int, None]
+    pos: Union[str, None]
+
+
+class Lineup(Model):
+    """
+    The lineup of one team of a match.
+    """
+    _fields = ("coach_id", "coach", "formation")
+    __slots__ = _fields + ("startXI", "substitutes")
+
+    coach_id: Union[int, None]
+    coach: Union[str, None]
+    formation: Union[str, None]
+    startXI: Tuple[LineupPlayer, ...]
+    substitutes: Tuple[LineupPlayer, ...]
+
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        self.startXI = tuple(LineupPlayer(player) for player in data.get("startXI") or ())
+        self.substitutes = tuple(LineupPlayer(player) for player in data.get("substitutes") or ())
+
+
+class MatchPlayer(Model):
+    """
+    The statistics of a player in a match. Grouped statistics, eg. shots, are kept as returned by the API.
+    """
+    _fields = (
+        "event_id", "updateAt", "player_id", "player_name", "team_id", "team_name", "number", "position", "rating",
+        "minutes_played", "captain", "substitute", "offsides", "shots", "goals", "passes", "tackles", "duels",
+        "dribbles", "fouls", "cards", "penalty"
+    )
+    __slots__ = _fields
+
+    event_id: int
+    updateAt: int
+    player_id: Union[int, None]
+    player_name: str
+    team_id: int
+    team_name: str
+    number: Union[int, None]
+    position: Union[str, None]
+    rating: Union[str, None]
+    minutes_played: int
+    captain: Union[str, None]
+    substitute: Union[str, None]
+    offsides: Union[int, None]
+    shots: Dict
+    goals: Dict
+    passes: Dict
+    tackles: Dict
+    duels: Dict
+    dribbles: Dict
+    fouls: Dict
+    cards: Dict
+    penalty: Dict
+
+
+def _decode_events(events: List[Dict]) -> Tuple[Event, ...]:
+    return tuple(Event(event) for event in events)
+
+
+def _decode_lineups(lineups: Dict[str, Dict]) -> Dict[str, Lineup]:
+    return {team_name: Lineup(lineup) for team_name, lineup in lineups.items()}
+
+
+def _decode_statistics(statistics: Dict[str, Dict]) -> Dict[str, Tuple[Union[str, None], Union[str, None]]]:
+    return {name: (statistic.get("home"), statistic.get("away")) for name, statistic in statistics.items()}
+
+
+def _decode_players(players: List[Dict]) -> Tuple[MatchPlayer, ...]:
+    return tuple(MatchPlayer(player) for player in players)
+
+
+class Match(Fixture):
+    """
+    A fixture with all of its details, from the match endpoint. The events, lineups, statistics and players are
+    decoded on first access, so matches whose details are not read cost no more to decode than a Fixture.
+    """
+    __slots__ = (
+        "_events_raw", "_events", "_lineups_raw", "_lineups", "_statistics_raw", "_statistics", "_players_raw",
+        "_players"
+    )
+
+    # Events of the match in order
+    events: Union[Tuple[Event, ...], None] = _Lazy(_decode_events)
+    # Lineup of each team keyed on the team name
+    lineups: Union[Dict[str, Lineup], None] = _Lazy(_decode_lineups)
+    # Home and away value of each statistic keyed on its name, eg. statistics["Total Shots"] == ("12", "5")
+    statistics: Union[Dict[str, Tuple[Union[str, None], Union[str, None]]], None] = _Lazy(_decode_statistics)
+    # Statistics of each player
+    players: Union[Tuple[MatchPlayer, ...], None] = _Lazy(_decode_players)
+
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        for name in ("events", "lineups", "statistics", "players"):
+            setattr(self, f"_{name}_raw", data.get(name))
+            setattr(self, f"_{name}", _UNSET)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return Fixture.__eq__(self, other) and all(
+            getattr(self, name) == getattr(other, name) for name in ("events", "lineups", "statistics", "players")
+        )
+
+
+class League(Model):
+    """
+    A league and season of the leagues endpoints. Coverage is kept as returned by the API.
+    """
+    _fields = (
+        "league_id", "name", "type", "country", "country_code", "season", "season_start", "season_end", "logo",
+        "flag", "standings", "is_current", "coverage"
+    )
+    __slots__ = _fields
+
+    league_id: int
+    name: str
+    type: str
+    country: str
+    country_code: Union[str, None]
+    season: int
+    season_start: str
+    season_end: Union[str, None]
+    logo: Union[str, None]
+    flag: Union[str, None]
+    standings: int
+    is_current: int
+    coverage: Dict
+
+
+class Team(Model):
+    """
+    A team of the teams endpoints.
+    """
+    _fields = (
+        "team_id", "name", "code", "logo", "is_national", "country", "founded", "venue_name", "venue_surface",
+        "venue_address", "venue_city", "venue_capacity"
+    )
+    __slots__ = _fields
+
+    team_id: int
+    name: str
+    code: Union[str, None]
+    logo: str
+    is_national: bool
+    country: str
+    founded: Union[int, None]
+    venue_name: Union[str, None]
+    venue_surface: Union[str, None]
+    venue_address: Union[str, None]
+    venue_city: Union[str, None]
+    venue_capacity: Union[int, None]
+
+
+class Player(Model):
+    """
+    A player of the players endpoints.
+    """
+    _fields = (
+        "player_id", "player_name", "firstname", "lastname", "number", "position", "age", "birth_date",
+        "birth_place", "birth_country", "nationality", "height", "weight"
+    )
+    __slots__ = _fields
+
+    player_id: int
+    player_name: str
+    firstname: str
+    lastname: str
+    number: Union[int, None]
+    position: Union[str, None]
+    age: int
+    birth_date: str
+    birth_place: Union[str, None]
+    birth_country: Union[str, None]
+    nationality: str
+    height: Union[str, None]
+    weight: Union[str, None]
+
+
+# Model of the items of each endpoint, with the longest matching prefix of the resolved endpoint used
+# The items are read from data["api"][<core endpoint>], eg. data["api"]["fixtures"]. Only endpoints whose items have
+# the shape of the model are listed, eg. fixtures/rounds and players/seasons return lists of strings
+ENDPOINT_MODELS: Dict[str, Type[Model]] = {
+    "fixtures/id": Match,
+    "fixtures/league": Fixture,
+    "fixtures/date": Fixture,
+    "fixtures/live": Fixture,
+    "fixtures/team": Fixture,
+    "fixtures/h2h": Fixture,
+    "leagues": League,
+    "teams/team": Team,
+    "teams/league": Team,
+    "teams/search": Team,
+    "players/squad": Player,
+    "players/player": Player,
+    "players/team": Player,
+}
+
+
+def _optional(model: Type[Model], data: Union[Dict, None]) -> Union[Model, None]:
+    return None if data is None else model(data)
+
+
+def model_for(endpoint: str) -> Type[Model]:
+    """
+    Finds the model of the items of an endpoint from the longest matching prefix in ENDPOINT_MODELS.
+
+    :param endpoint: The resolved api endpoint, eg. fixtures/league/2
+
+    return: The model class
+    """
+    parts = endpoint.strip('/').split('/')
+    for i in range(len(parts), 0, -1):
+        prefix = '/'.join(parts[:i])
+        if prefix in ENDPOINT_MODELS:
+            return ENDPOINT_MODELS[prefix]
+    raise NoResponseModel(f"No response model for endpoint {endpoint}.")
+
+
+def decode_response(endpoint: str, data: Dict) -> List[Model]:
+    """
+    Decodes the items of a response into models, eg. the fixtures of a fixtures endpoint into Fixture models.
+
+    :param endpoint: The resolved api endpoint of the response
+    :param data: The JSON response
+
+    return: A model for each item of the response
+    """
+    model = model_for(endpoint)
+    core_endpoint = endpoint.split('/')[0]
+    items = data.get("api", {}).get(core_endpoint)
+    if not isinstance(items, list):
+        raise NoResponseModel(f"No {core_endpoint} items to decode in the response of {endpoint}.")
+    return [model(item) for item in items]
@@ -0,0 +1,131 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Union
+
+from footballAPI.globals import RATE_LIMIT_PLANS, REQUEST_PRIORITIES
+
+_shared_limiters: Dict[str, "RateLimiter"] = {}
+_shared_lock = threading.Lock()
+
+
+class RateLimiter:
+    def __init__(
+            self,
+            rate: float,
+            per: float = 60.0,
+            burst: Union[int, None] = None
+    ):
+        """
+        Token-bucket scheduler for requests to the API. Tokens are added at rate per per seconds up to burst, and every
+        request takes one token, waiting until one is available. Waiting requests are served in priority order, then
+        in the order they arrived, so live requests are not stuck behind a backfill.
+        A limiter can be shared by several APIFootball clients, or by every client in a process with shared.
+
+        :param rate: Number of requests allowed per period
+        :param per: Length of the period in seconds, defaults to a minute as API-Sports plans are limited per minute
+        :param burst: Maximum number of requests made back to back, defaults to 1 so requests are spread evenly
+        """
+        if rate <= 0 or per <= 0:
+            raise ValueError("rate and per must be positive.")
+        self.rate = rate
+        self.per = per
+        self.burst = burst or 1
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    @classmethod
+    def for_plan(cls, plan: str, burst: Union[int, None] = None) -> "RateLimiter":
+        """
+        Builds a limiter for the per minute request limit of a plan, see RATE_LIMIT_PLANS in globals.py.
+
+        :param plan: The name of the plan, eg. "pro"
+        :param burst: Maximum number of requests made back to back
+        :return: The limiter
+        """
+        if plan not in RATE_LIMIT_PLANS:
+            raise ValueError(f"{plan} is not a valid plan.")
+        return cls(rate=RATE_LIMIT_PLANS[plan], per=60.0, burst=burst)
+
+    @classmethod
+    def shared(cls, plan: str) -> "RateLimiter":
+        """
+        Returns the limiter for a plan shared by every client in the process, building it on first use.
+
+        :param plan: The name of the plan, eg. "pro"
+        :return: The shared limiter
+        """
+        with _shared_lock:
+            if plan not in _shared_limiters:
+                _shared_limiters[plan] = cls.for_plan(plan)
+            return _shared_limiters[plan]
+
+    @property
+    def waiting(self) -> int:
+        """
+        Number of requests waiting for a token.
+        """
+        with self._condition:
+            return len(self._waiters)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    def acquire(self, priority: Union[str, int] = "normal", timeout: Union[float, None] = None) -> bool:
+        """
+        Takes a token, waiting until one is available and every request of a higher priority, or of the same priority
+        which arrived earlier, has taken one.
+
+        :param priority: A name from REQUEST_PRIORITIES in globals.py, or an int where lower is served first
+        :param timeout: Maximum seconds to wait, defaults to waiting indefinitely
+        :return: True once a token is taken, False if timeout expired first
+        """
+        if isinstance(priority, str):
+            if priority not in REQUEST_PRIORITIES:
+                raise ValueError(f"{priority} is not a valid priority.")
+            priority = REQUEST_PRIORITIES[priority]
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        entry = (priority, next(self._counter))
+        with self._condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = None
+                    if self._waiters[0] == entry:
+                        if now >= self._paused_until and self._tokens >= 1:
+                            self._tokens -= 1
+                            return True
+                        wait = max(self._paused_until - now, (1 - self._tokens) * self.per / self.rate)
+
+                    if deadline is not None:
+                        if now >= deadline:
+                            return False
+                        wait = deadline - now if wait is None else min(wait, deadline - now)
+                    self._condition.wait(wait)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def backoff(self, seconds: float):
+        """
+        Pauses every request using the limiter, eg. after a 429 response. Tokens accrued so far are dropped so
+        requests resume at the steady rate.
+
+        :param seconds: Seconds to pause for
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = now
+            self._condition.notify_all()
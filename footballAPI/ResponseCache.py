@@ -0,0 +1,278 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Tuple, Union
+
+from footballAPI.globals import DEFAULT_CACHE_TTLS, FINISHED_STATUSES, FINISHED_TTL_ENDPOINTS
+
+
+class CacheEntry(NamedTuple):
+    """
+    A cached response with the time it expires, None if it never expires, and the validators the API returned with
+    it, eg. {"ETag": '"abc"'}, used to revalidate the response once it expires.
+    """
+    data: Dict
+    expires_at: Union[float, None]
+    validators: Dict[str, str]
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+
+def _finished(endpoint: str, data: Dict) -> bool:
+    """
+    Checks whether a response of FINISHED_TTL_ENDPOINTS only holds fixtures which have finished.
+
+    :param endpoint: The resolved api endpoint
+    :param data: The JSON response
+
+    return: True if the endpoint is one of FINISHED_TTL_ENDPOINTS and every fixture has one of FINISHED_STATUSES
+    """
+    parts = endpoint.strip('/').split('/')
+    if not any('/'.join(parts[:i]) in FINISHED_TTL_ENDPOINTS for i in range(1, len(parts) + 1)):
+        return False
+    fixtures = data.get("api", {}).get("fixtures") if isinstance(data, dict) else None
+    return bool(fixtures) and all(
+        isinstance(fixture, dict) and fixture.get("statusShort") in FINISHED_STATUSES for fixture in fixtures
+    )
+
+
+class ResponseCache(ABC):
+    def __init__(
+            self,
+            ttls: Union[Dict[str, Union[float, None]], None] = None,
+            default_ttl: Union[float, None] = 3600,
+            finished_ttl: Union[float, None] = None
+    ):
+        """
+        Base response cache used by APIFootball.get, keyed on the resolved api endpoint, eg. fixtures/league/2.
+        Backends implement the abstract methods _load, _store, _delete and _clear.
+
+        Expired responses stored with validators (ETag or Last-Modified) are kept, so APIFootball can revalidate them
+        with a conditional request and reuse the stored body if the API responds 304 Not Modified.
+
+        TTLs are given in seconds per endpoint prefix, with the longest matching prefix used, so fixtures/live can
+        expire sooner than fixtures. A TTL of None never expires and a TTL of 0 is never cached.
+        Responses of FINISHED_TTL_ENDPOINTS in which every fixture has finished, eg. the fixtures of a completed
+        season, will not change again and are cached with finished_ttl instead, by default never expiring.
+
+        :param ttls: TTLs per endpoint prefix, updating those in DEFAULT_CACHE_TTLS
+        :param default_ttl: TTL for endpoints not matching any prefix
+        :param finished_ttl: TTL for responses in which every fixture has finished, unless their prefix TTL is 0
+        """
+        self.ttls = dict(DEFAULT_CACHE_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.finished_ttl = finished_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str, data: Union[Dict, None] = None) -> Union[float, None]:
+        """
+        Finds the TTL of an endpoint from the longest matching prefix, or finished_ttl if data only holds finished
+        fixtures.
+
+        :param endpoint: The resolved api endpoint
+        :param data: The JSON response to be cached, if known
+
+        return: The TTL in seconds, None if the endpoint never expires
+        """
+        ttl = self.default_ttl
+        parts = endpoint.strip('/').split('/')
+        for i in range(len(parts), 0, -1):
+            prefix = '/'.join(parts[:i])
+            if prefix in self.ttls:
+                ttl = self.ttls[prefix]
+                break
+        if ttl != 0 and data is not None and _finished(endpoint, data):
+            return self.finished_ttl
+        return ttl
+
+    def get(self, endpoint: str) -> Union[Dict, None]:
+        """
+        Returns the cached response of an endpoint if present and not expired.
+        The cached object is returned directly and should not be modified.
+
+        :param endpoint: The resolved api endpoint
+
+        return: The cached JSON response, or None on a miss
+        """
+        entry = self.lookup(endpoint)
+        return entry.data if entry is not None and entry.fresh else None
+
+    def lookup(self, endpoint: str) -> Union[CacheEntry, None]:
+        """
+        Returns the cached entry of an endpoint if present, counting a hit if it has not expired.
+        Expired entries are only returned, as a miss, if they can be revalidated, and are otherwise removed.
+
+        :param endpoint: The resolved api endpoint
+
+        return: The cached entry, or None if there is no entry or it expired without validators
+        """
+        with self._lock:
+            entry = self._load(endpoint)
+            if entry is not None:
+                entry = CacheEntry(*entry)
+                if entry.fresh:
+                    self.hits += 1
+                    return entry
+                if not entry.validators:
+                    self._delete(endpoint)
+                    entry = None
+            self.misses += 1
+            return entry
+
+    def set(self, endpoint: str, data: Dict, validators: Union[Dict[str, str], None] = None):
+        """
+        Stores the response of an endpoint with the TTL of the endpoint, see ttl_for.
+
+        :param endpoint: The resolved api endpoint
+        :param data: The JSON response
+        :param validators: The ETag and Last-Modified headers of the response, if any
+        """
+        ttl = self.ttl_for(endpoint, data)
+        if ttl == 0:
+            return
+        expires_at = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._store(endpoint, data, expires_at, validators or {})
+
+    def revalidate(self, endpoint: str, entry: CacheEntry, validators: Union[Dict[str, str], None] = None):
+        """
+        Renews an expired entry for another TTL once the API confirms it has not changed.
+
+        :param endpoint: The resolved api endpoint
+        :param entry: The expired entry
+        :param validators: Validators returned with the 304 response, which update those of the entry
+        """
+        self.set(endpoint, entry.data, {**entry.validators, **(validators or {})})
+        with self._lock:
+            self.revalidations += 1
+
+    def clear(self):
+        """
+        Removes all cached responses and resets the statistics.
+        """
+        with self._lock:
+            self._clear()
+            self.hits = 0
+            self.misses = 0
+            self.revalidations = 0
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Hit and miss statistics of the cache. Revalidations are misses answered with 304 Not Modified.
+        """
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "hit_ratio": self.hits / requests if requests else 0.0
+        }
+
+    @abstractmethod
+    def _load(self, endpoint: str) -> Union[Tuple[Dict, Union[float, None], Dict[str, str]], None]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _store(self, endpoint: str, data: Dict, expires_at: Union[float, None], validators: Dict[str, str]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, endpoint: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _clear(self):
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    def __init__(self, max_entries: int = 1024, **kwargs):
+        """
+        In-memory least recently used response cache.
+
+        :param max_entries: Maximum number of responses held, the least recently used is evicted first
+        :param kwargs: TTL arguments passed to ResponseCache
+        """
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def _load(self, endpoint):
+        entry = self._entries.get(endpoint)
+        if entry is not None:
+            self._entries.move_to_end(endpoint)
+        return entry
+
+    def _store(self, endpoint, data, expires_at, validators):
+        self._entries[endpoint] = (data, expires_at, validators)
+        self._entries.move_to_end(endpoint)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _delete(self, endpoint):
+        self._entries.pop(endpoint, None)
+
+    def _clear(self):
+        self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    def __init__(self, path: str = "footballAPI_cache.sqlite", **kwargs):
+        """
+        Persistent response cache stored in a local SQLite database, shared between processes and runs.
+
+        :param path: Path of the database file
+        :param kwargs: TTL arguments passed to ResponseCache
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "endpoint TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL, validators TEXT)"
+        )
+        # Databases created before validators were stored
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(responses)")]
+        if "validators" not in columns:
+            self._connection.execute("ALTER TABLE responses ADD COLUMN validators TEXT")
+        self._connection.commit()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self._connection.close()
+
+    def _load(self, endpoint):
+        row = self._connection.execute(
+            "SELECT data, expires_at, validators FROM responses WHERE endpoint = ?", (endpoint,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], json.loads(row[2] or "{}")
+
+    def _store(self, endpoint, data, expires_at, validators):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (endpoint, data, expires_at, validators) VALUES (?, ?, ?, ?)",
+            (endpoint, json.dumps(data), expires_at, json.dumps(validators))
+        )
+        self._connection.commit()
+
+    def _delete(self, endpoint):
+        self._connection.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
+        self._connection.commit()
+
+    def _clear(self):
+        self._connection.execute("DELETE FROM responses")
+        self._connection.commit()
@@ -0,0 +1,309 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from footballAPI.FixtureStore import FixtureStore
+from footballAPI.globals import FINISHED_STATUSES
+from footballAPI.LeagueTable import calculate_points, team_results
+
+# Columns of the fixture array shared with worker processes, one int32 row per fixture sorted by league_id
+# Teams are codes into the team names of the whole store, goals are -1 for fixtures not yet finished
+SHARED_COLUMNS = ["league_id", "home", "away", "home_goals", "away_goals"]
+
+# Columns of SeasonAnalytics.run
+ANALYTICS_COLUMNS = [
+    "league_id", "league.country", "league.name", "TEAM", "PL", "PTS", "PPG", "GF", "GA", "GD", "REMAINING",
+    "XPTS", "XPOS", "P_TITLE", "P_TOP", "P_BOTTOM",
+]
+
+# Per-team statistics returned by workers, in the order of their columns
+_STAT_COLUMNS = ["PL", "PTS", "GF", "GA", "REMAINING", "XPTS", "XPOS", "P_TITLE", "P_TOP", "P_BOTTOM"]
+
+
+def simulate_season(
+        home_idx: np.ndarray,
+        away_idx: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray,
+        finished: np.ndarray,
+        n_teams: int,
+        simulations: int = 10000,
+        points: Tuple[int, int, int] = (3, 1, 0),
+        top: int = 4,
+        bottom: int = 3,
+        rng: Union[np.random.Generator, None] = None,
+        batch_size: int = 1000
+) -> np.ndarray:
+    """
+    Simulates the remaining fixtures of a season many times at once, drawing the goals of every remaining fixture
+    from Poisson distributions scaled by the attack and defence of each team in the finished fixtures.
+    Teams level on points in a simulation are ordered by goal difference, then at random.
+    :param home_idx: Index of the home team of each fixture
+    :param away_idx: Index of the away team of each fixture
+    :param home_goals: Goals scored by the home team of each fixture, ignored for fixtures not finished
+    :param away_goals: Goals scored by the away team of each fixture, ignored for fixtures not finished
+    :param finished: Whether each fixture is finished
+    :param n_teams: Number of teams
+    :param simulations: Number of simulated seasons
+    :param points: Points for a win, draw and loss
+    :param top: Number of positions counted in P_TOP, eg. 4 for the Champions League places
+    :param bottom: Number of positions counted in P_BOTTOM, eg. 3 for the relegation places
+    :param rng: Random generator, defaults to a freshly seeded one
+    :param batch_size: Number of seasons simulated in each vectorized batch, bounding memory use
+    :return: Array with axis 0 each team and axis 1 XPTS, XPOS, P_TITLE, P_TOP, P_BOTTOM
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    team, _, stats = team_results(
+        home_idx[finished], away_idx[finished], home_goals[finished], away_goals[finished], points=points
+    )
+    totals = np.zeros((n_teams, stats.shape[1]), dtype=np.int64)
+    np.add.at(totals, team, stats)
+    played = np.maximum(totals[:, :3].sum(axis=1), 1)
+    current_points = totals[:, 5]
+    current_gd = totals[:, 3] - totals[:, 4]
+
+    # Expected goals of each remaining fixture from the scoring rates of the finished fixtures
+    n_finished = max(int(finished.sum()), 1)
+    home_rate = max(home_goals[finished].sum() / n_finished, 0.1)
+    away_rate = max(away_goals[finished].sum() / n_finished, 0.1)
+    goal_rate = max((home_rate + away_rate) / 2, 0.1)
+    attack = np.where(totals[:, :3].sum(axis=1) > 0, totals[:, 3] / played / goal_rate, 1.0)
+    defence = np.where(totals[:, :3].sum(axis=1) > 0, totals[:, 4] / played / goal_rate, 1.0)
+    remaining_home = home_idx[~finished]
+    remaining_away = away_idx[~finished]
+    home_expected = np.maximum(home_rate * attack[remaining_home] * defence[remaining_away], 0.05)
+    away_expected = np.maximum(away_rate * attack[remaining_away] * defence[remaining_home], 0.05)
+
+    # One-hot maps of the home and away team of each remaining fixture, so team totals are one matrix product
+    home_onehot = np.zeros((len(remaining_home), n_teams), dtype=np.int64)
+    home_onehot[np.arange(len(remaining_home)), remaining_home] = 1
+    away_onehot = np.zeros((len(remaining_away), n_teams), dtype=np.int64)
+    away_onehot[np.arange(len(remaining_away)), remaining_away] = 1
+
+    results = np.zeros((n_teams, 5))
+    for start in range(0, simulations, batch_size):
+        size = min(batch_size, simulations - start)
+        sim_home = rng.poisson(home_expected, size=(size, len(home_expected)))
+        sim_away = rng.poisson(away_expected, size=(size, len(away_expected)))
+        sim_home_points, sim_away_points = calculate_points(sim_home, sim_away, points=points)
+        sim_points = current_points + sim_home_points @ home_onehot + sim_away_points @ away_onehot
+        sim_gd = current_gd + (sim_home - sim_away) @ (home_onehot - away_onehot)
+
+        # Order by points, then goal difference, then at random
+        order = np.lexsort((rng.random((size, n_teams)), -sim_gd, -sim_points), axis=-1)
+        positions = np.empty_like(order)
+        np.put_along_axis(positions, order, np.arange(n_teams), axis=1)
+
+        results[:, 0] += sim_points.sum(axis=0)
+        results[:, 1] += (positions + 1).sum(axis=0)
+        results[:, 2] += (positions == 0).sum(axis=0)
+        results[:, 3] += (positions < top).sum(axis=0)
+        results[:, 4] += (positions >= n_teams - bottom).sum(axis=0)
+    return results / max(simulations, 1)
+
+
+def _analyse_league(
+        fixtures: np.ndarray,
+        simulations: int,
+        points: Tuple[int, int, int],
+        top: int,
+        bottom: int,
+        seed: Union[int, None]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the current standings and simulated outcomes of one league.
+    :param fixtures: Rows of the shared fixture array of the league
+    :return: Team codes of the league and array with axis 0 each team and axis 1 the stats of _STAT_COLUMNS
+    """
+    league_id, home, away, home_goals, away_goals = fixtures.T
+    teams, team_idx = np.unique(np.concatenate([home, away]), return_inverse=True)
+    home_idx, away_idx = team_idx[:len(home)], team_idx[len(home):]
+    finished = home_goals >= 0
+
+    team, _, stats = team_results(
+        home_idx[finished], away_idx[finished], home_goals[finished], away_goals[finished], points=points
+    )
+    totals = np.zeros((len(teams), stats.shape[1]), dtype=np.int64)
+    np.add.at(totals, team, stats)
+    remaining = np.bincount(np.concatenate([home_idx[~finished], away_idx[~finished]]), minlength=len(teams))
+
+    # Seeded per league so results do not depend on how leagues are sharded across processes
+    rng = np.random.default_rng(None if seed is None else [seed, int(league_id[0])])
+    simulated = simulate_season(
+        home_idx, away_idx, home_goals, away_goals, finished, len(teams),
+        simulations=simulations, points=points, top=top, bottom=bottom, rng=rng
+    )
+    return teams, np.column_stack([
+        totals[:, :3].sum(axis=1), totals[:, 5], totals[:, 3], totals[:, 4], remaining, simulated
+    ])
+
+
+def _analyse_shard(
+        shm_name: Union[str, None],
+        shape: Tuple[int, int],
+        leagues: List[Tuple[int, int, int]],
+        simulations: int,
+        points: Tuple[int, int, int],
+        top: int,
+        bottom: int,
+        seed: Union[int, None],
+        fixtures: Union[np.ndarray, None] = None
+) -> List[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Analyses a shard of leagues in a worker process, reading their fixtures from the shared fixture array.
+    :param shm_name: Name of the shared memory block holding the fixture array
+    :param shape: Shape of the fixture array
+    :param leagues: league_id, first and last row + 1 of each league of the shard
+    :param fixtures: The fixture array itself, used in place of shared memory when analysing in process
+    :return: league_id, team codes and stats of each league
+    """
+    shm = None
+    if fixtures is None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        fixtures = np.ndarray(shape, dtype=np.int32, buffer=shm.buf)
+    try:
+        return [
+            (league_id, *_analyse_league(fixtures[start:end], simulations, points, top, bottom, seed))
+            for league_id, start, end in leagues
+        ]
+    finally:
+        if shm is not None:
+            del fixtures
+            shm.close()
+
+
+class SeasonAnalytics:
+    def __init__(
+            self,
+            fixture_store: FixtureStore,
+            league_ids: Union[Iterable[int], None] = None,
+            max_workers: Union[int, None] = None,
+            simulations: int = 10000,
+            points: Tuple[int, int, int] = (3, 1, 0),
+            top: int = 4,
+            bottom: int = 3,
+            seed: Union[int, None] = None
+    ):
+        """
+        Computes points-per-game, current standings and Monte Carlo end-of-season simulations across many leagues
+        and seasons of a FixtureStore, without calling the API.
+        Leagues are sharded across a pool of processes. The fixtures are encoded once as a compact int32 array in
+        shared memory which every worker reads directly, so no DataFrames are pickled to or from the workers.
+        :param fixture_store: Store holding the fixtures of every league to analyse, eg. from FixtureStore.read_arrow
+        :param league_ids: The league_ids to analyse, unique to a league and season, defaults to every league stored
+        :param max_workers: Number of processes, defaults to the number of CPUs. 1 analyses in the current process
+        :param simulations: Number of simulated seasons of each league
+        :param points: Points for a win, draw and loss
+        :param top: Number of positions counted in P_TOP, eg. 4 for the Champions League places
+        :param bottom: Number of positions counted in P_BOTTOM, eg. 3 for the relegation places
+        :param seed: Seed of the simulations, results are reproducible for a seed regardless of max_workers
+        """
+        self.fixture_store = fixture_store
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.simulations = simulations
+        self.points = points
+        self.top = top
+        self.bottom = bottom
+        self.seed = seed
+        self.logger = logging.getLogger(__name__)
+        self._encode_fixtures(league_ids)
+
+    def _encode_fixtures(self, league_ids: Union[Iterable[int], None]):
+        """
+        Encodes the finished and remaining fixtures of the leagues as the fixture array shared with workers, with
+        the team names and the row range of each league.
+        """
+        fixtures_df = self.fixture_store.fixtures
+        if league_ids is not None:
+            fixtures_df = fixtures_df[fixtures_df["league_id"].isin(list(league_ids))]
+        # Fixtures which will not change but did not finish normally, eg. cancelled, take no part in either
+        fixtures_df = fixtures_df[
+            (fixtures_df["statusShort"] == "FT") | ~fixtures_df["statusShort"].isin(FINISHED_STATUSES)
+        ].sort_values("league_id", kind="stable")
+        if fixtures_df.empty:
+            raise ValueError("No fixtures found")
+
+        team_codes, self.teams = pd.factorize(
+            pd.concat([fixtures_df["homeTeam.team_name"], fixtures_df["awayTeam.team_name"]]).astype(str)
+        )
+        n_fixtures = len(fixtures_df)
+        is_finished = (fixtures_df["statusShort"] == "FT").to_numpy()
+        self.fixtures = np.column_stack([
+            fixtures_df["league_id"].to_numpy(),
+            team_codes[:n_fixtures],
+            team_codes[n_fixtures:],
+            np.where(is_finished, fixtures_df["goalsHomeTeam"].to_numpy(dtype=float, na_value=-1), -1),
+            np.where(is_finished, fixtures_df["goalsAwayTeam"].to_numpy(dtype=float, na_value=-1), -1),
+        ]).astype(np.int32)
+
+        league_ids, starts = np.unique(self.fixtures[:, 0], return_index=True)
+        ends = np.append(starts[1:], n_fixtures)
+        self.leagues = [
+            (int(league_id), int(start), int(end)) for league_id, start, end in zip(league_ids, starts, ends)
+        ]
+        self.league_names = fixtures_df.drop_duplicates("league_id").set_index("league_id")[
+            ["league.country", "league.name"]
+        ].astype(object)
+
+    def _shards(self) -> List[List[Tuple[int, int, int]]]:
+        """
+        Splits the leagues into shards of roughly equal numbers of fixtures, several per worker so a slow shard does
+        not hold up the rest.
+        """
+        n_shards = min(len(self.leagues), self.max_workers * 4)
+        bounds = np.linspace(0, len(self.fixtures), n_shards + 1)[1:-1]
+        shard_idx = np.searchsorted(bounds, [start for _, start, _ in self.leagues], side="right")
+        shards: Dict[int, List[Tuple[int, int, int]]] = {}
+        for idx, league in zip(shard_idx, self.leagues):
+            shards.setdefault(int(idx), []).append(league)
+        return list(shards.values())
+
+    def run(self) -> pd.DataFrame:
+        """
+        Analyses every league, in parallel across max_workers processes.
+        :return: One Dataframe with the columns of ANALYTICS_COLUMNS, with a row for every team of every league
+            ordered by league_id then current points. XPTS and XPOS are the mean points and position at the end of
+            the season, and P_TITLE, P_TOP and P_BOTTOM the probability of finishing first, in the top or in the
+            bottom positions
+        """
+        args = (self.simulations, self.points, self.top, self.bottom, self.seed)
+        shards = self._shards()
+        if self.max_workers == 1 or len(shards) == 1:
+            results = [_analyse_shard(None, self.fixtures.shape, self.leagues, *args, fixtures=self.fixtures)]
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=self.fixtures.nbytes)
+            try:
+                np.ndarray(self.fixtures.shape, dtype=np.int32, buffer=shm.buf)[:] = self.fixtures
+                self.logger.info(f"Analysing {len(self.leagues)} league(s) in {len(shards)} shard(s).")
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = list(executor.map(
+                        _analyse_shard, *zip(*[(shm.name, self.fixtures.shape, shard, *args) for shard in shards])
+                    ))
+            finally:
+                shm.close()
+                shm.unlink()
+
+        league_results = [league for shard in results for league in shard]
+        league_ids = np.concatenate([np.full(len(teams), league_id) for league_id, teams, _ in league_results])
+        stats = np.concatenate([league_stats for _, _, league_stats in league_results])
+        analytics_df = pd.DataFrame(stats, columns=_STAT_COLUMNS)
+        for column in ["PL", "PTS", "GF", "GA", "REMAINING"]:
+            analytics_df[column] = analytics_df[column].astype(np.int64)
+        analytics_df = analytics_df.assign(
+            league_id=league_ids,
+            TEAM=self.teams[np.concatenate([teams for _, teams, _ in league_results])],
+            PPG=np.divide(
+                analytics_df["PTS"], analytics_df["PL"], out=np.zeros(len(analytics_df)),
+                where=analytics_df["PL"].to_numpy() > 0
+            ),
+            GD=analytics_df["GF"] - analytics_df["GA"]
+        ).join(self.league_names, on="league_id")
+        analytics_df = analytics_df.sort_values(
+            ["league_id", "PTS", "GD", "GF", "TEAM"], ascending=[True, False, False, False, True]
+        )
+        return analytics_df[ANALYTICS_COLUMNS].reset_index(drop=True)
@@ -1,2 +1,56 @@
+import importlib
+import logging
+import sys
+import types
+
 from footballAPI.APIFootball import APIFootball
-from footballAPI.LeagueTable import LeagueTable
+from footballAPI.AsyncAPIFootball import AsyncAPIFootball
+from footballAPI.Instrumentation import PrometheusMetrics, RequestMetrics
+from footballAPI.RateLimiter import RateLimiter
+from footballAPI.ResponseCache import MemoryCache, ResponseCache, SQLiteCache
+
+# Classes depending on pandas and numpy, imported on first access so importing the package only to make requests
+# does not pay for them
+_LAZY_IMPORTS = {
+    "FixtureStore": "footballAPI.FixtureStore",
+    "LeagueTable": "footballAPI.LeagueTable",
+    "LeagueTableBatch": "footballAPI.LeagueTableBatch",
+    "LiveLeagueTable": "footballAPI.LiveLeagueTable",
+    "SeasonAnalytics": "footballAPI.SeasonAnalytics",
+}
+
+__all__ = [
+    "APIFootball",
+    "AsyncAPIFootball",
+    "MemoryCache",
+    "PrometheusMetrics",
+    "RateLimiter",
+    "RequestMetrics",
+    "ResponseCache",
+    "SQLiteCache",
+    *_LAZY_IMPORTS,
+]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(vars(sys.modules[__name__])) | set(_LAZY_IMPORTS))
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a lazy submodule binds it on the package, keep its class of the same name bound instead
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+# Leave logging configuration to the application
+logging.getLogger(__name__).addHandler(logging.NullHandler())
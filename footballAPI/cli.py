@@ -0,0 +1,556 @@
+"""
+Command line interface of the package, installed as the footballAPI console command.
+
+Usage: footballAPI download --leagues 524 525 --output fixtures_data
+       footballAPI download --league "England:Premier League:2019" --format parquet --max-credits 5000
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Dict, List, Set, Tuple, Union
+
+from footballAPI.APIFootball import APIFootball
+from footballAPI.exceptions import NoAvailableCredits
+from footballAPI.globals import FINISHED_STATUSES, RATE_LIMIT_PLANS
+
+OUTPUT_FORMATS = ["ndjson", "parquet"]
+
+# Keys of the match endpoint holding the match detail, stored as JSON columns in Parquet shards
+MATCH_DETAIL_KEYS = ["events", "lineups", "statistics", "players"]
+
+# Exit codes of the download command
+EXIT_COMPLETE = 0
+EXIT_FAILURES = 1
+EXIT_OUT_OF_CREDITS = 2
+
+
+class Checkpoint:
+    def __init__(self, path: str):
+        """
+        Progress of a download, saved atomically to a JSON file so the download can be resumed after it stops.
+        A league is listed once its fixtures are written to a closed shard, and a match is done once it is written to
+        a closed shard, so nothing in a shard left open by a crash is marked as done.
+        Credits used are counted per UTC day, so a daily budget holds across restarts.
+
+        :param path: Path of the checkpoint file, loaded if it exists
+        """
+        self.path = path
+        self.listed: Dict[int, List[int]] = {}
+        self.done: Set[int] = set()
+        self.shards = {"fixtures": 0, "matches": 0}
+        self.credits_date = None
+        self.credits_used = 0
+        if os.path.exists(path):
+            with open(path) as checkpoint:
+                state = json.load(checkpoint)
+            self.listed = {int(league_id): ids for league_id, ids in state["listed"].items()}
+            self.done = set(state["done"])
+            self.shards = state["shards"]
+            self.credits_date = state["credits"]["date"]
+            self.credits_used = state["credits"]["used"]
+
+    def credits_used_today(self) -> int:
+        """
+        Returns the credits used on the current UTC day, resetting the count on a new day.
+        """
+        today = datetime.now(timezone.utc).date().isoformat()
+        if self.credits_date != today:
+            self.credits_date = today
+            self.credits_used = 0
+        return self.credits_used
+
+    def save(self):
+        state = {
+            "listed": {str(league_id): ids for league_id, ids in self.listed.items()},
+            "done": sorted(self.done),
+            "shards": self.shards,
+            "credits": {"date": self.credits_date, "used": self.credits_used},
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as checkpoint:
+            json.dump(state, checkpoint)
+        os.replace(tmp_path, self.path)
+
+
+class NDJSONShardWriter:
+    extension = "ndjson.gz"
+
+    def __init__(self, path: str):
+        """
+        Writes records to a gzip compressed newline delimited JSON shard. Records are written to a hidden temporary
+        file, which is renamed to path on close so incomplete shards are never read.
+
+        :param path: Path of the shard
+        """
+        self.path = path
+        self._tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+        self._file = gzip.open(self._tmp_path, "wt", encoding="utf-8")
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def close(self):
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        self._file.close()
+        os.remove(self._tmp_path)
+
+
+class ParquetShardWriter:
+    extension = "parquet"
+
+    def __init__(self, path: str, kind: str, row_group_size: int = 64):
+        """
+        Writes records to a Parquet shard, buffering at most row_group_size records. Fixtures are written with the
+        columns of FIXTURE_COLUMNS, so shards can be read with FixtureStore.read_parquet. Matches are written with
+        fixture_id, league_id and event_timestamp columns and the MATCH_DETAIL_KEYS as JSON strings.
+        Requires pyarrow.
+
+        :param path: Path of the shard
+        :param kind: fixtures or matches
+        :param row_group_size: Number of records in each row group
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self.path = path
+        self.kind = kind
+        self.row_group_size = row_group_size
+        self._tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+        self._schema = self._fixtures_schema() if kind == "fixtures" else self._matches_schema()
+        self._writer = pq.ParquetWriter(self._tmp_path, self._schema, compression="zstd")
+        self._rows = []
+
+    def _fixtures_schema(self):
+        from footballAPI.FixtureStore import FIXTURE_COLUMNS
+
+        pa = self._pa
+        types = {
+            "int32": pa.int32(),
+            "int64": pa.int64(),
+            "Int8": pa.int8(),
+            "Int16": pa.int16(),
+            "Int64": pa.int64(),
+            "category": pa.string(),
+            "datetime64[ns, UTC]": pa.timestamp("ns", tz="UTC"),
+        }
+        self._columns = [(name, path) for name, path, _ in FIXTURE_COLUMNS]
+        return pa.schema([(name, types[dtype]) for name, _, dtype in FIXTURE_COLUMNS])
+
+    def _matches_schema(self):
+        pa = self._pa
+        return pa.schema(
+            [("fixture_id", pa.int32()), ("league_id", pa.int32()), ("event_timestamp", pa.int64())] +
+            [(key, pa.string()) for key in MATCH_DETAIL_KEYS]
+        )
+
+    def _row(self, record: Dict) -> Dict:
+        if self.kind == "matches":
+            row = {key: record.get(key) for key in ["fixture_id", "league_id", "event_timestamp"]}
+            row.update({key: json.dumps(record.get(key)) for key in MATCH_DETAIL_KEYS})
+            return row
+
+        from footballAPI.FixtureStore import _value
+
+        row = {name: _value(record, path) for name, path in self._columns}
+        if row["event_date"] is not None:
+            row["event_date"] = datetime.fromisoformat(row["event_date"])
+        return row
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def write(self, record: Dict):
+        self._rows.append(self._row(record))
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        self._writer.close()
+        os.remove(self._tmp_path)
+
+
+class ShardedOutput:
+    def __init__(
+            self,
+            directory: str,
+            kind: str,
+            output_format: str,
+            shard_size: Union[int, None],
+            checkpoint: Checkpoint
+    ):
+        """
+        Writes records of one kind to numbered shards of at most shard_size records, eg. matches/part-00003.ndjson.gz.
+        Shards are numbered on from those written by previous runs, as counted in the checkpoint.
+
+        :param directory: Output directory, the shards are written to a sub-directory named kind
+        :param kind: fixtures or matches
+        :param output_format: One of OUTPUT_FORMATS
+        :param shard_size: Maximum number of records in a shard, None to only close shards with close
+        :param checkpoint: The checkpoint holding the number of shards already written
+        """
+        self.directory = os.path.join(directory, kind)
+        self.kind = kind
+        self.output_format = output_format
+        self.shard_size = shard_size
+        self.checkpoint = checkpoint
+        self._writer = None
+        self._count = 0
+        os.makedirs(self.directory, exist_ok=True)
+        # Remove shards left incomplete by a previous run, their records are not marked as done
+        for name in os.listdir(self.directory):
+            if name.startswith(".") and name.endswith(".tmp"):
+                os.remove(os.path.join(self.directory, name))
+
+    def _open(self):
+        writer_class = NDJSONShardWriter if self.output_format == "ndjson" else ParquetShardWriter
+        number = self.checkpoint.shards[self.kind]
+        path = os.path.join(self.directory, f"part-{number:05d}.{writer_class.extension}")
+        if writer_class is ParquetShardWriter:
+            self._writer = ParquetShardWriter(path, self.kind)
+        else:
+            self._writer = NDJSONShardWriter(path)
+        self._count = 0
+
+    def write(self, record: Dict) -> bool:
+        """
+        Writes a record, closing the shard once it is full.
+
+        :param record: The record
+        :return: True if the shard was closed
+        """
+        if self._writer is None:
+            self._open()
+        self._writer.write(record)
+        self._count += 1
+        if self.shard_size is not None and self._count >= self.shard_size:
+            self.close()
+            return True
+        return False
+
+    def abort(self):
+        """
+        Discards the current shard, eg. when the listing being written to it fails part way.
+        """
+        if self._writer is None:
+            return
+        self._writer.abort()
+        self._writer = None
+
+    def close(self):
+        """
+        Closes the current shard, if any records have been written to it.
+        """
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        self.checkpoint.shards[self.kind] += 1
+
+
+class Downloader:
+    def __init__(
+            self,
+            apifootball: APIFootball,
+            league_ids: List[int],
+            output: str,
+            output_format: str = "ndjson",
+            checkpoint: Union[str, None] = None,
+            concurrency: int = 8,
+            shard_size: int = 1000,
+            max_credits: Union[int, None] = None,
+            statuses: Union[List[str], None] = None,
+            validate: bool = True
+    ):
+        """
+        Downloads the fixtures of each league, and the match detail of each of its fixtures, to sharded files.
+        The fixtures of a league are streamed, and the match detail of each fixture is requested on a bounded thread
+        pool as soon as the fixture arrives, so no more than a shard of records and the in-flight requests are held
+        in memory. Progress is saved to a checkpoint so a download which stops, eg. when credits run out, resumes
+        where it left off.
+
+        :param apifootball: The APIFootball making the requests
+        :param league_ids: The league_ids to download, unique to a league and season
+        :param output: Output directory
+        :param output_format: One of OUTPUT_FORMATS
+        :param checkpoint: Path of the checkpoint file, defaults to checkpoint.json in the output directory
+        :param concurrency: Maximum number of match requests in flight
+        :param shard_size: Maximum number of records in a match shard, the fixtures of a league are written to one shard
+        :param max_credits: Maximum number of credits to use per UTC day, across restarts
+        :param statuses: Fixture statuses to download the match detail of, defaults to FINISHED_STATUSES
+        :param validate: Perform validation of each fixture and match against its jsonschema
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"{output_format} is not a valid output format.")
+
+        self.apifootball = apifootball
+        self.league_ids = league_ids
+        self.concurrency = concurrency
+        self.max_credits = max_credits
+        self.statuses = statuses or FINISHED_STATUSES
+        self.validate = validate
+        os.makedirs(output, exist_ok=True)
+        self.checkpoint = Checkpoint(checkpoint or os.path.join(output, "checkpoint.json"))
+        # A league is never split across fixture shards, so a listing which fails part way leaves no shard behind
+        self.fixtures = ShardedOutput(output, "fixtures", output_format, None, self.checkpoint)
+        self.matches = ShardedOutput(output, "matches", output_format, shard_size, self.checkpoint)
+        # Exceptions of the leagues which could not be listed and the matches which could not be downloaded
+        self.failed: Dict[int, Exception] = {}
+        self.out_of_credits = False
+        self._written: List[int] = []
+        self._pending = {}
+        self.logger = logging.getLogger(__name__)
+
+    def _take_credit(self) -> bool:
+        """
+        Counts a credit against the daily budget before a request is made.
+
+        :return: False if the budget is used up
+        """
+        if self.max_credits is not None and self.checkpoint.credits_used_today() >= self.max_credits:
+            self.out_of_credits = True
+            return False
+        self.checkpoint.credits_used = self.checkpoint.credits_used_today() + 1
+        return True
+
+    def _mark_matches_done(self):
+        self.checkpoint.done.update(self._written)
+        self._written = []
+        self.checkpoint.save()
+
+    def _collect(self, block: bool):
+        """
+        Writes the match detail of completed requests.
+
+        :param block: Wait for at least one request to complete
+        """
+        if not self._pending:
+            return
+        completed, _ = wait(list(self._pending), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in completed:
+            fixture_id = self._pending.pop(future)
+            try:
+                data = future.result()
+            except NoAvailableCredits as e:
+                self.out_of_credits = True
+                self.failed[fixture_id] = e
+                continue
+            except Exception as e:
+                self.logger.error(f"Failed to download match {fixture_id}: {e}")
+                self.failed[fixture_id] = e
+                continue
+            # Marked as done once the shard holding the match is closed, or with the next shard if there is no match
+            self._written.append(fixture_id)
+            for match in data["api"]["fixtures"]:
+                if self.matches.write(match):
+                    self._mark_matches_done()
+
+    def _submit(self, executor: ThreadPoolExecutor, fixture_id: int) -> bool:
+        """
+        Requests the match detail of a fixture, once fewer than concurrency requests are in flight.
+
+        :return: False if no more requests can be made
+        """
+        while len(self._pending) >= self.concurrency:
+            self._collect(block=True)
+        if self.out_of_credits or not self._take_credit():
+            return False
+        future = executor.submit(
+            self.apifootball.get,
+            endpoint="match",
+            custom_ids={"fixture_id": fixture_id},
+            validate=self.validate,
+            priority="backfill"
+        )
+        self._pending[future] = fixture_id
+        return True
+
+    def _list_fixtures(self, league_id: int, executor: ThreadPoolExecutor) -> bool:
+        """
+        Streams the fixtures of a league to the fixtures shards, requesting the match detail of each fixture as it
+        arrives. The league is listed once all of its fixtures are in closed shards.
+
+        :return: False if no more requests can be made
+        """
+        if not self._take_credit():
+            return False
+        self.logger.info(f"Listing fixtures of league {league_id}.")
+        fixture_ids = []
+        fixtures = self.apifootball.get_stream(
+            endpoint="league_fixtures",
+            custom_ids={"league_id": league_id},
+            validate=self.validate,
+            priority="backfill"
+        )
+        try:
+            for fixture in fixtures:
+                self.fixtures.write(fixture)
+                if fixture["statusShort"] in self.statuses:
+                    fixture_ids.append(fixture["fixture_id"])
+                    # Once credits run out the listing is still written, the remaining matches are requested on resume
+                    if fixture["fixture_id"] not in self.checkpoint.done and not self.out_of_credits:
+                        self._submit(executor, fixture["fixture_id"])
+                self._collect(block=False)
+        except NoAvailableCredits:
+            self.fixtures.abort()
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to list fixtures of league {league_id}: {e}")
+            self.failed[league_id] = e
+            self.fixtures.abort()
+            return True
+
+        self.fixtures.close()
+        self.checkpoint.listed[league_id] = fixture_ids
+        self.checkpoint.save()
+        return not self.out_of_credits
+
+    def run(self) -> int:
+        """
+        Runs the download, or resumes it from the checkpoint.
+
+        :return: EXIT_COMPLETE, EXIT_FAILURES if any request failed or EXIT_OUT_OF_CREDITS if credits ran out
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="footballAPI") as executor:
+            try:
+                for league_id in self.league_ids:
+                    if league_id in self.checkpoint.listed:
+                        remaining = [
+                            fixture_id for fixture_id in self.checkpoint.listed[league_id]
+                            if fixture_id not in self.checkpoint.done
+                        ]
+                        self.logger.info(f"League {league_id} listed, {len(remaining)} match(es) remaining.")
+                        if not all(self._submit(executor, fixture_id) for fixture_id in remaining):
+                            break
+                    elif not self._list_fixtures(league_id, executor):
+                        break
+                while self._pending:
+                    self._collect(block=True)
+            except NoAvailableCredits:
+                self.out_of_credits = True
+            finally:
+                for future in self._pending:
+                    future.cancel()
+                self.matches.close()
+                self._mark_matches_done()
+
+        done = len(self.checkpoint.done)
+        if self.out_of_credits:
+            self.logger.warning(f"Stopped as credits ran out after {done} match(es), run again to resume.")
+            return EXIT_OUT_OF_CREDITS
+        if self.failed:
+            self.logger.error(f"{len(self.failed)} league(s) or match(es) failed, run again to retry them.")
+            return EXIT_FAILURES
+        self.logger.info(f"Downloaded {done} match(es) of {len(self.league_ids)} league(s).")
+        return EXIT_COMPLETE
+
+
+def _parse_league(value: str) -> Tuple[str, str, int]:
+    try:
+        country, league, season = value.split(":")
+        return country, league, int(season)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not of the form COUNTRY:LEAGUE:SEASON.")
+
+
+def _resolve_league_ids(apifootball: APIFootball, leagues: List[Tuple[str, str, int]]) -> List[int]:
+    """
+    Finds the league_id of each league from one call to the leagues endpoint.
+    """
+    from footballAPI.LeagueTable import find_league_id
+
+    all_leagues = apifootball.get(endpoint="leagues")["api"]["leagues"]
+    league_ids = []
+    for country, league, season in leagues:
+        league_id = find_league_id(all_leagues, country, league, season)
+        if not league_id:
+            raise ValueError(f"league_id not found for {country} {league} {season}, please check input parameters")
+        league_ids.append(league_id)
+    return league_ids
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="footballAPI", description="www.api-football.com tooling")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    download = commands.add_parser(
+        "download",
+        help="Download fixtures and match detail of leagues",
+        description="Downloads every fixture, and the match detail of each finished fixture, of a set of leagues "
+                    "and seasons to compressed shards. Progress is checkpointed, run the same command again to "
+                    "resume. Requires the API_KEY environment variable."
+    )
+    download.add_argument("--leagues", type=int, nargs="+", default=[], metavar="LEAGUE_ID",
+                          help="league_ids to download, unique to a league and season")
+    download.add_argument("--league", type=_parse_league, action="append", default=[],
+                          metavar="COUNTRY:LEAGUE:SEASON",
+                          help="A league to download, eg. 'England:Premier League:2019'")
+    download.add_argument("-o", "--output", default="footballAPI_data", help="Output directory")
+    download.add_argument("--format", choices=OUTPUT_FORMATS, default="ndjson", dest="output_format",
+                          help="gzip compressed NDJSON, or Parquet which requires pyarrow")
+    download.add_argument("--checkpoint", default=None, help="Checkpoint file, defaults to <output>/checkpoint.json")
+    download.add_argument("--concurrency", type=int, default=8, help="Maximum number of requests in flight")
+    download.add_argument("--shard-size", type=int, default=1000, help="Maximum number of records in a match shard")
+    download.add_argument("--max-credits", type=int, default=None,
+                          help="Maximum number of credits to use per UTC day, across restarts")
+    download.add_argument("--plan", choices=sorted(RATE_LIMIT_PLANS), default=None,
+                          help="Schedule requests within the per minute limit of a plan")
+    download.add_argument("--statuses", nargs="+", default=None,
+                          help="Fixture statuses to download the match detail of, defaults to finished fixtures")
+    download.add_argument("--no-validate", action="store_false", dest="validate",
+                          help="Skip validation of responses")
+    return parser
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(
+        format='[%(asctime)s][%(threadName)s][%(levelname)s]: %(message)s',
+        level=logging.INFO,
+        datefmt='%Y-%m-%d %H:%M:%S')
+    if not args.verbose:
+        logging.getLogger("footballAPI.APIFootball").setLevel(logging.WARNING)
+
+    if not args.leagues and not args.league:
+        sys.exit("footballAPI download: at least one of --leagues or --league is required.")
+
+    # Credits are tracked locally from the rate-limit headers, synced with the status endpoint on the first request
+    with APIFootball(credit_tracking="local", pool_size=args.concurrency + 1, rate_limiter=args.plan) as apifootball:
+        league_ids = list(args.leagues)
+        if args.league:
+            league_ids += _resolve_league_ids(apifootball, args.league)
+        league_ids = list(dict.fromkeys(league_ids))
+
+        downloader = Downloader(
+            apifootball=apifootball,
+            league_ids=league_ids,
+            output=args.output,
+            output_format=args.output_format,
+            checkpoint=args.checkpoint,
+            concurrency=args.concurrency,
+            shard_size=args.shard_size,
+            max_credits=args.max_credits,
+            statuses=args.statuses,
+            validate=args.validate
+        )
+        return downloader.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,8 +33,35 @@ class NoAvailableCredits(Exception):
     pass
 
 
+class NoResponseModel(Exception):
+    """
+    Raised when models are requested for an endpoint without a model in ENDPOINT_MODELS in Models.py.
+    """
+    pass
+
+
 class NoValidationSchema(Exception):
     """
     Raied when vaildation is required but no schema is available.
     """
     pass
+
+
+class RateLimitExceeded(InvalidStatusCode):
+    """
+    Raised when the API refuses a request with a 429 status code after all retries.
+    The seconds the API asked to wait before retrying are available from the retry_after attribute.
+    """
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SchemaValidationError(Exception):
+    """
+    Raised when the response from the API does not match its validation schema.
+    The validation errors are available from the errors attribute.
+    """
+    def __init__(self, message: str, errors: list = None):
+        super().__init__(message)
+        self.errors = errors or []
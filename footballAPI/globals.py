@@ -20,15 +20,126 @@ BASE_ENDPOINTS = [
     'odds',
     'match',
     'league_fixtures',
+    'league_fixtures_date',
+    'league_live_fixtures',
 ]
 
 # These are custom created endpoints to make the user experience easier. 
 CUSTOM_ENDPOINTS = {
     'match': 'fixtures/id/{fixture_id}',  # returns all data for a given fixture_id,
     'league_fixtures': 'fixtures/league/{league_id}',   # returns all fixtures for a given league_id
+    'league_fixtures_date': 'fixtures/league/{league_id}/{date}',   # returns fixtures for a league_id on a YYYY-MM-DD date
+    'league_live_fixtures': 'fixtures/live/{league_id}',   # returns fixtures in play for a given league_id
 }
 
 VALID_CUSTOM_IDS = [
     'fixture_id',
     'league_id',
+    'date',
 ]
+
+# Transient status codes which are retried with backoff by the session
+RETRY_STATUS_CODES = [
+    500,
+    502,
+    503,
+    504,
+]
+
+CREDIT_TRACKING_MODES = [
+    'status',  # queries the status endpoint after every request
+    'local',  # decrements credits locally, updating from the rate-limit response headers
+]
+
+# Daily quota headers returned with every response
+RATE_LIMIT_HEADERS = {
+    'limit': 'X-RateLimit-requests-Limit',
+    'remaining': 'X-RateLimit-requests-Remaining',
+}
+
+# Status code of responses refused by the per minute rate limit
+RATE_LIMITED_STATUS_CODE = 429
+
+# Status code of conditional requests whose cached response is still current
+NOT_MODIFIED_STATUS_CODE = 304
+
+# Validator headers stored with cached responses, and the conditional request header each is sent back in
+CONDITIONAL_HEADERS = {
+    'ETag': 'If-None-Match',
+    'Last-Modified': 'If-Modified-Since',
+}
+
+# Per minute request limits of each API-Sports plan
+RATE_LIMIT_PLANS = {
+    'free': 10,
+    'pro': 300,
+    'ultra': 450,
+    'mega': 900,
+}
+
+# Priorities of requests waiting for a RateLimiter, lower is served first
+REQUEST_PRIORITIES = {
+    'live': 0,  # live fixtures and odds
+    'normal': 1,
+    'backfill': 2,  # bulk downloads of past seasons
+}
+
+# Default cache TTLs in seconds per endpoint prefix, None never expires and 0 is never cached
+DEFAULT_CACHE_TTLS = {
+    'status': 0,
+    'timezone': None,
+    'countries': None,
+    'seasons': 86400,
+    'leagues': 86400,
+    'fixtures': 3600,
+    'fixtures/live': 15,
+    'odds': 300,
+}
+
+# Endpoint prefixes whose responses no longer change once every fixture in them has finished, cached with the
+# finished_ttl of the ResponseCache. League ids are unique per season, so a completed season is finished for good
+FINISHED_TTL_ENDPOINTS = [
+    'fixtures/league',
+    'fixtures/id',
+]
+
+VALIDATION_BACKENDS = [
+    'jsonschema',
+    'fastjsonschema',  # optional, compiles schemas to python code
+]
+
+# Fixture statuses which will not change again
+FINISHED_STATUSES = [
+    'FT',  # match finished
+    'AET',  # match finished after extra time
+    'PEN',  # match finished after penalties
+    'CANC',  # match cancelled
+    'ABD',  # match abandoned
+    'AWD',  # technical loss
+    'WO',  # walkover
+]
+
+# Days after its scheduled date that FixtureStore.sync keeps re-fetching the date of a fixture which has not finished.
+# Postponed, suspended or TBD fixtures left on their old date are not re-fetched after this, until a full refresh
+SYNC_PENDING_DAYS = 3
+
+# Criteria which may order teams level on points in LeagueTable.extended_table. H2H criteria are taken from a
+# mini-table of the fixtures between the teams level on points only
+TIEBREAK_CRITERIA = [
+    'GD',  # goal difference
+    'GF',  # goals scored
+    'W',  # wins
+    'AWAY_GF',  # away goals scored
+    'H2H_PTS',  # head-to-head points
+    'H2H_GD',  # head-to-head goal difference
+    'H2H_GF',  # head-to-head goals scored
+]
+
+DEFAULT_TIEBREAKERS = ['GD', 'GF']
+
+# Tiebreakers applied in order to teams level on points, keyed on the (country, league) names of the leagues endpoint
+LEAGUE_TIEBREAKERS = {
+    ('ITALY', 'SERIE A'): ['H2H_PTS', 'H2H_GD', 'GD', 'GF'],
+    ('SPAIN', 'PRIMERA DIVISION'): ['H2H_PTS', 'H2H_GD', 'GD', 'GF'],
+    ('SPAIN', 'LA LIGA'): ['H2H_PTS', 'H2H_GD', 'GD', 'GF'],
+}
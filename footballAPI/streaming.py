@@ -0,0 +1,124 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Tuple
+
+_WHITESPACE = " \t\n\r"
+# Characters which may continue a number, eg. 1. or 1e may be cut at a chunk boundary
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_DECODER = json.JSONDecoder()
+
+
+class _StreamReader:
+    def __init__(self, chunks: Iterable[bytes]):
+        """
+        Incrementally decodes a stream of JSON bytes, only holding the unconsumed part of the stream in memory.
+
+        :param chunks: The chunks of the response body
+        """
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """
+        Reads the next chunk into the buffer, discarding what has already been consumed.
+
+        return: False if the stream is exhausted
+        """
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+
+        return: The next character, or an empty string at the end of the stream
+        """
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """
+        Consumes the next non whitespace character, which must be one of chars.
+
+        :param chars: The permitted characters
+
+        return: The consumed character
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} at position {self.pos} of stream, found {char!r}.")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """
+        Decodes the next complete JSON value, reading more of the stream until it is complete.
+
+        return: The decoded value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number whose remaining characters could continue it may continue in the next chunk
+            if isinstance(value, (int, float)) and not isinstance(value, bool) \
+                    and _NUMBER_CHARS.issuperset(self.buf[end:]) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_items(chunks: Iterable[bytes], path: Tuple[str, ...]) -> Iterator[Any]:
+    """
+    Yields the items of the array found at path of a streamed JSON document one at a time, as the stream arrives.
+    Values before the array are skipped and the stream is not read past the end of the array.
+
+    :param chunks: The chunks of the response body, eg. Response.iter_content()
+    :param path: The keys of the nested objects leading to the array, eg. ('api', 'fixtures')
+
+    return: An iterator over the items of the array
+    """
+    reader = _StreamReader(chunks)
+
+    for key in path:
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                raise KeyError(f"{key} not found in stream.")
+            current_key = reader.value()
+            reader.expect(":")
+            if current_key == key:
+                break
+            reader.value()
+            if reader.peek() == ",":
+                reader.expect(",")
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
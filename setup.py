@@ -13,6 +13,17 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=requirements,
+    python_requires='>=3.9',
+    extras_require={
+        'fast': ['fastjsonschema>=2.14.0'],
+        'arrow': ['pyarrow>=1.0.0'],
+        'benchmark': ['pytest-benchmark>=3.2.0'],
+        'prometheus': ['prometheus_client>=0.8.0'],
+        'brotli': ['brotli>=1.0.9'],
+    },
+    entry_points={
+        'console_scripts': ['footballAPI=footballAPI.cli:main'],
+    },
     license='MIT',
     zip_safe=False
 )
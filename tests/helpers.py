@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Dict, Union
+
+from footballAPI import APIFootball
+
+
+def make_fixture(
+        fixture_id: int,
+        home: str,
+        away: str,
+        goals_home: Union[int, None],
+        goals_away: Union[int, None],
+        status: str = "FT",
+        league_id: int = 1,
+        day: int = 1,
+        event_date: Union[str, None] = None,
+        **fields
+) -> Dict:
+    """
+    Builds a fixture as returned by the fixtures endpoints, kicking off at 15:00 UTC on a day of August 2020.
+    :param event_date: ISO 8601 date of the fixture, overriding day
+    :param fields: Any other fields of the fixture, eg. league
+    """
+    event_date = event_date or f"2020-08-{day:02d}T15:00:00+00:00"
+    fixture = {
+        "fixture_id": fixture_id,
+        "league_id": league_id,
+        "event_date": event_date,
+        "event_timestamp": int(datetime.fromisoformat(event_date).timestamp()),
+        "round": "Regular Season - 1",
+        "statusShort": status,
+        "homeTeam": {"team_id": ord(home[0]), "team_name": home},
+        "awayTeam": {"team_id": ord(away[0]), "team_name": away},
+        "goalsHomeTeam": goals_home,
+        "goalsAwayTeam": goals_away,
+        "score": {
+            "halftime": None,
+            "fulltime": None if goals_home is None else f"{goals_home}-{goals_away}",
+            "extratime": None,
+            "penalty": None
+        },
+    }
+    fixture.update(fields)
+    return fixture
+
+
+def local_apifootball(**kwargs) -> APIFootball:
+    """
+    Builds an APIFootball tracking credits locally with 100 credits available, so no request is made to the status
+    endpoint.
+    :param kwargs: Any other arguments of APIFootball
+    """
+    apifootball = APIFootball(api_key="test", credit_tracking="local", **kwargs)
+    apifootball.available_credits = 100
+    apifootball._last_credit_sync = 0
+    return apifootball
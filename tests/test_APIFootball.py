@@ -1,8 +1,17 @@
+import threading
+import time
+from unittest import mock
+
 import pytest
 
-from footballAPI import APIFootball
+from footballAPI import APIFootball, MemoryCache, RateLimiter
+
+from footballAPI.APIFootball import _default_validator
+from footballAPI.exceptions import InvalidCustomId, InvalidStatusCode, NoAvailableCredits, NoResponseModel, \
+    RateLimitExceeded, SchemaValidationError
+from footballAPI.Models import League
 
-from footballAPI.exceptions import InvalidCustomId, InvalidStatusCode
+from helpers import local_apifootball
 
 
 class TestAPIFootball:
@@ -42,3 +51,398 @@ class TestAPIFootball:
     def test_custom_endpoint_no_ids_dryrun(self):
         with pytest.raises(ValueError):
             self.api.get(endpoint='match', dryrun=True)
+
+
+class TestAPIFootballSession:
+    def setup_method(self):
+        with mock.patch.object(APIFootball, "update_credits"):
+            self.api = APIFootball(api_key="test", pool_size=4, max_retries=2, timeout=10)
+
+    def test_payload_includes_timeout(self):
+        assert self.api._build_payload("status")["timeout"] == 10
+
+    def test_session_pool_and_retries(self):
+        adapter = self.api.session.get_adapter("https://v2.api-football.com/")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 2
+
+    def test_context_manager_closes_session(self):
+        with mock.patch.object(self.api.session, "close") as close:
+            with self.api as api:
+                assert api is self.api
+        close.assert_called_once()
+
+
+class TestAPIFootballStatusCredits:
+    def setup_method(self):
+        with mock.patch.object(APIFootball, "update_credits"):
+            self.api = APIFootball(api_key="test")
+        self.api.available_credits = 2
+        self.resync = threading.Event()
+
+    def _update_credits(self, priority="normal"):
+        self.resync.wait(1)
+
+    def test_no_overdraw_while_resync_pending(self):
+        resp = mock.Mock(status_code=200, headers={})
+        resp.json.return_value = {"api": {"results": 0}}
+        with mock.patch.object(self.api.session, "get", return_value=resp) as get, \
+                mock.patch.object(self.api, "update_credits", side_effect=self._update_credits):
+            threads = [
+                threading.Thread(target=self.api.get, kwargs={"endpoint": endpoint, "validate": False})
+                for endpoint in ["countries", "seasons"]
+            ]
+            for thread in threads:
+                thread.start()
+            # Both requests have completed and are waiting on the status resync
+            while get.call_count < 2 or self.api._in_flight:
+                time.sleep(0.001)
+            for endpoint in ["leagues", "timezone"]:
+                with pytest.raises(NoAvailableCredits):
+                    self.api.get(endpoint=endpoint, validate=False)
+            self.resync.set()
+            for thread in threads:
+                thread.join()
+        assert get.call_count == 2
+        assert self.api.available_credits == 0
+
+
+class TestAPIFootballLocalCredits:
+    def setup_method(self):
+        self.api = APIFootball(api_key="test", credit_tracking="local", resync_calls=2)
+
+    @staticmethod
+    def _response(headers=None):
+        resp = mock.Mock(status_code=200, headers=headers or {})
+        resp.json.return_value = {"api": {"results": 0, "countries": []}}
+        return resp
+
+    def test_no_status_call_on_init(self):
+        assert self.api.available_credits is None
+
+    def test_credits_from_headers(self):
+        self.api.available_credits = 10
+        self.api._last_credit_sync = 0
+        self.api._record_credit_usage(self._response({"X-RateLimit-requests-Remaining": "5"}))
+        assert self.api.available_credits == 4
+
+    def test_credits_decremented_without_headers(self):
+        self.api.available_credits = 10
+        self.api._last_credit_sync = 0
+        self.api._record_credit_usage(self._response())
+        assert self.api.available_credits == 9
+
+    def test_resync_after_calls(self):
+        self.api.available_credits = 10
+        self.api._calls_since_sync = 2
+        assert self.api._credits_stale()
+
+    def test_no_available_credits(self):
+        self.api.available_credits = 0
+        self.api._last_credit_sync = 0
+        with mock.patch.object(self.api.session, "get") as get:
+            with pytest.raises(NoAvailableCredits):
+                self.api.get(endpoint="countries", validate=False)
+        get.assert_not_called()
+
+
+class TestAPIFootballGetMany:
+    def setup_method(self):
+        self.api = local_apifootball()
+
+    @staticmethod
+    def _get(url, **kwargs):
+        resp = mock.Mock(status_code=404 if url.endswith("/3") else 200, headers={})
+        resp.json.return_value = {"url": url}
+        return resp
+
+    def test_get_many_ordered_with_failure(self):
+        endpoints = ["match"] * 5
+        custom_ids_list = [{"fixture_id": i} for i in range(5)]
+        with mock.patch.object(self.api.session, "get", side_effect=self._get):
+            results = self.api.get_many(endpoints, custom_ids_list, validate=False, max_workers=3)
+        assert [result.index for result in results] == list(range(5))
+        assert isinstance(results[3].error, InvalidStatusCode)
+        assert results[4].data["url"].endswith("fixtures/id/4")
+        assert self.api.available_credits == 95
+
+    def test_get_many_unordered(self):
+        with mock.patch.object(self.api.session, "get", side_effect=self._get):
+            results = self.api.get_many(["countries", "seasons"], validate=False, ordered=False)
+            assert sorted(result.index for result in results) == [0, 1]
+
+    def test_get_many_mismatched_lengths(self):
+        with pytest.raises(ValueError):
+            self.api.get_many(["countries", "seasons"], [None])
+
+
+class TestAPIFootballRateLimit:
+    def setup_method(self):
+        self.api = local_apifootball(rate_limiter="mega", max_rate_limit_retries=2, backoff_factor=0)
+
+    @staticmethod
+    def _response(status_code, headers=None):
+        resp = mock.Mock(status_code=status_code, headers=headers or {})
+        resp.json.return_value = {"api": {"results": 0, "countries": []}}
+        return resp
+
+    def test_rate_limiter_from_plan(self):
+        assert isinstance(self.api.rate_limiter, RateLimiter)
+        assert self.api.rate_limiter.rate == 900
+
+    def test_retry_after_429(self):
+        responses = [self._response(429, {"Retry-After": "0"}), self._response(200)]
+        with mock.patch.object(self.api.session, "get", side_effect=responses) as get, \
+                mock.patch.object(self.api.rate_limiter, "backoff") as backoff:
+            data = self.api.get(endpoint="countries", validate=False, priority="live")
+        assert data["api"]["results"] == 0
+        assert get.call_count == 2
+        backoff.assert_called_once_with(0.0)
+        assert self.api.available_credits == 99
+
+    def test_429_after_all_retries(self):
+        with mock.patch.object(self.api.session, "get", return_value=self._response(429)) as get:
+            with pytest.raises(RateLimitExceeded):
+                self.api.get(endpoint="countries", validate=False)
+        assert get.call_count == 3
+        assert self.api._in_flight == 0
+        assert self.api.available_credits == 100
+
+    def test_status_requests_rate_limited(self):
+        self.api.credit_tracking = "status"
+        status = mock.Mock(status_code=200, headers={})
+        status.json.return_value = {"api": {"status": {"requests_limit_day": 100, "requests": 10}}}
+        with mock.patch.object(self.api.session, "get", side_effect=[self._response(200), status]), \
+                mock.patch.object(self.api, "_validate_data"), \
+                mock.patch.object(self.api.rate_limiter, "acquire", return_value=True) as acquire:
+            self.api.get(endpoint="countries", validate=False, priority="live")
+        assert acquire.call_args_list == [mock.call("live"), mock.call("live")]
+        assert self.api.available_credits == 89
+
+    @staticmethod
+    def _status():
+        status = mock.Mock(status_code=200, headers={})
+        status.json.return_value = {"api": {"status": {"requests_limit_day": 100, "requests": 10}}}
+        return status
+
+    def test_status_429_retried(self):
+        self.api.credit_tracking = "status"
+        responses = [self._response(200), self._response(429, {"Retry-After": "0"}), self._status()]
+        with mock.patch.object(self.api.session, "get", side_effect=responses) as get, \
+                mock.patch.object(self.api, "_validate_data"):
+            data = self.api.get(endpoint="countries", validate=False)
+        assert data["api"]["results"] == 0
+        assert get.call_count == 3
+        assert self.api.available_credits == 89
+
+    def test_failed_status_resync_keeps_response(self):
+        self.api.credit_tracking = "status"
+        responses = [self._response(200)] + [self._response(429)] * 3 + [self._status(), self._response(200), self._status()]
+        with mock.patch.object(self.api.session, "get", side_effect=responses) as get, \
+                mock.patch.object(self.api, "_validate_data"):
+            assert self.api.get(endpoint="countries", validate=False)["api"]["results"] == 0
+            assert self.api.available_credits == 99
+            assert self.api._credits_stale()
+            self.api.get(endpoint="leagues", validate=False, use_cache=False)
+        assert "status" in str(get.call_args_list[4])
+        assert not self.api._resync_pending
+        assert self.api.available_credits == 89
+
+
+class TestAPIFootballSingleFlight:
+    def setup_method(self):
+        self.api = local_apifootball()
+        self.release = threading.Event()
+
+    def _get(self, url, **kwargs):
+        self.release.wait(1)
+        resp = mock.Mock(status_code=404 if url.endswith("/3") else 200, headers={})
+        resp.json.return_value = {"url": url}
+        return resp
+
+    def _run(self, requests):
+        results = [None] * len(requests)
+
+        def run(index, kwargs):
+            try:
+                results[index] = self.api.get(validate=False, **kwargs)
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=run, args=item) for item in enumerate(requests)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_requests_share_one_request(self):
+        requests = [{"endpoint": "match", "custom_ids": {"fixture_id": 1}}] * 5 + [{"endpoint": "countries"}]
+        with mock.patch.object(self.api.session, "get", side_effect=self._get) as get:
+            results = self._run(requests)
+        assert get.call_count == 2
+        assert all(result is results[0] for result in results[:5])
+        assert self.api.available_credits == 98
+        assert not self.api._flights
+
+    def test_error_shared(self):
+        with mock.patch.object(self.api.session, "get", side_effect=self._get) as get:
+            results = self._run([{"endpoint": "match", "custom_ids": {"fixture_id": 3}}] * 3)
+        assert get.call_count == 1
+        assert all(isinstance(result, InvalidStatusCode) for result in results)
+
+    def test_disabled(self):
+        self.api.single_flight = False
+        with mock.patch.object(self.api.session, "get", side_effect=self._get) as get:
+            self._run([{"endpoint": "countries"}] * 3)
+        assert get.call_count == 3
+
+
+class TestAPIFootballCache:
+    def setup_method(self):
+        self.api = local_apifootball(cache=MemoryCache())
+
+    def test_cache_hit_skips_network_and_credits(self):
+        resp = mock.Mock(status_code=200, headers={})
+        resp.json.return_value = {"api": {"results": 0, "countries": []}}
+        with mock.patch.object(self.api.session, "get", return_value=resp) as get:
+            first = self.api.get(endpoint="countries", validate=True)
+            second = self.api.get(endpoint="countries", validate=True)
+        assert first == second
+        assert get.call_count == 1
+        assert self.api.available_credits == 99
+        assert self.api.cache.stats["hits"] == 1
+
+    def test_not_modified_reuses_cached_response(self):
+        self.api.cache = MemoryCache(ttls={"leagues": 0.01})
+        resp = mock.Mock(status_code=200, headers={"ETag": '"v1"', "Last-Modified": "Sat, 01 Aug 2020 15:00:00 GMT"})
+        resp.json.return_value = {"api": {"results": 0, "leagues": []}}
+        not_modified = mock.Mock(status_code=304, headers={"ETag": '"v1"'})
+        with mock.patch.object(self.api.session, "get", side_effect=[resp, not_modified]) as get:
+            first = self.api.get(endpoint="leagues", validate=True)
+            time.sleep(0.02)
+            second = self.api.get(endpoint="leagues", validate=True)
+        assert second == first
+        assert "If-None-Match" not in get.call_args_list[0].kwargs["headers"]
+        headers = get.call_args_list[1].kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Sat, 01 Aug 2020 15:00:00 GMT"
+        assert not_modified.json.call_count == 0
+        assert self.api.cache.stats["revalidations"] == 1
+        assert self.api.cache.lookup("leagues").fresh
+
+    def test_unvalidated_response_not_cached(self):
+        resp = mock.Mock(status_code=200, headers={})
+        resp.json.return_value = {"api": {"results": 0, "countries": []}}
+        with mock.patch.object(self.api.session, "get", return_value=resp) as get:
+            self.api.get(endpoint="countries", validate=False)
+            self.api.get(endpoint="countries")
+            self.api.get(endpoint="countries", validate=False)
+        assert get.call_count == 2
+        assert self.api.cache.stats["hits"] == 1
+
+    def test_custom_schema_bypasses_cache(self):
+        resp = mock.Mock(status_code=200, headers={})
+        resp.json.return_value = {"api": {"results": 0, "countries": []}}
+        with mock.patch.object(self.api.session, "get", return_value=resp) as get:
+            self.api.get(endpoint="countries")
+            self.api.get(endpoint="countries", validation_schema={"type": "object", "required": ["api"]})
+        assert get.call_count == 2
+        assert self.api.cache.stats["hits"] == 0
+
+    def test_not_modified_without_cached_response(self):
+        with mock.patch.object(self.api.session, "get", return_value=mock.Mock(status_code=304, headers={})):
+            with pytest.raises(InvalidStatusCode):
+                self.api.get(endpoint="leagues", validate=False, use_cache=False)
+
+    def test_accept_encoding(self):
+        assert "gzip" in self.api.session.headers["Accept-Encoding"]
+
+
+class TestAPIFootballModels:
+    def setup_method(self):
+        self.api = local_apifootball()
+
+    def test_get_as_model(self):
+        resp = mock.Mock(status_code=200, headers={})
+        resp.json.return_value = {"api": {"results": 1, "leagues": [{"league_id": 2, "name": "Premier League"}]}}
+        with mock.patch.object(self.api.session, "get", return_value=resp):
+            leagues = self.api.get(endpoint="leagues", validate=False, as_model=True)
+        assert leagues == [League({"league_id": 2, "name": "Premier League"})]
+
+    @pytest.mark.parametrize("endpoint", ["odds", "fixtures/rounds/2", "teams/statistics/2/33", "players/seasons"])
+    def test_no_model_fails_before_request(self, endpoint):
+        with mock.patch.object(self.api.session, "get") as get:
+            with pytest.raises(NoResponseModel):
+                self.api.get(endpoint=endpoint, as_model=True)
+        get.assert_not_called()
+        assert self.api.available_credits == 100
+
+
+class TestAPIFootballValidation:
+    invalid_status = {"api": {"status": {"user": 1, "active": "No"}}}
+
+    def test_validators_compiled_once(self):
+        assert _default_validator("status", "jsonschema") is _default_validator("status", "jsonschema")
+
+    def test_validation_error_raised(self):
+        api = APIFootball(api_key="test", credit_tracking="local")
+        with pytest.raises(SchemaValidationError) as e:
+            api._validate_data(endpoint="status", data=self.invalid_status)
+        assert len(e.value.errors) > 1
+
+    def test_fail_fast(self):
+        api = APIFootball(api_key="test", credit_tracking="local", fail_fast=True)
+        with pytest.raises(SchemaValidationError) as e:
+            api._validate_data(endpoint="status", data=self.invalid_status)
+        assert len(e.value.errors) == 1
+
+    def test_fastjsonschema_backend(self):
+        pytest.importorskip("fastjsonschema")
+        api = APIFootball(api_key="test", credit_tracking="local", validation_backend="fastjsonschema")
+        with pytest.raises(SchemaValidationError):
+            api._validate_data(endpoint="status", data=self.invalid_status)
+        assert api._validate_data(endpoint="countries", data={"api": {"results": 0, "countries": []}}) is None
+
+
+class TestAPIFootballStream:
+    def setup_method(self):
+        self.api = local_apifootball()
+
+    @staticmethod
+    def _response(payload):
+        resp = mock.MagicMock(status_code=200, headers={})
+        resp.iter_content.return_value = [payload.encode()]
+        return resp
+
+    def test_get_stream_yields_items(self):
+        resp = self._response('{"api": {"results": 2, "leagues": [{"league_id": 1}, {"league_id": 2}]}}')
+        with mock.patch.object(self.api.session, "get", return_value=resp) as get:
+            items = list(self.api.get_stream(endpoint="leagues", validate=False))
+        assert items == [{"league_id": 1}, {"league_id": 2}]
+        assert get.call_args.kwargs["stream"] is True
+        assert self.api.available_credits == 99
+
+    def test_get_stream_validates_items(self):
+        resp = self._response('{"api": {"results": 1, "fixtures": [{"fixture_id": 1}]}}')
+        with mock.patch.object(self.api.session, "get", return_value=resp):
+            with pytest.raises(SchemaValidationError):
+                list(self.api.get_stream(endpoint="league_fixtures", custom_ids={"league_id": 2}))
+
+    def test_get_stream_closes_response_on_invalid_status(self):
+        resp = self._response("")
+        resp.status_code = 500
+        with mock.patch.object(self.api.session, "get", return_value=resp):
+            with pytest.raises(InvalidStatusCode):
+                list(self.api.get_stream(endpoint="leagues", validate=False))
+        resp.close.assert_called_once()
+
+    def test_get_stream_closes_response_when_abandoned(self):
+        resp = self._response('{"api": {"results": 2, "leagues": [{"league_id": 1}, {"league_id": 2}]}}')
+        with mock.patch.object(self.api.session, "get", return_value=resp):
+            items = self.api.get_stream(endpoint="leagues", validate=False)
+            next(items)
+            items.close()
+        resp.close.assert_called_once()
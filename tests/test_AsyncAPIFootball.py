@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from footballAPI import AsyncAPIFootball
+
+from footballAPI.exceptions import InvalidEndpoint, NoAvailableCredits
+
+from helpers import local_apifootball
+
+
+class TestAsyncAPIFootball:
+    def setup_method(self):
+        self.api = local_apifootball()
+        self.async_api = AsyncAPIFootball(apifootball=self.api, concurrency=4)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def teardown_method(self):
+        self.async_api.close()
+        self.api.close()
+
+    def _get(self, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        resp = mock.Mock(status_code=200, headers={})
+        resp.json.return_value = {"url": url}
+        return resp
+
+    def test_gather_preserves_order(self):
+        requests = [{"endpoint": "match", "custom_ids": {"fixture_id": i}, "validate": False} for i in range(10)]
+        with mock.patch.object(self.api.session, "get", side_effect=self._get):
+            results = asyncio.run(self.async_api.gather(requests, concurrency=2))
+        assert [r["url"].split("/")[-1] for r in results] == [str(i) for i in range(10)]
+        assert self.max_in_flight <= 2
+        assert self.api.available_credits == 90
+
+    def test_get_as_model(self):
+        resp = mock.Mock(status_code=200, headers={})
+        resp.json.return_value = {"api": {"results": 1, "fixtures": [{"fixture_id": 1, "events": []}]}}
+        with mock.patch.object(self.api.session, "get", return_value=resp):
+            matches = asyncio.run(self.async_api.get(
+                endpoint="match", custom_ids={"fixture_id": 1}, validate=False, as_model=True
+            ))
+        assert matches[0].fixture_id == 1
+        assert matches[0].events == ()
+
+    def test_in_flight_never_exceeds_credits(self):
+        self.api.available_credits = 3
+        requests = [{"endpoint": "match", "custom_ids": {"fixture_id": i}, "validate": False} for i in range(6)]
+        with mock.patch.object(self.api.session, "get", side_effect=self._get):
+            results = asyncio.run(self.async_api.gather(requests, return_exceptions=True))
+        assert sum(isinstance(r, NoAvailableCredits) for r in results) >= 3
+        assert self.max_in_flight <= 3
+
+    def test_invalid_endpoint(self):
+        with pytest.raises(InvalidEndpoint):
+            asyncio.run(self.async_api.get(endpoint="invalid"))
+
+    def test_identical_requests_share_one_request(self):
+        requests = [{"endpoint": "countries", "validate": False} for _ in range(4)]
+        with mock.patch.object(self.api.session, "get", side_effect=self._get) as get:
+            results = asyncio.run(self.async_api.gather(requests))
+        assert get.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert self.api.available_credits == 99
+
+    def test_close_leaves_shared_client_open(self):
+        with mock.patch.object(self.api, "close") as close:
+            self.async_api.close()
+        close.assert_not_called()
+
+    def test_close_closes_own_client(self):
+        async_api = AsyncAPIFootball(api_key="test", credit_tracking="local")
+        with mock.patch.object(async_api.apifootball, "close") as close:
+            async_api.close()
+        close.assert_called_once()
+
+    def test_aclose_does_not_block_event_loop(self):
+        release = threading.Event()
+        self.async_api._executor.submit(release.wait, 1)
+
+        async def release_soon():
+            await asyncio.sleep(0.01)
+            release.set()
+
+        async def close():
+            task = asyncio.create_task(release_soon())
+            start = time.monotonic()
+            await self.async_api.aclose()
+            await task
+            return time.monotonic() - start
+
+        assert asyncio.run(close()) < 0.5
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from footballAPI import FixtureStore
+from footballAPI.FixtureStore import normalize_fixtures
+
+from helpers import make_fixture
+
+
+FIXTURES = [
+    make_fixture(1, "Alpha", "Bravo", 2, 0, league_id=10),
+    make_fixture(2, "Bravo", "Alpha", None, None, status="NS", league_id=10),
+    make_fixture(3, "Xray", "Yankee", 1, 1, league_id=20),
+]
+
+
+class TestFixtureStore:
+    def setup_method(self):
+        self.store = FixtureStore.from_api(FIXTURES)
+
+    def test_compact_dtypes(self):
+        dtypes = self.store.fixtures.dtypes
+        assert dtypes["fixture_id"] == "int32"
+        assert dtypes["goalsHomeTeam"] == "Int8"
+        assert isinstance(dtypes["homeTeam.team_name"], pd.CategoricalDtype)
+        assert isinstance(dtypes["event_date"], pd.DatetimeTZDtype)
+
+    def test_missing_nested_fields(self):
+        assert self.store.fixtures["league.name"].isna().all()
+        assert self.store.fixtures["goalsHomeTeam"].isna().sum() == 1
+
+    def test_ft_fixtures(self):
+        assert self.store.ft_fixtures()["fixture_id"].tolist() == [1, 3]
+        assert self.store.ft_fixtures(league_id=10)["fixture_id"].tolist() == [1]
+
+    def test_add_replaces_fixtures(self):
+        self.store.add([
+            make_fixture(2, "Bravo", "Alpha", 3, 3, league_id=10),
+            make_fixture(4, "Yankee", "Xray", 0, 1, league_id=20)
+        ])
+        assert self.store.fixtures["fixture_id"].tolist() == [1, 3, 2, 4]
+        assert self.store.ft_fixtures(league_id=10)["goalsHomeTeam"].tolist() == [2, 3]
+        dtypes = self.store.fixtures.drop(columns="updated_at").dtypes
+        assert dtypes.astype(str).equals(normalize_fixtures(FIXTURES).dtypes.astype(str))
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_round_trip(self, tmp_path, fmt):
+        pytest.importorskip("pyarrow")
+        path = str(tmp_path / f"fixtures.{fmt}")
+        getattr(self.store, f"to_{fmt}")(path)
+        assert getattr(FixtureStore, f"read_{fmt}")(path).fixtures.equals(self.store.fixtures)
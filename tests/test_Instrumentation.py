@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+
+from footballAPI import MemoryCache, RequestMetrics
+from footballAPI.exceptions import InvalidStatusCode
+from footballAPI.Instrumentation import NULL_METRICS, REQUEST_PHASES
+
+from helpers import local_apifootball
+
+
+def _response(status_code=200):
+    resp = mock.Mock(status_code=status_code, headers={"Content-Length": "42"})
+    resp.raw.retries.history = [mock.Mock()]
+    resp.json.return_value = {"api": {"results": 0, "countries": []}}
+    return resp
+
+
+class TestRequestMetrics:
+    def test_phase_accumulates(self):
+        metrics = RequestMetrics("fixtures/league/2")
+        with metrics.phase("network"):
+            pass
+        with metrics.phase("network"):
+            pass
+        assert set(metrics.timings) == {"network"}
+        assert metrics.total == metrics.timings["network"] > 0
+        assert metrics.core_endpoint == "fixtures"
+
+    def test_null_metrics_ignores_everything(self):
+        with NULL_METRICS.phase("network"):
+            NULL_METRICS.cache_hit = True
+        NULL_METRICS.record_response(_response())
+        assert not hasattr(NULL_METRICS, "cache_hit")
+
+
+class TestAPIFootballMetricsHooks:
+    def setup_method(self):
+        self.metrics = []
+        self.api = local_apifootball(cache=MemoryCache(), metrics_hooks=[self.metrics.append])
+
+    def test_request_metrics(self):
+        with mock.patch.object(self.api.session, "get", return_value=_response()):
+            self.api.get(endpoint="countries")
+        metrics, = self.metrics
+        assert list(metrics.timings) == [phase for phase in REQUEST_PHASES if phase not in ("flight", "queue")]
+        assert metrics.status_code == 200
+        assert metrics.bytes_received == 42
+        assert metrics.retries == 1
+        assert metrics.credits_used == 1
+        assert metrics.credits_available == 99
+        assert not metrics.cache_hit
+
+    def test_cache_hit_metrics(self):
+        with mock.patch.object(self.api.session, "get", return_value=_response()):
+            self.api.get(endpoint="countries", validate=True)
+            self.api.get(endpoint="countries", validate=True)
+        hit = self.metrics[1]
+        assert hit.cache_hit
+        assert list(hit.timings) == ["cache"]
+        assert hit.credits_used == 0
+
+    def test_error_metrics(self):
+        with mock.patch.object(self.api.session, "get", return_value=_response(404)):
+            with pytest.raises(InvalidStatusCode):
+                self.api.get(endpoint="countries")
+        metrics, = self.metrics
+        assert isinstance(metrics.error, InvalidStatusCode)
+        assert metrics.status_code == 404
+        assert "decode" not in metrics.timings
+
+    def test_failing_hook_does_not_fail_request(self):
+        self.api.add_metrics_hook(mock.Mock(side_effect=RuntimeError))
+        with mock.patch.object(self.api.session, "get", return_value=_response()):
+            assert self.api.get(endpoint="countries", validate=False)
+        assert len(self.metrics) == 1
+
+    def test_no_hooks_uses_null_metrics(self):
+        self.api.metrics_hooks = []
+        with mock.patch.object(self.api, "_get_data") as get_data:
+            self.api.get(endpoint="countries")
+        assert get_data.call_args[0][-1] is NULL_METRICS
+
+
+class TestPrometheusMetrics:
+    def test_export(self):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        from footballAPI import PrometheusMetrics
+
+        registry = prometheus_client.CollectorRegistry()
+        api = local_apifootball(metrics_hooks=[PrometheusMetrics(registry)])
+        with mock.patch.object(api.session, "get", return_value=_response()):
+            api.get(endpoint="countries", validate=False)
+
+        sample = registry.get_sample_value
+        assert sample("footballapi_requests_total", {"endpoint": "countries", "outcome": "ok"}) == 1
+        assert sample("footballapi_request_phase_seconds_count", {"endpoint": "countries", "phase": "network"}) == 1
+        assert sample("footballapi_response_bytes_total", {"endpoint": "countries"}) == 42
+        assert sample("footballapi_retries_total", {"endpoint": "countries"}) == 1
+        assert sample("footballapi_credits_used_total", {"endpoint": "countries"}) == 1
+        assert sample("footballapi_credits_available") == 99
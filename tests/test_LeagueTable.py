@@ -1,6 +1,15 @@
+from datetime import date, datetime
+from unittest import mock
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from footballAPI import LeagueTable
+from footballAPI.APIFootball import BatchResult
+from footballAPI.LeagueTable import calculate_points
+
+from helpers import local_apifootball, make_fixture
 
 
 class TestLeagueTable:
@@ -17,32 +26,6 @@ class TestLeagueTable:
     def test_valid_league_fixtures(self):
         assert len(self.league_table.ft_fixtures.index == 380)
 
-    def test_determine_points_home_win(self):
-        assert self.league_table._determine_points(fixture_id=1, home_goals=5, away_goals=1) == {
-            "fixture_id": 1, "home_points": 3, "away_points": 0
-        }
-
-    def test_determine_points_away_win(self):
-        assert self.league_table._determine_points(fixture_id=1, home_goals=0, away_goals=1) == {
-            "fixture_id": 1, "home_points": 0, "away_points": 3
-        }
-
-    def test_determine_points_draw(self):
-        assert self.league_table._determine_points(fixture_id=1, home_goals=1, away_goals=1) == {
-            "fixture_id": 1, "home_points": 1, "away_points": 1
-        }
-
-    def test_add_points(self):
-        df = self.league_table._add_points(self.league_table.ft_fixtures)
-        test_fixture_pts = df[df["fixture_id"] == 192297][["home_points", "away_points"]]
-        expected_pts = pd.DataFrame(data={"home_points": [3], "away_points": [0]})
-        assert test_fixture_pts.equals(expected_pts)
-
-    def test_get_all_results(self):
-        df = self.league_table._add_points(self.league_table.ft_fixtures)
-        all_results = self.league_table._get_all_results(df)
-        assert len(all_results.index == 380)
-
     def test_league_table(self):
         expected_df = pd.DataFrame(data={
             "POS": [1],
@@ -55,3 +38,175 @@ class TestLeagueTable:
         })
         final_table = self.league_table.league_table()
         assert final_table[final_table["POS"] == 1].equals(expected_df)
+
+
+class TestCalculatePoints:
+    def test_default_points(self):
+        home_points, away_points = calculate_points(np.array([5, 0, 1]), np.array([1, 1, 1]))
+        assert home_points.tolist() == [3, 0, 1]
+        assert away_points.tolist() == [0, 3, 1]
+
+    def test_custom_points(self):
+        home_points, away_points = calculate_points(np.array([2, 1]), np.array([0, 1]), points=(2, 1, 0))
+        assert home_points.tolist() == [2, 1]
+        assert away_points.tolist() == [0, 1]
+
+
+FIXTURES = [
+    make_fixture(1, "Alpha", "Bravo", 2, 0, day=1),
+    make_fixture(2, "Charlie", "Delta", 1, 1, event_date="2020-08-01T17:30:00+00:00"),
+    make_fixture(3, "Bravo", "Charlie", 0, 3, day=8),
+    make_fixture(4, "Delta", "Alpha", 2, 2, day=8),
+    make_fixture(5, "Alpha", "Charlie", 1, 0, day=15),
+    make_fixture(6, "Bravo", "Delta", None, None, status="NS", day=22),
+]
+
+
+def offline_league_table(fixtures=FIXTURES, **kwargs) -> LeagueTable:
+    apifootball = mock.Mock()
+    apifootball.get.side_effect = lambda endpoint, **_: {
+        "leagues": {"api": {"leagues": [
+            {"league_id": 1, "country": "Testland", "name": "Test League", "season": 2020}
+        ]}},
+        "league_fixtures": {"api": {"fixtures": fixtures}},
+    }[endpoint]
+    return LeagueTable(country="Testland", league="Test League", season=2020, apifootball=apifootball, **kwargs)
+
+
+class TestLeagueTableOffline:
+    def setup_method(self):
+        self.league_table = offline_league_table()
+
+    def test_final_table(self):
+        table = self.league_table.league_table()
+        assert table["TEAM"].tolist() == ["Alpha", "Charlie", "Delta", "Bravo"]
+        assert table["PTS"].tolist() == [7, 4, 2, 0]
+        assert table["PL"].tolist() == [3, 3, 2, 2]
+
+    def test_table_as_of(self):
+        table = self.league_table.league_table(as_of=date(2020, 8, 8))
+        assert table.set_index("TEAM")["PTS"].to_dict() == {"Charlie": 4, "Alpha": 4, "Delta": 2, "Bravo": 0}
+        assert table["POS"].tolist() == [1, 2, 3, 4]
+
+    def test_table_as_of_includes_whole_day(self):
+        table = self.league_table.league_table(as_of=datetime(2020, 8, 1, 9, 0))
+        assert table["PL"].sum() == 4
+
+    def test_table_before_earliest_match(self):
+        with pytest.raises(ValueError):
+            self.league_table.league_table(as_of=date(2020, 7, 31))
+
+    def test_tables_by_matchday(self):
+        tables = self.league_table.tables_by_matchday()
+        assert tables["DATE"].nunique() == 3
+        for day, table in tables.groupby("DATE"):
+            expected = self.league_table.league_table(as_of=pd.Timestamp(day).date())
+            assert table.drop(columns="DATE").reset_index(drop=True).equals(expected)
+
+    def test_custom_points(self):
+        table = offline_league_table(points=(2, 1, 0)).league_table()
+        assert table["PTS"].tolist() == [5, 3, 2, 0]
+
+
+class TestLeagueTableExtended:
+    def setup_method(self):
+        self.league_table = offline_league_table()
+
+    def test_matches_league_table(self):
+        table = self.league_table.extended_table()
+        expected = self.league_table.league_table()
+        for column in ["POS", "TEAM", "PTS", "GF", "GA", "GD", "PL"]:
+            assert table[column].tolist() == expected[column].tolist()
+
+    def test_results_and_splits(self):
+        alpha = self.league_table.extended_table().set_index("TEAM").loc["Alpha"]
+        assert (alpha["W"], alpha["D"], alpha["L"]) == (2, 1, 0)
+        assert (alpha["HOME_W"], alpha["HOME_GF"], alpha["HOME_PTS"]) == (2, 3, 6)
+        assert (alpha["AWAY_D"], alpha["AWAY_GF"], alpha["AWAY_PTS"]) == (1, 2, 1)
+
+    def test_form(self):
+        form = self.league_table.extended_table(form_length=2).set_index("TEAM")["FORM"].to_dict()
+        assert form == {"Alpha": "DW", "Charlie": "WL", "Delta": "DD", "Bravo": "LL"}
+
+    def test_as_of(self):
+        table = self.league_table.extended_table(as_of=date(2020, 8, 1))
+        assert table["TEAM"].tolist() == ["Alpha", "Charlie", "Delta", "Bravo"]
+        assert table["FORM"].tolist() == ["W", "D", "D", "L"]
+
+    def test_league_tiebreakers(self):
+        with mock.patch.dict(
+                "footballAPI.LeagueTable.LEAGUE_TIEBREAKERS", {("TESTLAND", "TEST LEAGUE"): ["H2H_PTS", "GD"]}
+        ):
+            assert offline_league_table().tiebreakers == ["H2H_PTS", "GD"]
+        assert offline_league_table().tiebreakers == ["GD", "GF"]
+
+    def test_head_to_head(self):
+        league_table = offline_league_table([
+            make_fixture(1, "Alpha", "Bravo", 1, 0, day=1),
+            make_fixture(2, "Bravo", "Charlie", 5, 0, day=1),
+            make_fixture(3, "Alpha", "Delta", 0, 1, day=8),
+        ])
+        assert league_table.extended_table()["TEAM"].tolist() == ["Bravo", "Delta", "Alpha", "Charlie"]
+        table = league_table.extended_table(tiebreakers=["H2H_PTS", "H2H_GD", "GD"])
+        assert table["TEAM"].tolist() == ["Delta", "Alpha", "Bravo", "Charlie"]
+
+    def test_invalid_tiebreaker(self):
+        with pytest.raises(ValueError):
+            self.league_table.extended_table(tiebreakers=["AWAY_GOALS"])
+
+
+class TestLeagueTableRefresh:
+    def setup_method(self):
+        self.league_table = offline_league_table()
+        self.rebuilt = offline_league_table(fixtures=FIXTURES[:5] + [
+            make_fixture(6, "Bravo", "Delta", 3, 1, day=22)
+        ])
+
+    def _refresh(self, fixtures, date="2020-08-22"):
+        self.league_table.apifootball.get_many.return_value = [BatchResult(
+            0, "league_fixtures_date", {"league_id": 1, "date": date}, {"api": {"fixtures": fixtures}}, None
+        )]
+        return self.league_table.refresh(as_of=datetime(2020, 8, 23))
+
+    def test_only_pending_dates_fetched(self):
+        self._refresh([FIXTURES[5]])
+        kwargs = self.league_table.apifootball.get_many.call_args.kwargs
+        assert kwargs["custom_ids_list"] == [{"league_id": 1, "date": "2020-08-22"}]
+
+    def test_stale_pending_dates_skipped(self):
+        league_table = offline_league_table(
+            fixtures=FIXTURES[:2] + [make_fixture(3, "Bravo", "Charlie", None, None, status="PST", day=8)] + FIXTURES[3:]
+        )
+        league_table.apifootball.get_many.return_value = []
+        league_table.refresh(as_of=datetime(2020, 8, 23))
+        kwargs = league_table.apifootball.get_many.call_args.kwargs
+        assert kwargs["custom_ids_list"] == [{"league_id": 1, "date": "2020-08-22"}]
+        league_table.fixture_store.sync(league_table.apifootball, 1, as_of=datetime(2020, 8, 23), pending_days=None)
+        kwargs = league_table.apifootball.get_many.call_args.kwargs
+        assert kwargs["custom_ids_list"] == [
+            {"league_id": 1, "date": "2020-08-08"}, {"league_id": 1, "date": "2020-08-22"}
+        ]
+
+    def test_pending_dates_resolved(self):
+        self.league_table.apifootball = local_apifootball()
+        data = {"api": {"fixtures": [FIXTURES[5]]}}
+        with mock.patch.object(self.league_table.apifootball, "_get_data", return_value=data) as get_data:
+            self.league_table.refresh(as_of=datetime(2020, 8, 23))
+        assert get_data.call_args.args[0] == "fixtures/league/1/2020-08-22"
+
+    def test_unchanged_fixture(self):
+        changes = self._refresh([FIXTURES[5]])
+        assert changes.current.empty
+
+    def test_appends_finished_fixture(self):
+        index_before = self.league_table._index_totals
+        changes = self._refresh([make_fixture(6, "Bravo", "Delta", 3, 1, day=22)])
+        assert changes.current["fixture_id"].tolist() == [6]
+        assert self.league_table._index_totals[:, :-1].tolist() == index_before.tolist()
+        assert self.league_table.league_table().equals(self.rebuilt.league_table())
+        assert self.league_table.tables_by_matchday().equals(self.rebuilt.tables_by_matchday())
+
+    def test_corrected_result_rebuilds(self):
+        self._refresh([make_fixture(1, "Alpha", "Bravo", 0, 1, day=1)], date="2020-08-01")
+        table = self.league_table.league_table().set_index("TEAM")
+        assert table.loc["Bravo", "PTS"] == 3
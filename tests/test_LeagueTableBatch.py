@@ -0,0 +1,74 @@
+from unittest import mock
+
+import pytest
+
+from footballAPI import APIFootball, LeagueTable, LeagueTableBatch
+
+from footballAPI.exceptions import InvalidStatusCode
+
+from helpers import make_fixture
+
+LEAGUES = {"api": {"leagues": [
+    {"league_id": 1, "country": "Testland", "name": "Test League", "season": 2019},
+    {"league_id": 2, "country": "Testland", "name": "Test League", "season": 2020},
+    {"league_id": 3, "country": "Otherland", "name": "Other League", "season": 2020},
+]}}
+
+
+FIXTURES = {
+    1: [make_fixture(1, "Alpha", "Bravo", 2, 0, day=1), make_fixture(2, "Bravo", "Alpha", 1, 1, day=2)],
+    2: [make_fixture(3, "Alpha", "Bravo", 0, 1, day=3), make_fixture(4, "Bravo", "Alpha", 3, 0, day=4)],
+    3: [make_fixture(5, "Xray", "Yankee", 1, 1, day=5)],
+}
+
+
+def _get(endpoint, custom_ids=None, **kwargs):
+    if endpoint == "leagues":
+        return LEAGUES
+    if custom_ids["league_id"] == 3:
+        raise InvalidStatusCode("500 is an invalid status_code!")
+    return {"api": {"fixtures": FIXTURES[custom_ids["league_id"]]}}
+
+
+class TestLeagueTableBatch:
+    def setup_method(self):
+        self.api = APIFootball(api_key="test", credit_tracking="local")
+        with mock.patch.object(self.api, "get", side_effect=_get) as get:
+            self.batch = LeagueTableBatch(
+                leagues=[
+                    ("Testland", "Test League", 2019),
+                    ("Testland", "Test League", 2020),
+                    ("Otherland", "Other League", 2020),
+                ],
+                apifootball=self.api
+            )
+            self.get_calls = get.call_args_list
+
+    def test_single_leagues_call(self):
+        assert [call.kwargs["endpoint"] for call in self.get_calls].count("leagues") == 1
+
+    def test_league_ids(self):
+        assert self.batch.league_ids[("TESTLAND", "TEST LEAGUE", 2020)] == 2
+
+    def test_failed_league_reported(self):
+        assert list(self.batch.errors) == [("OTHERLAND", "OTHER LEAGUE", 2020)]
+
+    def test_league_tables(self):
+        tables = self.batch.league_tables()
+        assert tables[["league_id", "season"]].drop_duplicates().values.tolist() == [[1, 2019], [2, 2020]]
+        season_2020 = tables[tables["season"] == 2020].set_index("TEAM")
+        assert season_2020.loc["Bravo", "PTS"] == 6
+        assert season_2020.loc["Bravo", "POS"] == 1
+        assert season_2020.loc["Alpha", "GD"] == -4
+
+    def test_matches_league_table(self):
+        with mock.patch.object(self.api, "get", side_effect=_get):
+            single = LeagueTable(country="Testland", league="Test League", season=2019, apifootball=self.api)
+        tables = self.batch.league_tables()
+        batch_table = tables[tables["league_id"] == 1].drop(columns=["league_id", "season"]).reset_index(drop=True)
+        assert batch_table.equals(single.league_table())
+
+    def test_unknown_league(self):
+        with mock.patch.object(self.api, "get", side_effect=_get):
+            with pytest.raises(ValueError):
+                LeagueTableBatch(leagues=[("Nowhere", "No League", 2020)], apifootball=self.api)
@@ -0,0 +1,102 @@
+import asyncio
+from unittest import mock
+
+from footballAPI import LeagueTable, LiveLeagueTable
+
+from helpers import local_apifootball, make_fixture
+
+
+class TestLiveLeagueTable:
+    def setup_method(self):
+        self.fixtures = [
+            make_fixture(1, "Alpha", "Bravo", 1, 0, day=1),
+            make_fixture(2, "Charlie", "Delta", 0, 0, day=1),
+            make_fixture(3, "Bravo", "Charlie", None, None, status="NS", day=8),
+        ]
+        self.live = []
+        self.apifootball = mock.Mock()
+        self.apifootball.get.side_effect = self._get
+        self.league_table = LeagueTable(
+            country="Testland", league="Test League", season=2020, apifootball=self.apifootball
+        )
+        self.updates = []
+        self.live_table = LiveLeagueTable(
+            self.league_table, poll_interval=0, callback=lambda table, changed: self.updates.append(changed)
+        )
+
+    def _get(self, endpoint, **kwargs):
+        return {
+            "leagues": {"api": {"leagues": [
+                {"league_id": 1, "country": "Testland", "name": "Test League", "season": 2020}
+            ]}},
+            "league_fixtures": {"api": {"fixtures": self.fixtures}},
+            "league_live_fixtures": {"api": {"fixtures": self.live}},
+        }[endpoint]
+
+    def test_provisional_result_applied(self):
+        self.live = [make_fixture(3, "Bravo", "Charlie", 2, 0, status="2H", day=8)]
+        table = self.live_table.poll().set_index("TEAM")
+        assert table.loc["Bravo", "PTS"] == 3
+        assert table.loc["Bravo", "PL"] == 2
+        assert table.loc["Charlie", "GA"] == 2
+        assert self.updates == [[3]]
+
+    def test_score_change_replaces_provisional_result(self):
+        self.live = [make_fixture(3, "Bravo", "Charlie", 1, 0, status="1H", day=8)]
+        self.live_table.poll()
+        self.live = [make_fixture(3, "Bravo", "Charlie", 1, 1, status="2H", day=8)]
+        table = self.live_table.poll().set_index("TEAM")
+        assert table.loc["Bravo", "PTS"] == 1
+        assert table.loc["Charlie", "PTS"] == 2
+        assert table.loc["Charlie", "PL"] == 2
+
+    def test_unchanged_poll(self):
+        self.live_table.poll()
+        assert self.live_table.poll() is None
+
+    def test_ended_fixture_folded_into_standings(self):
+        self.live = [make_fixture(3, "Bravo", "Charlie", 2, 0, status="2H", day=8)]
+        self.live_table.poll()
+        self.live = []
+        self.fixtures[2] = make_fixture(3, "Bravo", "Charlie", 2, 1, day=8)
+        with mock.patch.object(self.league_table.fixture_store, "sync",
+                               side_effect=lambda *args, **kwargs: self.league_table.fixture_store.add(self.fixtures)):
+            table = self.live_table.poll().set_index("TEAM")
+        assert table.loc["Bravo", "PTS"] == 3
+        assert table.loc["Charlie", "GF"] == 1
+        assert table.loc["Bravo", "PL"] == 2
+
+    def test_ended_fixture_kept_until_stored_finished(self):
+        self.live = [make_fixture(3, "Bravo", "Charlie", 2, 0, status="2H", day=8)]
+        self.live_table.poll()
+        self.live = []
+        self.fixtures[2] = make_fixture(3, "Bravo", "Charlie", 2, 0, status="2H", day=8)
+        with mock.patch.object(self.league_table.fixture_store, "sync",
+                               side_effect=lambda *args, **kwargs: self.league_table.fixture_store.add(self.fixtures)) \
+                as sync:
+            assert self.live_table.poll() is None
+            assert self.live_table.table().set_index("TEAM").loc["Bravo", "PTS"] == 3
+            self.fixtures[2] = make_fixture(3, "Bravo", "Charlie", 2, 0, day=8)
+            table = self.live_table.poll().set_index("TEAM")
+        assert sync.call_count == 2
+        assert table.loc["Bravo", "PTS"] == 3
+        assert table.loc["Bravo", "PL"] == 2
+        assert self.updates == [[3], [3]]
+
+    def test_live_fixtures_resolved(self):
+        self.league_table.apifootball = local_apifootball()
+        data = {"api": {"fixtures": [make_fixture(3, "Bravo", "Charlie", 2, 0, status="2H", day=8)]}}
+        with mock.patch.object(self.league_table.apifootball, "_get_data", return_value=data) as get_data:
+            table = self.live_table.poll().set_index("TEAM")
+        assert get_data.call_args.args[0] == "fixtures/live/1"
+        assert table.loc["Bravo", "PTS"] == 3
+
+    def test_async_updates(self):
+        self.live = [make_fixture(3, "Bravo", "Charlie", 0, 3, status="2H", day=8)]
+
+        async def collect():
+            return [table async for table in self.live_table.updates(max_polls=3)]
+
+        tables = asyncio.run(collect())
+        assert len(tables) == 1
+        assert tables[0].iloc[0]["TEAM"] == "Charlie"
@@ -0,0 +1,75 @@
+import pytest
+
+from footballAPI.exceptions import NoResponseModel
+from footballAPI.Models import Event, Fixture, League, Lineup, Match, Team, decode_response, model_for
+
+FIXTURE = {
+    "fixture_id": 1,
+    "league_id": 2,
+    "league": {"name": "Premier League", "country": "England", "logo": None, "flag": None},
+    "event_date": "2020-08-01T15:00:00+00:00",
+    "event_timestamp": 1596294000,
+    "statusShort": "FT",
+    "elapse": 90,
+    "homeTeam": {"team_id": 10, "team_name": "Alpha", "logo": ""},
+    "awayTeam": {"team_id": 20, "team_name": "Bravo", "logo": ""},
+    "goalsHomeTeam": 2,
+    "goalsAwayTeam": 0,
+    "score": {"halftime": "1-0", "fulltime": "2-0", "extratime": None, "penalty": None},
+}
+
+MATCH = {
+    **FIXTURE,
+    "events": [{"elapsed": 10, "team_id": 10, "teamName": "Alpha", "player": "A", "type": "Goal"}],
+    "lineups": {"Alpha": {"coach": "C", "formation": "4-4-2", "startXI": [{"player": "A", "number": 9}]}},
+    "statistics": {"Total Shots": {"home": "12", "away": "5"}},
+    "players": [{"event_id": 1, "player_name": "A", "team_id": 10, "shots": {"total": 3}}],
+}
+
+
+class TestModels:
+    def test_fixture_fields(self):
+        fixture = Fixture(FIXTURE)
+        assert fixture.fixture_id == 1
+        assert fixture.homeTeam.team_name == "Alpha"
+        assert fixture.league.country == "England"
+        assert fixture.score.fulltime == "2-0"
+        assert fixture.elapsed == 90
+        assert fixture.venue is None
+
+    def test_slots(self):
+        fixture = Fixture(FIXTURE)
+        assert not hasattr(fixture, "__dict__")
+        with pytest.raises(AttributeError):
+            fixture.not_a_field = 1
+
+    def test_match_details_decoded_lazily(self):
+        match = Match(MATCH)
+        assert match._events is not None and match._events_raw is MATCH["events"]
+        assert match.events == (Event(MATCH["events"][0]),)
+        assert match._events_raw is None
+        assert match.events is match.events
+        assert isinstance(match.lineups["Alpha"], Lineup)
+        assert match.lineups["Alpha"].startXI[0].number == 9
+        assert match.statistics == {"Total Shots": ("12", "5")}
+        assert match.players[0].shots == {"total": 3}
+
+    def test_match_without_details(self):
+        assert Match(FIXTURE).events is None
+
+    def test_model_for(self):
+        assert model_for("fixtures/league/2") is Fixture
+        assert model_for("fixtures/id/1") is Match
+        assert model_for("leagues/league/2") is League
+        assert model_for("teams/league/2") is Team
+
+    @pytest.mark.parametrize("endpoint", [
+        "odds/fixture/1", "fixtures/rounds/2", "teams/statistics/2/33", "players/seasons", "fixtures"
+    ])
+    def test_no_model(self, endpoint):
+        with pytest.raises(NoResponseModel):
+            model_for(endpoint)
+
+    def test_decode_response(self):
+        teams = decode_response("teams/team/10", {"api": {"results": 1, "teams": [{"team_id": 10, "name": "Alpha"}]}})
+        assert teams == [Team({"team_id": 10, "name": "Alpha"})]
@@ -0,0 +1,63 @@
+import threading
+import time
+
+import pytest
+
+from footballAPI import RateLimiter
+
+
+class TestRateLimiter:
+    def test_for_plan(self):
+        limiter = RateLimiter.for_plan("pro")
+        assert limiter.rate == 300
+        assert limiter.per == 60
+        with pytest.raises(ValueError):
+            RateLimiter.for_plan("platinum")
+
+    def test_shared_per_plan(self):
+        assert RateLimiter.shared("mega") is RateLimiter.shared("mega")
+        assert RateLimiter.shared("mega") is not RateLimiter.shared("ultra")
+
+    def test_rate(self):
+        limiter = RateLimiter(rate=50, per=1)
+        start = time.monotonic()
+        for _ in range(6):
+            assert limiter.acquire()
+        # The first token is available immediately, the remaining 5 at 50 per second
+        assert 0.09 <= time.monotonic() - start < 0.5
+
+    def test_burst(self):
+        limiter = RateLimiter(rate=1, per=60, burst=3)
+        assert all(limiter.acquire(timeout=0) for _ in range(3))
+        assert not limiter.acquire(timeout=0.01)
+
+    def test_invalid_priority(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate=1).acquire(priority="urgent")
+
+    def test_priority_order(self):
+        limiter = RateLimiter(rate=10, per=1)
+        limiter.acquire()
+        order = []
+
+        def acquire(priority):
+            limiter.acquire(priority)
+            order.append(priority)
+
+        threads = [threading.Thread(target=acquire, args=("backfill",)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while limiter.waiting < 3:
+            time.sleep(0.001)
+        live = threading.Thread(target=acquire, args=("live",))
+        live.start()
+        for thread in threads + [live]:
+            thread.join()
+        assert order[0] == "live"
+
+    def test_backoff_pauses_requests(self):
+        limiter = RateLimiter(rate=1000, per=1, burst=10)
+        limiter.backoff(0.1)
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.09
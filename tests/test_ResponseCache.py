@@ -0,0 +1,105 @@
+import sqlite3
+import time
+
+import pytest
+
+from footballAPI import MemoryCache, ResponseCache, SQLiteCache
+
+
+class TestMemoryCache:
+    def setup_method(self):
+        self.cache = MemoryCache(max_entries=2, ttls={"odds": 0.05})
+
+    def test_ttl_longest_prefix(self):
+        assert self.cache.ttl_for("fixtures/live") == 15
+        assert self.cache.ttl_for("fixtures/league/2") == 3600
+        assert self.cache.ttl_for("countries") is None
+        assert self.cache.ttl_for("unknown") == 3600
+
+    def test_finished_fixtures_never_expire(self):
+        finished = {"api": {"fixtures": [{"statusShort": "FT"}, {"statusShort": "PEN"}]}}
+        ongoing = {"api": {"fixtures": [{"statusShort": "FT"}, {"statusShort": "NS"}]}}
+        assert self.cache.ttl_for("fixtures/league/2", finished) is None
+        assert self.cache.ttl_for("fixtures/id/65", {"api": {"fixtures": [{"statusShort": "AET"}]}}) is None
+        assert self.cache.ttl_for("fixtures/league/2", ongoing) == 3600
+        assert self.cache.ttl_for("fixtures/league/2", {"api": {"fixtures": []}}) == 3600
+        assert self.cache.ttl_for("fixtures/team/33", finished) == 3600
+        assert MemoryCache(finished_ttl=60).ttl_for("fixtures/league/2", finished) == 60
+        assert MemoryCache(ttls={"fixtures": 0}).ttl_for("fixtures/league/2", finished) == 0
+        self.cache.set("fixtures/league/2", finished)
+        assert self.cache.lookup("fixtures/league/2").expires_at is None
+
+    def test_hit_and_miss_stats(self):
+        assert self.cache.get("countries") is None
+        self.cache.set("countries", {"api": {}})
+        assert self.cache.get("countries") == {"api": {}}
+        assert self.cache.stats == {"hits": 1, "misses": 1, "revalidations": 0, "hit_ratio": 0.5}
+
+    def test_status_not_cached(self):
+        self.cache.set("status", {"api": {}})
+        assert self.cache.get("status") is None
+
+    def test_expiry(self):
+        self.cache.set("odds/league/2", {"api": {}})
+        time.sleep(0.06)
+        assert self.cache.get("odds/league/2") is None
+
+    def test_expired_entry_with_validators_kept(self):
+        self.cache.set("odds/league/2", {"api": {}}, validators={"ETag": '"abc"'})
+        time.sleep(0.06)
+        assert self.cache.get("odds/league/2") is None
+        entry = self.cache.lookup("odds/league/2")
+        assert not entry.fresh
+        assert entry.validators == {"ETag": '"abc"'}
+
+    def test_revalidate_renews_entry(self):
+        self.cache.set("odds/league/2", {"api": {}}, validators={"ETag": '"abc"'})
+        time.sleep(0.06)
+        self.cache.revalidate("odds/league/2", self.cache.lookup("odds/league/2"), {"Last-Modified": "Sat"})
+        entry = self.cache.lookup("odds/league/2")
+        assert entry.fresh
+        assert entry.validators == {"ETag": '"abc"', "Last-Modified": "Sat"}
+        assert self.cache.stats["revalidations"] == 1
+
+    def test_lru_eviction(self):
+        self.cache.set("countries", {"a": 1})
+        self.cache.set("seasons", {"b": 2})
+        self.cache.get("countries")
+        self.cache.set("timezone", {"c": 3})
+        assert self.cache.get("seasons") is None
+        assert self.cache.get("countries") == {"a": 1}
+
+
+class TestSQLiteCache:
+    def test_persists_between_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = SQLiteCache(path=path)
+        cache.set("fixtures/league/2", {"api": {"results": 1}})
+        cache.close()
+        assert SQLiteCache(path=path).get("fixtures/league/2") == {"api": {"results": 1}}
+
+    def test_validators_persisted(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        SQLiteCache(path=path).set("leagues", {"api": {}}, validators={"ETag": '"abc"'})
+        assert SQLiteCache(path=path).lookup("leagues").validators == {"ETag": '"abc"'}
+
+    def test_migrates_existing_database(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE responses (endpoint TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL)")
+        connection.execute("INSERT INTO responses VALUES ('countries', '{\"api\": {}}', NULL)")
+        connection.commit()
+        connection.close()
+        entry = SQLiteCache(path=path).lookup("countries")
+        assert entry.data == {"api": {}}
+        assert entry.validators == {}
+
+
+class TestResponseCache:
+    def test_incomplete_backend_fails_when_built(self):
+        class LoadOnlyCache(ResponseCache):
+            def _load(self, endpoint):
+                return None
+
+        with pytest.raises(TypeError):
+            LoadOnlyCache()
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from footballAPI import FixtureStore
+from footballAPI.SeasonAnalytics import ANALYTICS_COLUMNS, SeasonAnalytics, simulate_season
+
+from helpers import make_fixture
+
+
+FIXTURES = [
+    make_fixture(
+        fixture_id, home, away, goals_home, goals_away, status, league_id=league_id,
+        league={"name": f"League {league_id}", "country": "Testland", "logo": "", "flag": ""}
+    )
+    for fixture_id, league_id, home, away, goals_home, goals_away, status in [
+        (1, 10, "Alpha", "Bravo", 2, 0, "FT"),
+        (2, 10, "Bravo", "Charlie", 1, 1, "FT"),
+        (3, 10, "Charlie", "Alpha", 0, 3, "FT"),
+        (4, 10, "Bravo", "Alpha", None, None, "NS"),
+        (5, 10, "Charlie", "Bravo", None, None, "CANC"),
+        (6, 20, "Xray", "Yankee", 1, 0, "FT"),
+        (7, 20, "Yankee", "Xray", 2, 2, "FT"),
+    ]
+]
+
+
+class TestSeasonAnalytics:
+    def setup_method(self):
+        self.store = FixtureStore.from_api(FIXTURES)
+
+    def test_standings(self):
+        analytics = SeasonAnalytics(self.store, max_workers=1, simulations=100, seed=1).run()
+        assert analytics.columns.tolist() == ANALYTICS_COLUMNS
+        league = analytics[analytics["league_id"] == 10].set_index("TEAM")
+        assert league.index.tolist() == ["Alpha", "Bravo", "Charlie"]
+        assert league["PTS"].tolist() == [6, 1, 1]
+        assert league["PPG"].tolist() == [3.0, 0.5, 0.5]
+        # The cancelled fixture is neither played nor remaining
+        assert league["REMAINING"].tolist() == [1, 1, 0]
+        assert league.loc["Alpha", "league.name"] == "League 10"
+
+    def test_finished_season(self):
+        analytics = SeasonAnalytics(self.store, league_ids=[20], max_workers=1, simulations=100, seed=1).run()
+        assert analytics["TEAM"].tolist() == ["Xray", "Yankee"]
+        assert analytics["XPTS"].tolist() == [4.0, 1.0]
+        assert analytics["XPOS"].tolist() == [1.0, 2.0]
+        assert analytics["P_TITLE"].tolist() == [1.0, 0.0]
+
+    def test_probabilities(self):
+        analytics = SeasonAnalytics(self.store, max_workers=1, simulations=500, seed=1).run()
+        assert analytics.groupby("league_id")["P_TITLE"].sum().round(6).tolist() == [1.0, 1.0]
+        assert analytics.set_index("TEAM").loc["Alpha", "P_TITLE"] == 1.0
+
+    def test_processes_match_in_process(self):
+        in_process = SeasonAnalytics(self.store, max_workers=1, simulations=200, seed=3).run()
+        processes = SeasonAnalytics(self.store, max_workers=2, simulations=200, seed=3).run()
+        assert processes.equals(in_process)
+
+    def test_no_fixtures(self):
+        with pytest.raises(ValueError):
+            SeasonAnalytics(self.store, league_ids=[30])
+
+
+class TestSimulateSeason:
+    def test_remaining_fixtures(self):
+        # Team 0 is 6 points clear with one fixture each left to play
+        home_idx = np.array([0, 1, 0, 2, 1])
+        away_idx = np.array([1, 2, 2, 1, 0])
+        home_goals = np.array([2, 1, 1, -1, -1])
+        away_goals = np.array([0, 1, 0, -1, -1])
+        finished = home_goals >= 0
+        results = simulate_season(
+            home_idx, away_idx, home_goals, away_goals, finished, 3, simulations=1000, top=1, bottom=1,
+            rng=np.random.default_rng(0)
+        )
+        xpts, xpos, p_title, p_top, p_bottom = results.T
+        assert p_title.tolist() == [1.0, 0.0, 0.0]
+        assert p_top.tolist() == p_title.tolist()
+        assert p_bottom.sum() == pytest.approx(1.0)
+        assert 6 <= xpts[0] <= 9
+        assert xpos[0] == 1.0
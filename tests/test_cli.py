@@ -0,0 +1,138 @@
+import glob
+import gzip
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from footballAPI import cli
+from footballAPI.exceptions import InvalidStatusCode
+
+from helpers import make_fixture
+
+
+FIXTURES = {
+    1: [make_fixture(fixture_id, "Alpha", "Bravo", 1, 0, league_id=1) for fixture_id in (10, 11, 12)] +
+       [make_fixture(13, "Alpha", "Bravo", None, None, "NS", league_id=1)],
+    2: [make_fixture(fixture_id, "Alpha", "Bravo", 1, 0, league_id=2) for fixture_id in (20, 21)],
+}
+
+
+def _apifootball(failing=()):
+    apifootball = mock.Mock()
+
+    def get_stream(endpoint, custom_ids, **kwargs):
+        assert endpoint == "league_fixtures"
+        yield from FIXTURES[custom_ids["league_id"]]
+
+    def get(endpoint, custom_ids, **kwargs):
+        assert endpoint == "match"
+        if custom_ids["fixture_id"] in failing:
+            raise InvalidStatusCode("500 is an invalid status_code!")
+        match = make_fixture(custom_ids["fixture_id"], "Alpha", "Bravo", 1, 0, league_id=custom_ids["fixture_id"] // 10,
+                             events=[], lineups={}, statistics={}, players=[])
+        return {"api": {"results": 1, "fixtures": [match]}}
+
+    apifootball.get_stream.side_effect = get_stream
+    apifootball.get.side_effect = get
+    return apifootball
+
+
+def _read_ndjson(directory):
+    paths = sorted(glob.glob(f"{directory}/*.ndjson.gz"))
+    return [json.loads(line) for path in paths for line in gzip.open(path, "rt")]
+
+
+class TestDownloader:
+    def test_download(self, tmp_path):
+        apifootball = _apifootball()
+        downloader = cli.Downloader(apifootball, [1, 2], str(tmp_path), concurrency=2, shard_size=2)
+        assert downloader.run() == cli.EXIT_COMPLETE
+
+        assert len(_read_ndjson(tmp_path / "fixtures")) == 6
+        matches = _read_ndjson(tmp_path / "matches")
+        assert sorted(match["fixture_id"] for match in matches) == [10, 11, 12, 20, 21]
+        assert len(glob.glob(f"{tmp_path}/matches/*")) == 3
+        assert not glob.glob(f"{tmp_path}/*/.*.tmp")
+
+        checkpoint = json.load(open(tmp_path / "checkpoint.json"))
+        assert checkpoint["listed"] == {"1": [10, 11, 12], "2": [20, 21]}
+        assert checkpoint["credits"]["used"] == 7
+
+    def test_resume_after_credit_budget(self, tmp_path):
+        apifootball = _apifootball()
+        first = cli.Downloader(apifootball, [1, 2], str(tmp_path), concurrency=1, max_credits=3)
+        assert first.run() == cli.EXIT_OUT_OF_CREDITS
+        assert first.checkpoint.credits_used == 3
+
+        second = cli.Downloader(apifootball, [1, 2], str(tmp_path), concurrency=1, max_credits=10)
+        assert second.run() == cli.EXIT_COMPLETE
+        matches = _read_ndjson(tmp_path / "matches")
+        assert sorted(match["fixture_id"] for match in matches) == [10, 11, 12, 20, 21]
+        # League 1 was listed by the first run so is not listed again
+        assert [call.kwargs["custom_ids"] for call in apifootball.get_stream.call_args_list] == \
+            [{"league_id": 1}, {"league_id": 2}]
+        assert second.checkpoint.credits_used == 7
+
+    def test_failed_matches_retried(self, tmp_path):
+        assert cli.Downloader(_apifootball(failing={11}), [1], str(tmp_path)).run() == cli.EXIT_FAILURES
+        assert cli.Downloader(_apifootball(), [1], str(tmp_path)).run() == cli.EXIT_COMPLETE
+        matches = _read_ndjson(tmp_path / "matches")
+        assert sorted(match["fixture_id"] for match in matches) == [10, 11, 12]
+
+    def test_failed_listing_leaves_no_shard(self, tmp_path):
+        apifootball = _apifootball()
+
+        def get_stream(endpoint, custom_ids, **kwargs):
+            yield from FIXTURES[1][:3]
+            raise InvalidStatusCode("500 is an invalid status_code!")
+
+        apifootball.get_stream.side_effect = get_stream
+        first = cli.Downloader(apifootball, [1], str(tmp_path), concurrency=1, shard_size=2)
+        assert first.run() == cli.EXIT_FAILURES
+        assert os.listdir(tmp_path / "fixtures") == []
+
+        second = cli.Downloader(_apifootball(), [1], str(tmp_path), concurrency=1, shard_size=2)
+        assert second.run() == cli.EXIT_COMPLETE
+        fixtures = _read_ndjson(tmp_path / "fixtures")
+        assert sorted(fixture["fixture_id"] for fixture in fixtures) == [10, 11, 12, 13]
+
+    def test_incomplete_shards_removed(self, tmp_path):
+        os.makedirs(tmp_path / "matches")
+        (tmp_path / "matches" / ".part-00000.ndjson.gz.tmp").write_bytes(b"partial")
+        cli.Downloader(_apifootball(), [2], str(tmp_path)).run()
+        assert os.listdir(tmp_path / "matches") == ["part-00000.ndjson.gz"]
+
+    def test_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        from footballAPI import FixtureStore
+
+        downloader = cli.Downloader(_apifootball(), [1, 2], str(tmp_path), output_format="parquet", shard_size=2)
+        assert downloader.run() == cli.EXIT_COMPLETE
+        assert len(FixtureStore.read_parquet(str(tmp_path / "fixtures")).fixtures) == 6
+        matches = pq.read_table(str(tmp_path / "matches")).to_pylist()
+        assert sorted(match["fixture_id"] for match in matches) == [10, 11, 12, 20, 21]
+        assert json.loads(matches[0]["lineups"]) == {}
+
+
+class TestMain:
+    def test_parse_league(self):
+        assert cli._parse_league("England:Premier League:2019") == ("England", "Premier League", 2019)
+
+    def test_requires_leagues(self):
+        with pytest.raises(SystemExit):
+            cli.main(["download"])
+
+    def test_download(self, tmp_path):
+        leagues = {"api": {"leagues": [{"league_id": 2, "country": "Testland", "name": "Test League", "season": 2020}]}}
+        apifootball = _apifootball()
+        apifootball.get.side_effect = lambda endpoint, **kwargs: leagues
+        with mock.patch.object(cli, "APIFootball") as api_class, \
+                mock.patch.object(cli.Downloader, "run", return_value=cli.EXIT_COMPLETE) as run:
+            api_class.return_value.__enter__.return_value = apifootball
+            code = cli.main(["download", "--leagues", "1", "2", "--league", "Testland:Test League:2020",
+                             "-o", str(tmp_path), "--plan", "pro"])
+        assert code == cli.EXIT_COMPLETE
+        assert api_class.call_args.kwargs["rate_limiter"] == "pro"
+        run.assert_called_once()
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import footballAPI
+
+
+def _modules_after(statement):
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.split()
+
+
+def test_import_defers_heavy_dependencies():
+    modules = _modules_after("import footballAPI")
+    for module in ["pandas", "numpy", "jsonschema", "pkg_resources", "prometheus_client"]:
+        assert module not in modules
+
+
+def test_lazy_classes():
+    modules = _modules_after("from footballAPI import LeagueTable")
+    assert "pandas" in modules
+    assert footballAPI.LeagueTable.__name__ == "LeagueTable"
+    assert "FixtureStore" in dir(footballAPI)
+
+
+def test_submodule_import_keeps_class_bound():
+    import footballAPI.LiveLeagueTable
+
+    assert isinstance(footballAPI.LiveLeagueTable, type)
+
+
+def test_unknown_attribute():
+    assert not hasattr(footballAPI, "NotAClass")
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from footballAPI.streaming import iter_json_items
+
+
+def _chunks(data: bytes, size: int):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+class TestIterJsonItems:
+    payload = {
+        "api": {
+            "results": 3,
+            "skipped": [{"brace": "}"}, 1.5],
+            "fixtures": [{"fixture_id": i, "venue": "Stade de l'Aube é"} for i in range(3)] + [1234567]
+        }
+    }
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 65536])
+    def test_items_across_chunk_boundaries(self, chunk_size):
+        data = json.dumps(self.payload, ensure_ascii=False).encode()
+        items = list(iter_json_items(_chunks(data, chunk_size), ("api", "fixtures")))
+        assert items == self.payload["api"]["fixtures"]
+
+    @pytest.mark.parametrize("chunks", [
+        [b'{"api": {"odds": [1.', b'5, 2]}}'],
+        [b'{"api": {"odds": [1', b'.5, 2]}}'],
+        [b'{"api": {"odds": [1e', b'5, 2]}}'],
+        [b'{"api": {"odds": [1E+', b'5, 2]}}'],
+        [b'{"api": {"odds": [-', b'1.5e-', b'2, 2]}}'],
+    ])
+    def test_numbers_split_across_chunks(self, chunks):
+        expected = json.loads(b"".join(chunks))["api"]["odds"]
+        assert list(iter_json_items(chunks, ("api", "odds"))) == expected
+
+    def test_empty_array(self):
+        assert list(iter_json_items([b'{"api": {"fixtures": []}}'], ("api", "fixtures"))) == []
+
+    def test_missing_key(self):
+        with pytest.raises(KeyError):
+            list(iter_json_items([b'{"api": {"results": 0}}'], ("api", "fixtures")))